@@ -0,0 +1,135 @@
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from tkinter import messagebox
+
+# Worker lane per file family. Each lane is a single thread, so calls that
+# touch the same file (and every write to it) run in submission order, while
+# reads of unrelated files proceed in parallel.
+LANES: Dict[str, str] = {
+    "load_config": "config",
+    "load_questions": "questions",
+    "load_quiz": "questions",
+    "save_question": "questions",
+    "save_questions": "questions",
+    "import_questions": "questions",
+    "delete_question": "questions",
+    "delete_questions": "questions",
+    "load_users": "users",
+    "save_user": "users",
+    "update_user": "users",
+    "load_result": "scores",
+    "save_score": "scores",
+    "compact_scores": "scores",
+    "get_leaderboard": "scores",
+    "get_overall_leaderboard": "scores",
+    "get_leaderboard_count": "scores",
+    "get_leaderboard_rank": "scores",
+    "get_analytics": "scores",
+    "get_user_scores": "scores",
+    "score_version": "scores",
+}
+
+
+class AsyncDataManager:
+    """Runs DataManager calls on background worker threads.
+
+    Every DataManager method listed in LANES is available here under the same
+    name and returns a Future instead of a value. Use then() to receive the
+    result on the Tk thread; completed futures are picked up by polling with
+    root.after(), as Tk widgets must only be touched from the main thread.
+    """
+
+    def __init__(self, data_manager, root, poll_interval: int = 50):
+        self.data_manager = data_manager
+        self.root = root
+        self.poll_interval = poll_interval
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._executors_lock = threading.Lock()
+        self._callbacks = []
+        self._polling = False
+
+    def lane(self, lane: str) -> str:
+        """The lane for run() calls that use the data store directly. Backends
+        with a single connection (e.g. SQLite) run every such call on "db"."""
+        return "db" if getattr(self.data_manager, "serial_io", False) else lane
+
+    def _lane(self, name: str) -> str:
+        return self.lane(LANES[name])
+
+    def submit(self, name: str, *args, **kwargs) -> Future:
+        method = getattr(self.data_manager, name)
+        return self.run(self._lane(name), method, *args, **kwargs)
+
+    def run(self, lane: str, fn: Callable, *args, **kwargs) -> Future:
+        """Run an arbitrary callable on the named worker lane. Callables that
+        touch the data store should pass their lane through lane()."""
+        with self._executors_lock:
+            if lane not in self._executors:
+                self._executors[lane] = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"io-{lane}"
+                )
+            executor = self._executors[lane]
+        return executor.submit(fn, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        if name not in LANES:
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.submit(name, *args, **kwargs)
+
+    def then(
+        self,
+        future: Future,
+        callback: Callable,
+        widget: Optional[object] = None,
+        on_error: Optional[Callable] = None,
+    ) -> Future:
+        """Call callback(result) on the Tk thread once future completes. If the
+        call raised, the error is shown and on_error(exception) is called
+        instead. Both are dropped if widget has been destroyed meanwhile."""
+        self._callbacks.append((future, callback, widget, on_error))
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval, self._poll)
+        return future
+
+    def _poll(self) -> None:
+        self._show_pending_errors()
+        callbacks, self._callbacks = self._callbacks, []
+        pending = []
+        for entry in callbacks:
+            future, callback, widget, on_error = entry
+            if not future.done():
+                pending.append(entry)
+                continue
+            if widget is not None and not widget.winfo_exists():
+                continue
+            error = future.exception()
+            if error is not None:
+                messagebox.showerror("Error", str(error))
+                if on_error is not None:
+                    on_error(error)
+                continue
+            callback(future.result())
+        # Callbacks may have chained further requests through then().
+        self._callbacks = pending + self._callbacks
+        if self._callbacks:
+            self.root.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
+
+    def _show_pending_errors(self) -> None:
+        while True:
+            try:
+                message = self.data_manager.pending_errors.get_nowait()
+            except queue.Empty:
+                return
+            messagebox.showerror("Error", message)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._executors_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
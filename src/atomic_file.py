@@ -0,0 +1,46 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+def sync_directory(directory: str) -> None:
+    """Make a rename in directory durable. Not possible on Windows, where
+    directories cannot be opened."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(path: str):
+    """Yield a binary file that replaces path once the block completes.
+
+    The file is a uniquely named sibling, fsynced and renamed over path, so
+    readers never see a half-written file, a crash leaves either the old or
+    the new contents, and concurrent writers cannot mix their bytes. If the
+    block raises, path is left alone and the sibling is removed.
+    """
+    directory = os.path.dirname(path) or os.curdir
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    sync_directory(directory)
@@ -0,0 +1,2 @@
+"""Benchmarks for the quiz app's hot paths. Run modules from src/, e.g.
+``python -m benchmarks.login``."""
@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from benchmarks.synthetic import PASSWORD, add_size_arguments, generate_tree
+from data_manager import DataManager
+from password_hasher import PasswordHasher
+from schemas import Question
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(fn: Callable, iterations: int) -> Dict:
+    """Latency summary of iterations calls of fn(i). The first call is also
+    reported on its own, as it includes loading and validating the files."""
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(i)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {
+        "iterations": iterations,
+        "first_ms": latencies[0],
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run(root: str, iterations: int, seed: int, **dm_options) -> Dict:
+    """Time the DataManager hot paths against the tree under root. Writes go
+    to that tree."""
+    os.chdir(root)
+    dm = DataManager(**dm_options)
+    config = dm.load_config()
+    users = list(dm.load_users().root)
+    rng = random.Random(seed)
+    hasher = PasswordHasher(config.bcryptRounds)
+
+    def login(i):
+        # What QuizApp.authenticate does for a successful login.
+        user = dm.load_users().root[rng.choice(users)]
+        if not hasher.check(PASSWORD, user.password):
+            raise RuntimeError(f"login failed for {user.username}")
+
+    def save_question(i):
+        topic = rng.choice(config.topics)
+        question = Question(
+            question=f"Benchmark question {i}?",
+            options={"1": "a", "2": "b", "3": "c", "4": "d"},
+            answer="1",
+        )
+        if not dm.save_question(topic, question):
+            raise RuntimeError(f"save_question failed for {topic}")
+
+    operations = {
+        "load_questions": lambda i: dm.load_questions(rng.choice(config.topics)),
+        "save_question": save_question,
+        "get_leaderboard": lambda i: dm.get_leaderboard(rng.choice(config.topics)),
+        "get_analytics": lambda i: dm.get_analytics(),
+        "get_user_scores": lambda i: dm.get_user_scores(rng.choice(users)),
+        "save_score": lambda i: dm.save_score(
+            rng.choice(users), rng.choice(config.topics), 5, 10
+        ),
+        "login": login,
+    }
+    return {name: measure(fn, iterations) for name, fn in operations.items()}
+
+
+def print_results(results: Dict, baseline: Optional[Dict]) -> None:
+    print(
+        f"{'operation':<16} {'first ms':>9} {'p50 ms':>9} {'p95 ms':>9}"
+        f" {'p99 ms':>9} {'peak RSS MB':>12}"
+        + (f" {'p50 vs base':>12}" if baseline else "")
+    )
+    for name, row in results["operations"].items():
+        line = (
+            f"{name:<16} {row['first_ms']:>9.2f} {row['p50_ms']:>9.2f}"
+            f" {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}"
+            f" {row['peak_rss_mb'] or 0:>12.1f}"
+        )
+        base = baseline["operations"].get(name) if baseline else None
+        if base and base["p50_ms"]:
+            change = (row["p50_ms"] - base["p50_ms"]) / base["p50_ms"] * 100
+            line += f" {change:>+11.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time DataManager hot paths on a synthetic data tree and "
+        "optionally save the results as JSON for comparison across commits."
+    )
+    add_size_arguments(parser)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--data-dir",
+        help="existing tree to use (it is written to) instead of a new one",
+    )
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="results JSON of an earlier run")
+    parser.add_argument("--journal-scores", action="store_true")
+    parser.add_argument("--compact-json", action="store_true")
+    parser.add_argument("--trusted-reads", action="store_true")
+    args = parser.parse_args()
+
+    dm_options = {
+        "journal_scores": args.journal_scores,
+        "compact_json": args.compact_json,
+        "trusted_reads": args.trusted_reads,
+    }
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.data_dir or tmp
+        sizes = None
+        if not args.data_dir:
+            start = time.perf_counter()
+            sizes = generate_tree(
+                root,
+                users=args.users,
+                topics=args.topics,
+                questions=args.questions,
+                attempts=args.attempts,
+                bcrypt_rounds=args.bcrypt_rounds,
+                questions_per_topic=args.questions + args.iterations,
+                seed=args.seed,
+            )
+            print(f"generated data in {time.perf_counter() - start:.1f}s")
+        try:
+            operations = run(root, args.iterations, args.seed, **dm_options)
+        finally:
+            os.chdir(cwd)
+
+    results = {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes or {"data_dir": args.data_dir},
+        "options": dm_options,
+        "operations": operations,
+    }
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
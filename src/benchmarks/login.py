@@ -0,0 +1,50 @@
+import argparse
+import statistics
+import time
+from password_hasher import PasswordHasher, calibrate_rounds
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench_cost(rounds: int, logins: int) -> dict:
+    hasher = PasswordHasher(rounds)
+    stored = hasher.hash("correct horse")
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(logins):
+        t0 = time.perf_counter()
+        hasher.check("correct horse", stored)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return {
+        "rounds": rounds,
+        "logins_per_second": logins / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Login throughput and latency for several bcrypt costs."
+    )
+    parser.add_argument("--costs", type=int, nargs="+", default=[8, 10, 11, 12])
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--target", type=float, default=0.25)
+    args = parser.parse_args()
+
+    print(f"{'cost':>4} {'logins/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for rounds in args.costs:
+        row = bench_cost(rounds, args.logins)
+        print(
+            f"{row['rounds']:>4} {row['logins_per_second']:>10.1f}"
+            f" {row['p50_ms']:>9.1f} {row['p99_ms']:>9.1f}"
+        )
+    print(f"calibrated cost for {args.target:.2f}s: {calibrate_rounds(args.target)}")
+
+
+if __name__ == "__main__":
+    main()
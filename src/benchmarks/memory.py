@@ -0,0 +1,90 @@
+import argparse
+import gc
+import glob
+import os
+import tempfile
+import time
+import tracemalloc
+from benchmarks.synthetic import generate_tree
+from data_manager import type_adapter
+from records import QuestionTable, ScoreTable
+from schemas import Quiz, Result
+
+
+def retained(load, runs: int):
+    """Bytes still allocated after load() returns, and its best time."""
+    gc.collect()
+    tracemalloc.start()
+    model = load()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del model
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        model = load()
+        best = min(best, time.perf_counter() - start)
+        del model
+    return size, best
+
+
+def compare(label: str, count: int, raws, before, after, runs: int) -> None:
+    print(f"\n{label}: {count} records")
+    for name, model_cls in (before, after):
+        adapter = type_adapter(model_cls)
+        size, seconds = retained(
+            lambda: [adapter.validate_json(raw) for raw in raws], runs
+        )
+        print(
+            f"  {name:<38} {size / max(1, count):8.0f} bytes each"
+            f" {size / 1e6:9.1f} MB  load {seconds * 1000:9.1f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Memory per score and per question held as schemas models "
+        "(before) and as records (after), for a synthetic data tree."
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=500, help="per topic")
+    parser.add_argument("--attempts", type=int, default=500_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        generate_tree(
+            root,
+            users=args.users,
+            topics=args.topics,
+            questions=args.questions,
+            attempts=args.attempts,
+        )
+        with open(os.path.join(root, "result", "scores.json"), "rb") as file:
+            scores = [file.read()]
+        topics = []
+        for path in sorted(glob.glob(os.path.join(root, "data", "*.json"))):
+            with open(path, "rb") as file:
+                topics.append(file.read())
+
+    compare(
+        "scores",
+        args.attempts,
+        scores,
+        ("before: Result of Score models", Result),
+        ("after: ScoreTable of ScoreRecords", ScoreTable),
+        args.runs,
+    )
+    compare(
+        "questions",
+        args.topics * args.questions,
+        topics,
+        ("before: Quiz of Question models", Quiz),
+        ("after: QuestionTable of QuestionRecords", QuestionTable),
+        args.runs,
+    )
+
+
+if __name__ == "__main__":
+    main()
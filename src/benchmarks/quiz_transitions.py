@@ -0,0 +1,86 @@
+import argparse
+import statistics
+import sys
+import time
+import tkinter as tk
+from concurrent.futures import Future
+from types import SimpleNamespace
+from frames.quiz_frame import QuizFrame
+from schemas import Question
+
+
+def completed(*args) -> Future:
+    future = Future()
+    future.set_result([])
+    return future
+
+
+class StubApp:
+    """Just enough of QuizApp for QuizFrame to run without data files."""
+
+    def __init__(self, root):
+        self.root = root
+        self.current_user = SimpleNamespace(username="bench")
+        self.data_manager = SimpleNamespace(
+            load_config=lambda: SimpleNamespace(topics=["bench"], questionsPerQuiz=None)
+        )
+        self.io = SimpleNamespace(
+            save_score=lambda *args: None, then=lambda *args, **kwargs: None
+        )
+        self.prefetcher = SimpleNamespace(questions=completed, take_questions=completed)
+
+    def show_user_frame(self):
+        pass
+
+
+def make_questions(count: int, max_options: int):
+    return [
+        Question(
+            question=f"Synthetic question {i} " + "lorem ipsum " * (i % 7),
+            options={
+                str(k): f"Option {k} for {i}" for k in range(1, 2 + (i % max_options))
+            },
+            answer="1",
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Per-question transition latency of QuizFrame."
+    )
+    parser.add_argument("--questions", type=int, default=500)
+    parser.add_argument("--max-options", type=int, default=6)
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"A display is required (e.g. run under xvfb-run): {e}")
+    root.withdraw()
+    frame = QuizFrame(root, StubApp(root), None)
+    frame.topic_var.set("Bench")
+    frame.questions = make_questions(args.questions, args.max_options)
+    frame.show_question()
+    root.update()
+
+    latencies = []
+    for _ in range(args.questions):
+        frame.selected_answer.set("1")
+        start = time.perf_counter()
+        frame.submit_answer()
+        root.update()
+        latencies.append(time.perf_counter() - start)
+    root.destroy()
+
+    latencies.sort()
+    print(f"questions: {args.questions}")
+    print(f"p50: {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"p95: {latencies[int(0.95 * (len(latencies) - 1))] * 1000:.2f} ms")
+    print(f"max: {latencies[-1] * 1000:.2f} ms")
+    print(f"option widgets pooled: {len(frame.option_buttons)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+from data_manager import DataManager
+from schemas import Quiz, Result
+
+
+def make_quiz(questions: int) -> dict:
+    return {
+        f"q{i}": {
+            "question": f"Synthetic question {i}?",
+            "options": {str(k): f"Option {k} for {i}" for k in range(1, 5)},
+            "answer": str(1 + i % 4),
+        }
+        for i in range(questions)
+    }
+
+
+def make_result(scores: int, users: int = 1000, topics: int = 20) -> dict:
+    per_list = max(1, scores // (users * topics))
+    return {
+        f"user{u}": {
+            f"topic_{t}": [
+                {
+                    "timestamp": "2024-01-01T12:00:00.000000",
+                    "score": s % 11,
+                    "total": 10,
+                }
+                for s in range(per_list)
+            ]
+            for t in range(topics)
+        }
+        for u in range(users)
+    }
+
+
+def timed(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_file(label: str, path: str, model_cls, data: dict, runs: int) -> None:
+    with open(path, "w") as file:
+        json.dump(data, file, indent=4)
+    model = model_cls.model_validate(data)
+    size_mb = os.path.getsize(path) / 1e6
+
+    def legacy_load():
+        with open(path) as file:
+            model_cls.model_validate(json.load(file))
+
+    def legacy_save():
+        with open(path, "w") as file:
+            json.dump(model.model_dump(), file, indent=4)
+
+    indented = DataManager(cache_size=0)
+    compact = DataManager(cache_size=0, compact_json=True)
+    trusted = DataManager(cache_size=0, trusted_reads=True)
+    rows = [
+        ("load: json.load + model_validate", timed(legacy_load, runs)),
+        (
+            "load: validate_json on bytes",
+            timed(lambda: indented._load_model(path, model_cls), runs),
+        ),
+        ("save: model_dump + json.dump(indent=4)", timed(legacy_save, runs)),
+        (
+            "save: dump_json, indent=4",
+            timed(lambda: indented.save_json_file(path, model=model), runs),
+        ),
+        (
+            "save: dump_json, compact",
+            timed(lambda: compact.save_json_file(path, model=model), runs),
+        ),
+    ]
+    compact_mb = os.path.getsize(path) / 1e6
+    trusted.save_json_file(path, model=model)
+    rows.append(
+        (
+            "load: trusted, after our own write",
+            timed(lambda: trusted._load_model(path, model_cls), runs),
+        )
+    )
+    print(f"\n{label} ({size_mb:.1f} MB indented, {compact_mb:.1f} MB compact)")
+    for name, seconds in rows:
+        print(f"  {name:<42} {seconds * 1000:10.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load and save times of the JSON fast path for a large topic "
+        "file and a large scores file."
+    )
+    parser.add_argument("--questions", type=int, default=10_000)
+    parser.add_argument("--scores", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        bench_file(
+            f"topic file, {args.questions} questions",
+            os.path.join(root, "topic.json"),
+            Quiz,
+            make_quiz(args.questions),
+            args.runs,
+        )
+        bench_file(
+            f"scores file, {args.scores} scores",
+            os.path.join(root, "scores.json"),
+            Result,
+            make_result(args.scores),
+            args.runs,
+        )
+
+
+if __name__ == "__main__":
+    main()
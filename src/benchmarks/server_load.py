@@ -0,0 +1,184 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from benchmarks.synthetic import PASSWORD, generate_tree
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def count_scores(root: str) -> int:
+    """Attempts in scores.json plus those still in the journal."""
+    with open(os.path.join(root, "result", "scores.json")) as file:
+        saved = sum(
+            len(attempts)
+            for topics in json.load(file).values()
+            for attempts in topics.values()
+        )
+    journal = os.path.join(root, "result", "scores.journal")
+    if os.path.exists(journal):
+        with open(journal) as file:
+            saved += sum(1 for line in file if line.strip())
+    return saved
+
+
+class Client:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, host: str, port: int, latencies):
+        self.host = host
+        self.port = port
+        self.latencies = latencies
+        self.token = None
+        self.reader = None
+        self.writer = None
+
+    async def request(self, label: str, method: str, path: str, body=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        payload = json.dumps(body).encode() if body is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+        if self.token:
+            head += f"Authorization: Bearer {self.token}\r\n"
+        head += f"Content-Length: {len(payload)}\r\n\r\n"
+        start = time.perf_counter()
+        self.writer.write(head.encode() + payload)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        data = json.loads(await self.reader.readexactly(length))
+        self.latencies[label].append(time.perf_counter() - start)
+        if status != 200:
+            raise RuntimeError(f"{method} {path}: {status} {data.get('error')}")
+        return data
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def run_session(host, port, username, latencies, rng):
+    client = Client(host, port, latencies)
+    try:
+        login = await client.request(
+            "login",
+            "POST",
+            "/login",
+            {"username": username, "password": PASSWORD},
+        )
+        client.token = login["token"]
+        topics = (await client.request("topics", "GET", "/topics"))["topics"]
+        topic = rng.choice(topics)
+        question = await client.request(
+            "start", "POST", "/quiz/start", {"topic": topic}
+        )
+        while True:
+            reply = await client.request(
+                "answer",
+                "POST",
+                "/quiz/answer",
+                {"answer": rng.choice(list(question["options"]))},
+            )
+            if reply.get("finished"):
+                break
+            question = reply["next"]
+        await client.request(
+            "leaderboard", "GET", f"/leaderboard?topic={topic}&limit=10"
+        )
+    finally:
+        client.close()
+
+
+async def drive(host, port, sessions, users, seed):
+    latencies = defaultdict(list)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            run_session(host, port, f"user{i % users}", latencies, rng)
+            for i in range(sessions)
+        ),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    errors = [r for r in results if isinstance(r, Exception)]
+    return latencies, elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Drive many concurrent quiz sessions against quiz_server.py "
+        "running on a synthetic data tree."
+    )
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--topics", type=int, default=5)
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as root:
+        generate_tree(
+            root,
+            users=args.users,
+            topics=args.topics,
+            questions=args.questions,
+            attempts=0,
+            questions_per_topic=args.questions,
+        )
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(src_dir, "quiz_server.py"), "--port", "0"],
+            cwd=root,
+            env={**os.environ, "PYTHONPATH": src_dir},
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            # "Serving on http://127.0.0.1:<port>"
+            port = int(server.stdout.readline().rsplit(":", 1)[1])
+            latencies, elapsed, errors = asyncio.run(
+                drive("127.0.0.1", port, args.sessions, args.users, args.seed)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+        saved = count_scores(root)
+
+    requests = sum(len(samples) for samples in latencies.values())
+    print(f"sessions: {args.sessions} ({len(errors)} failed)")
+    if errors:
+        print(f"first error: {errors[0]!r}")
+    print(f"requests: {requests} in {elapsed:.2f}s ({requests / elapsed:.0f} req/s)")
+    print(f"scores saved: {saved}")
+    print(f"{'endpoint':<12} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for label, samples in latencies.items():
+        print(
+            f"{label:<12} {len(samples):>7}"
+            f" {statistics.median(samples) * 1000:>9.1f}"
+            f" {percentile(samples, 0.95) * 1000:>9.1f}"
+            f" {percentile(samples, 0.99) * 1000:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Runs in a fresh interpreter so module caches do not hide import costs.
+# Without a display only the imports are timed.
+CHILD = r"""
+import json, sys, time
+start = time.perf_counter()
+marks = {}
+import tkinter as tk
+import quiz_app
+from schemas import UserCredentials
+try:
+    root = tk.Tk()
+    root.withdraw()
+except tk.TclError:
+    root = None
+if root is not None:
+    app = quiz_app.QuizApp(root, prewarm_delay=None)
+    root.update_idletasks()
+else:
+    app = None
+    quiz_app.load_frame_class("auth")
+marks["first_frame"] = time.perf_counter() - start
+if app is not None:
+    app.current_user = UserCredentials(username="bench", password="x", role="USER")
+    app.show_user_frame()
+    root.update_idletasks()
+else:
+    quiz_app.load_frame_class("user")
+marks["user_dashboard"] = time.perf_counter() - start
+try:
+    quiz_app.load_frame_class("user_analytics")
+    marks["user_analytics"] = time.perf_counter() - start
+except ImportError:
+    marks["user_analytics"] = None
+marks["display"] = root is not None
+print(json.dumps(marks))
+"""
+
+
+def parse_importtime(stderr: str):
+    """Return (cumulative_us, module) pairs from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:") :].split("|")
+        if not parts[1].strip().isdigit():
+            continue
+        rows.append((int(parts[1]), parts[2][1:].rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time to first frame and to the user dashboard, with the "
+        "slowest imports from -X importtime."
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = []
+    imports = []
+    for _ in range(args.runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", CHILD],
+            cwd=src_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        imports = parse_importtime(proc.stderr)
+
+    print(f"display available: {runs[0]['display']}")
+    for key, label in (
+        ("first_frame", "time to first frame"),
+        ("user_dashboard", "time to user dashboard"),
+        ("user_analytics", "time to user analytics"),
+    ):
+        samples = [run[key] for run in runs if run[key] is not None]
+        value = f"{min(samples) * 1000:8.1f} ms" if samples else "     n/a"
+        print(f"{label + ':':<24}{value}")
+    print("\nslowest imports up to one level deep (cumulative, last run):")
+    # -X importtime indents nested imports by two spaces per level.
+    shallow = [
+        (cumulative, module.strip())
+        for cumulative, module in imports
+        if len(module) - len(module.lstrip()) <= 2
+    ]
+    for cumulative, module in sorted(shallow, reverse=True)[: args.top]:
+        print(f"{cumulative / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import argparse
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Optional
+import bcrypt
+
+PASSWORD = "secret"
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(data, file)
+
+
+def generate_tree(
+    root: str,
+    users: int = 1000,
+    topics: int = 20,
+    questions: int = 50,
+    attempts: int = 100_000,
+    bcrypt_rounds: int = 4,
+    questions_per_topic: Optional[int] = None,
+    seed: int = 0,
+) -> dict:
+    """Write config/, data/, users/ and result/ for a synthetic installation
+    under root. Every user's password is PASSWORD, hashed once with
+    bcrypt_rounds. scores.json is streamed out user by user, so millions of
+    attempts never have to be held in memory. Returns the sizes used."""
+    rng = random.Random(seed)
+    topic_names = [f"topic_{t}" for t in range(topics)]
+    write_json(
+        os.path.join(root, "config", "config.json"),
+        {
+            "topics": topic_names,
+            "questionsPerTopic": questions_per_topic or questions * 2,
+            "bcryptRounds": bcrypt_rounds,
+        },
+    )
+    for topic in topic_names:
+        write_json(
+            os.path.join(root, "data", f"{topic}.json"),
+            {
+                f"{topic}-{q}": {
+                    "question": f"Question {q} of {topic}?",
+                    "options": {str(k): f"Option {k}" for k in range(1, 5)},
+                    "answer": str(rng.randint(1, 4)),
+                }
+                for q in range(questions)
+            },
+        )
+    hashed = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(bcrypt_rounds)).decode()
+    usernames = [f"user{u}" for u in range(users)]
+    write_json(
+        os.path.join(root, "users", "users.json"),
+        {
+            name: {"username": name, "password": hashed, "role": "USER"}
+            for name in usernames
+        },
+    )
+
+    scores_path = os.path.join(root, "result", "scores.json")
+    os.makedirs(os.path.dirname(scores_path), exist_ok=True)
+    start = datetime(2024, 1, 1)
+    per_user, extra = divmod(attempts, users) if users else (0, 0)
+    separator = ""
+    with open(scores_path, "w") as file:
+        file.write("{")
+        for u, name in enumerate(usernames):
+            count = per_user + (1 if u < extra else 0)
+            by_topic = {}
+            for i in range(count):
+                total = questions
+                by_topic.setdefault(rng.choice(topic_names), []).append(
+                    {
+                        "timestamp": (start + timedelta(minutes=i)).isoformat(),
+                        "score": rng.randint(0, total),
+                        "total": total,
+                    }
+                )
+            if not by_topic:
+                continue
+            file.write(separator)
+            separator = ","
+            file.write(json.dumps(name))
+            file.write(":")
+            file.write(json.dumps(by_topic))
+        file.write("}")
+    return {
+        "users": users,
+        "topics": topics,
+        "questions": questions,
+        "attempts": attempts,
+        "bcrypt_rounds": bcrypt_rounds,
+        "seed": seed,
+    }
+
+
+def add_size_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=50, help="per topic")
+    parser.add_argument("--attempts", type=int, default=100_000)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic data tree (e.g. --users 10000 --topics "
+        "100 --attempts 5000000)."
+    )
+    parser.add_argument("root")
+    add_size_arguments(parser)
+    args = parser.parse_args()
+    sizes = generate_tree(
+        args.root,
+        users=args.users,
+        topics=args.topics,
+        questions=args.questions,
+        attempts=args.attempts,
+        bcrypt_rounds=args.bcrypt_rounds,
+        seed=args.seed,
+    )
+    print(json.dumps(sizes))
+
+
+if __name__ == "__main__":
+    main()
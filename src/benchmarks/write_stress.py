@@ -0,0 +1,129 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from benchmarks.synthetic import generate_tree
+from data_manager import DataManager
+from metrics import Metrics
+from schemas import UserCredentials
+
+
+def report_error(message):
+    print(message, file=sys.stderr)
+
+
+def writer(root: str, index: int, saves: int, options: dict) -> dict:
+    """One process of the stress test: saves scores for its own user and
+    registers a new user every tenth save. Returns its lock wait totals."""
+    os.chdir(root)
+    metrics = Metrics()
+    dm = DataManager(metrics=metrics, **options)
+    dm.show_error = report_error
+    username = f"stress{index}"
+    for i in range(saves):
+        dm.save_score(username, "topic_0", i, saves)
+        if i % 10 == 0:
+            dm.save_user(
+                UserCredentials(username=f"{username}_{i}", password="x", role="USER")
+            )
+    dm.score_journal.close()
+    waits = [row for row in metrics.snapshot()["phases"] if row["phase"] == "lock"]
+    return {
+        "lock_waits": sum(row["count"] for row in waits),
+        "lock_wait_seconds": sum(row["total"] for row in waits),
+    }
+
+
+def check(root: str, processes: int, saves: int) -> dict:
+    """Count what a fresh DataManager sees of the writers' scores and users."""
+    os.chdir(root)
+    dm = DataManager(journal_scores=True)
+    dm.show_error = report_error
+    result = dm.load_result()
+    users = dm.load_users()
+    scores = sum(
+        len(result.root[f"stress{p}"].root.get("topic_0", []))
+        for p in range(processes)
+        if f"stress{p}" in result.root
+    )
+    registered = sum(
+        1
+        for p in range(processes)
+        for i in range(0, saves, 10)
+        if f"stress{p}_{i}" in users.root
+    )
+    return {
+        "scores": scores,
+        "expected_scores": processes * saves,
+        "users": registered,
+        "expected_users": processes * len(range(0, saves, 10)),
+    }
+
+
+def run(root: str, processes: int, saves: int, options: dict) -> dict:
+    start = time.perf_counter()
+    with multiprocessing.Pool(processes) as pool:
+        stats = pool.starmap(
+            writer, [(root, p, saves, options) for p in range(processes)]
+        )
+    elapsed = time.perf_counter() - start
+    cwd = os.getcwd()
+    try:
+        counts = check(root, processes, saves)
+    finally:
+        os.chdir(cwd)
+    counts["seconds"] = elapsed
+    counts["lock_waits"] = sum(s["lock_waits"] for s in stats)
+    counts["lock_wait_seconds"] = sum(s["lock_wait_seconds"] for s in stats)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run many processes saving scores and users against one "
+        "data tree and check that none of the writes were lost."
+    )
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--saves", type=int, default=100, help="per process")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--attempts", type=int, default=10_000)
+    parser.add_argument(
+        "--no-lock",
+        action="store_true",
+        help="disable file locking to show the lost updates it prevents",
+    )
+    args = parser.parse_args()
+
+    lost = False
+    for journal in (False, True):
+        options = {
+            "journal_scores": journal,
+            # Small enough that the processes also compact concurrently.
+            "journal_compact_threshold": 50,
+            "lock_files": not args.no_lock,
+        }
+        with tempfile.TemporaryDirectory() as root:
+            generate_tree(root, users=args.users, attempts=args.attempts)
+            counts = run(root, args.processes, args.saves, options)
+        mode = "journal" if journal else "snapshot"
+        print(
+            f"{mode:<9} {counts['seconds']:>6.2f}s"
+            f" scores {counts['scores']}/{counts['expected_scores']}"
+            f" users {counts['users']}/{counts['expected_users']}"
+            f" lock wait {counts['lock_wait_seconds']:.2f}s"
+            f" over {counts['lock_waits']} locks"
+        )
+        if (
+            counts["scores"] != counts["expected_scores"]
+            or counts["users"] != counts["expected_users"]
+        ):
+            lost = True
+    if lost:
+        print("writes were lost", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from data_manager import DataManager
+from leaderboard_index import LeaderboardIndex
+from records import ScoreRecord
+from schemas import Result, User, Score
+from score_analytics import ScoreArrays
+from score_store import ScoreStore, to_epoch, to_iso
+
+
+class ColumnarDataManager(DataManager):
+    """DataManager whose scores live in a columnar ScoreStore under
+    result/columns/ instead of scores.json.
+
+    Leaderboards, a user's scores and analytics are computed directly on the
+    memory-mapped columns; no Result model is built. Timestamps are kept to
+    the second. Users, questions and config stay in the JSON tree.
+    """
+
+    def __init__(
+        self,
+        columns_dir: Optional[str] = None,
+        buffer_rows: int = 1024,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        # The store has its own buffered writer; there is no journal.
+        self.journal_scores = False
+        self.columns_dir = columns_dir or os.path.join(
+            os.path.curdir, "result", "columns"
+        )
+        lock_path = os.path.join(self.columns_dir, "scores")
+        self.score_store = ScoreStore(
+            self.columns_dir,
+            buffer_rows=buffer_rows,
+            fsync_batch=self.score_journal.fsync_batch,
+            lock=lambda: self._locked(lock_path),
+        )
+        # Rows of the store already folded into the leaderboard index.
+        self._indexed_rows = 0
+
+    def close(self) -> None:
+        self.score_store.close()
+
+    def save_score(self, username: str, topic: str, score: int, total: int) -> bool:
+        try:
+            self.score_store.append(
+                username, topic, to_epoch(datetime.now()), score, total
+            )
+            # Written through at once, so other processes and readers of the
+            # files see it; fsyncs are still batched.
+            self.score_store.flush()
+            return True
+        except Exception as e:
+            self.show_error(f"Error saving score: {str(e)}")
+            return False
+
+    def compact_scores(self) -> bool:
+        self.score_store.sync()
+        return True
+
+    def score_arrays(self) -> ScoreArrays:
+        return self.score_store.columns()
+
+    def _leaderboard_index(self) -> LeaderboardIndex:
+        arrays = self.score_store.columns()
+        count = len(arrays)
+        if self._leaderboard is None or count < self._indexed_rows:
+            self._leaderboard = LeaderboardIndex.from_users(best_attempts(arrays))
+        elif count > self._indexed_rows:
+            new = slice(self._indexed_rows, count)
+            for user_id, topic_id, score, total in zip(
+                arrays.user_id[new].tolist(),
+                arrays.topic_id[new].tolist(),
+                arrays.score[new].tolist(),
+                arrays.total[new].tolist(),
+            ):
+                self._leaderboard.record(
+                    arrays.users[user_id],
+                    arrays.topics[topic_id],
+                    ScoreRecord(0, score, total),
+                )
+        self._indexed_rows = count
+        return self._leaderboard
+
+    def load_result(self) -> Optional[Result]:
+        """Every attempt as a Result model. This materializes the whole store;
+        prefer the methods that work on the columns."""
+        try:
+            arrays = self.score_store.columns()
+            result = Result(root={})
+            for username, topic, timestamp, score, total in zip(
+                (arrays.users[i] for i in arrays.user_id.tolist()),
+                (arrays.topics[i] for i in arrays.topic_id.tolist()),
+                to_iso(arrays.timestamp),
+                arrays.score.tolist(),
+                arrays.total.tolist(),
+            ):
+                user = result.root.setdefault(username, User(root={}))
+                user.root.setdefault(topic, []).append(
+                    Score(timestamp=timestamp, score=score, total=total)
+                )
+            return result
+        except Exception as e:
+            self.show_error(f"Invalid scores data format: {str(e)}")
+            return None
+
+    def get_user_scores(self, username: str) -> Dict[str, List[ScoreRecord]]:
+        try:
+            arrays = self.score_store.columns()
+            user_id = self.score_store.users.ids.get(username)
+            if user_id is None:
+                return {}
+            rows = np.flatnonzero(arrays.user_id == user_id)
+            user_scores = {}
+            for topic_id, timestamp, score, total in zip(
+                arrays.topic_id[rows].tolist(),
+                (arrays.timestamp[rows] * 1_000_000).tolist(),
+                arrays.score[rows].tolist(),
+                arrays.total[rows].tolist(),
+            ):
+                user_scores.setdefault(arrays.topics[topic_id], []).append(
+                    ScoreRecord(timestamp, score, total)
+                )
+            return user_scores
+        except Exception as e:
+            self.show_error(f"Error retrieving scores for {username}: {str(e)}")
+            return {}
+
+    def score_version(self, username: str) -> int:
+        try:
+            arrays = self.score_store.columns()
+            user_id = self.score_store.users.ids.get(username)
+            if user_id is None:
+                return 0
+            return int(np.count_nonzero(arrays.user_id == user_id))
+        except Exception as e:
+            self.show_error(f"Error retrieving scores for {username}: {str(e)}")
+            return 0
+
+
+def best_attempts(
+    arrays: ScoreArrays,
+) -> Iterator[Tuple[str, Dict[str, List[ScoreRecord]]]]:
+    """Each user's best attempt per topic (the earliest of equal ratios), in
+    user id order, which is the order users first took a quiz."""
+    if not len(arrays):
+        return
+    total = arrays.total.astype(np.float64)
+    ratio = np.divide(
+        arrays.score.astype(np.float64),
+        total,
+        out=np.zeros(len(total)),
+        where=total > 0,
+    )
+    # Group by user and topic; within a group, best ratio first, then oldest.
+    order = np.lexsort((np.arange(len(ratio)), -ratio, arrays.topic_id, arrays.user_id))
+    user_id = arrays.user_id[order]
+    topic_id = arrays.topic_id[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (user_id[1:] != user_id[:-1]) | (topic_id[1:] != topic_id[:-1])
+    best = order[first]
+    current, user = None, None
+    for u, t, score, total in zip(
+        arrays.user_id[best].tolist(),
+        arrays.topic_id[best].tolist(),
+        arrays.score[best].tolist(),
+        arrays.total[best].tolist(),
+    ):
+        if u != current:
+            if user is not None:
+                yield arrays.users[current], user
+            current, user = u, {}
+        user[arrays.topics[t]] = [ScoreRecord(0, score, total)]
+    yield arrays.users[current], user
+
+
+def migrate_to_columns(source: DataManager, target: ColumnarDataManager) -> Dict:
+    """Append the source's scores (scores.json plus any journal) to the
+    target store in one buffered pass. Refuses to run if the store has rows."""
+    if len(target.score_store.columns()):
+        raise ValueError(f"{target.columns_dir} already holds scores")
+    result = source.load_result()
+    if result is None:
+        raise ValueError("Source scores could not be loaded")
+    counts = {"users": 0, "scores": 0}
+    store = target.score_store
+    for username, user in result.root.items():
+        counts["users"] += 1
+        for topic, scores in user.root.items():
+            for s in scores:
+                store.append(
+                    username,
+                    topic,
+                    to_epoch(datetime.fromisoformat(s.timestamp)),
+                    s.score,
+                    s.total,
+                )
+                counts["scores"] += 1
+    store.sync()
+    return counts
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Copy result/scores.json (and the score journal) into a "
+        "columnar score store."
+    )
+    parser.add_argument(
+        "--columns-dir", default=os.path.join(os.path.curdir, "result", "columns")
+    )
+    args = parser.parse_args()
+    target = ColumnarDataManager(columns_dir=args.columns_dir, buffer_rows=65536)
+    print(migrate_to_columns(DataManager(journal_scores=True), target))
@@ -1,30 +1,285 @@
 import os
 import json
 import random
-from typing import Optional, List, Dict
-from datetime import datetime
+import hashlib
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from typing import Iterable, Optional, List, Dict
 import uuid
+import queue
+import threading
+from collections import OrderedDict
 from tkinter import messagebox
+from pydantic import TypeAdapter, ValidationError
 from schemas import (
     QuizConfig,
     Quiz,
     Question,
     Result,
-    User,
-    Score,
     Users,
     UserCredentials,
 )
+from records import QuestionRecord, QuestionTable, ScoreRecord, ScoreTable, UserScores
+from score_journal import ScoreJournal
+from atomic_file import atomic_write
+from file_lock import FileLock
+from leaderboard_index import LeaderboardIndex
+from question_index import QuestionIndex, file_signature, sample_positions
+from question_pack import QuestionPack, build_question_pack
+from question_import import ImportReport, Row, validate_batch
+from metrics import Metrics, instrument
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model_cls) -> TypeAdapter:
+    return TypeAdapter(model_cls)
+
+
+def content_digest(raw: bytes) -> bytes:
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def add_topic_statistics(analytics: Dict, arrays, config) -> None:
+    """Fill the score-derived fields of a get_analytics result from
+    ScoreArrays."""
+    from score_analytics import topic_statistics
+
+    analytics["users_took_quizzes"] = len(arrays.users)
+    stats = topic_statistics(arrays, config.topics if config else [])
+    analytics["per_topic_stats"] = stats
+    for topic, topic_stats in stats.items():
+        analytics["per_topic_activity"][topic] = topic_stats["users"]
 
 
 class DataManager:
     """Handles JSON file operations and data validation."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_size: int = 64,
+        journal_scores: bool = False,
+        journal_fsync_batch: int = 16,
+        journal_compact_threshold: int = 1000,
+        use_question_pack: bool = False,
+        compact_json: bool = False,
+        trusted_reads: bool = False,
+        lock_files: bool = True,
+        metrics: Optional[Metrics] = None,
+    ):
         self.config_path = os.path.join(os.path.curdir, "config", "config.json")
         self.data_dir = os.path.join(os.path.curdir, "data")
         self.scores_path = os.path.join(os.path.curdir, "result", "scores.json")
         self.users_path = os.path.join(os.path.curdir, "users", "users.json")
+        # Validated models keyed by file path, reused while the file's
+        # (mtime, size, inode) signature is unchanged.
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.RLock()
+        # Files are written without indentation when compact_json is set.
+        self.json_indent = None if compact_json else 4
+        # With trusted_reads, a file whose bytes hash to the digest of our own
+        # last write is answered with the model we wrote, without parsing or
+        # validating it again, even if its stat signature changed (a touch,
+        # a restore, or eviction from the cache). Maps path -> (digest, model).
+        self.trusted_reads = trusted_reads
+        self.trusted_hits = 0
+        self._written = {}
+        # Errors hit on I/O worker threads are queued for the Tk thread, the
+        # only thread allowed to open dialogs.
+        self.pending_errors = queue.Queue()
+        # In journaled mode save_score appends to scores.journal instead of
+        # rewriting scores.json; reads merge the snapshot with the journal.
+        self.journal_path = os.path.join(os.path.curdir, "result", "scores.journal")
+        self.journal_scores = journal_scores
+        self.journal_compact_threshold = journal_compact_threshold
+        self.score_journal = ScoreJournal(
+            self.journal_path, fsync_batch=journal_fsync_batch
+        )
+        self._merged_scores = None
+        # Best-score index, rebuilt only when the scores model is replaced
+        # (startup or an external change) and updated in place otherwise.
+        self._leaderboard = None
+        self._leaderboard_source = None
+        # NumPy columns of every attempt for analytics, built from one scores
+        # model. Attempts later added to that model in place are queued in
+        # _score_rows and appended on the next use.
+        self._score_arrays = None
+        self._score_arrays_source = None
+        self._score_rows = []
+        # Optional compiled, memory-mapped copy of every topic file. The JSON
+        # files stay the source; the pack is rebuilt when one of them changes.
+        self.use_question_pack = use_question_pack
+        self.pack_path = os.path.join(self.data_dir, "questions.pack")
+        self._pack = None
+        # Byte offsets of each question in a topic file, so a quiz of N
+        # questions only reads those N. Saved as data/<topic>.index and kept
+        # here by index path.
+        self._question_indexes = {}
+        # Read-modify-write updates hold an advisory lock on "<file>.lock", so
+        # several app or server processes can share one data directory
+        # without losing each other's writes. Held paths are tracked per
+        # thread so a locked method can call another one on the same file.
+        self.lock_files = lock_files
+        self._held_locks = threading.local()
+        # Opt-in instrumentation: every public method is timed, and file I/O
+        # is split into read, parse, validate, serialize and write phases.
+        self.metrics = metrics
+        if metrics is not None:
+            instrument(self, metrics)
+
+    def show_error(self, message: str) -> None:
+        if threading.current_thread() is threading.main_thread():
+            messagebox.showerror("Error", message)
+        else:
+            self.pending_errors.put(message)
+
+    def _file_signature(self, file_path: str) -> Optional[tuple]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _cache_get(self, file_path: str, model_cls, probe: bool = False):
+        """The cached model of file_path if the file is unchanged, else None.
+        A probe's miss is not counted: its caller may go on to read the file
+        some other way, or load it and count the miss there."""
+        with self._cache_lock:
+            entry = self._cache.get(file_path)
+            if entry is not None:
+                signature, model = entry
+                if isinstance(model, model_cls) and signature == self._file_signature(
+                    file_path
+                ):
+                    self._cache.move_to_end(file_path)
+                    self.cache_hits += 1
+                    return model
+                del self._cache[file_path]
+            if not probe:
+                self.cache_misses += 1
+            return None
+
+    def _cache_put(self, file_path: str, model) -> None:
+        with self._cache_lock:
+            signature = self._file_signature(file_path)
+            if signature is None or self.cache_size <= 0:
+                self._cache.pop(file_path, None)
+                return
+            self._cache[file_path] = (signature, model)
+            self._cache.move_to_end(file_path)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _cache_discard(self, file_path: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(file_path, None)
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def cache_stats(self) -> Dict:
+        with self._cache_lock:
+            return {
+                "entries": len(self._cache),
+                "size": self.cache_size,
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+            }
+
+    def _metric_file(self, file_path: str) -> str:
+        """The path metrics record file_path's I/O under."""
+        return file_path
+
+    def _phase(self, file_path: str, phase: str):
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.phase(self._metric_file(file_path), phase)
+
+    def _add_bytes(self, file_path: str, direction: str, count: int) -> None:
+        if self.metrics is not None:
+            self.metrics.add_bytes(self._metric_file(file_path), direction, count)
+
+    @contextmanager
+    def _locked(self, file_path: str):
+        """Hold the cross-process write lock of file_path. Reentrant within a
+        thread; the time spent waiting is recorded as the "lock" phase."""
+        held = getattr(self._held_locks, "paths", None)
+        if held is None:
+            held = self._held_locks.paths = set()
+        if not self.lock_files or file_path in held:
+            yield
+            return
+        lock = FileLock(file_path)
+        waited = lock.acquire()
+        if self.metrics is not None:
+            self.metrics.observe_phase(self._metric_file(file_path), "lock", waited)
+        held.add(file_path)
+        try:
+            yield
+        finally:
+            held.discard(file_path)
+            lock.release()
+
+    def _load_model(self, file_path: str, model_cls, allow_empty: bool = True):
+        """Return the validated model for file_path, reusing the cached one while
+        the file is unchanged on disk. The file's bytes go straight to the
+        pydantic-core JSON validator. Validation errors are left to the caller."""
+        model = self._cache_get(file_path, model_cls)
+        if model is not None:
+            return model
+        raw = self.load_json_bytes(file_path)
+        if raw is None or (not allow_empty and raw.strip() == b"{}"):
+            return None
+        if self.trusted_reads:
+            with self._cache_lock:
+                written = self._written.get(file_path)
+            if (
+                written is not None
+                and isinstance(written[1], model_cls)
+                and written[0] == content_digest(raw)
+            ):
+                self.trusted_hits += 1
+                self._cache_put(file_path, written[1])
+                return written[1]
+        try:
+            if self.metrics is None:
+                model = type_adapter(model_cls).validate_json(raw)
+            else:
+                # Two steps instead of one, so parse and validation time can
+                # be told apart.
+                with self._phase(file_path, "parse"):
+                    data = json.loads(raw)
+                with self._phase(file_path, "validate"):
+                    model = type_adapter(model_cls).validate_python(data)
+        except json.JSONDecodeError:
+            self.show_error(f"Invalid JSON format in {file_path}")
+            return None
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                self.show_error(f"Invalid JSON format in {file_path}")
+                return None
+            raise
+        self._cache_put(file_path, model)
+        return model
+
+    def load_json_bytes(self, file_path: str) -> Optional[bytes]:
+        """Raw contents of a JSON file, created as {} when missing."""
+        try:
+            if not os.path.exists(file_path):
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "w") as file:
+                    json.dump({}, file)
+                return b"{}"
+            with self._phase(file_path, "read"), open(file_path, "rb") as file:
+                raw = file.read()
+            self._add_bytes(file_path, "read", len(raw))
+            return raw
+        except Exception as e:
+            self.show_error(f"Error loading {file_path}: {str(e)}")
+            return None
 
     def load_json_file(self, file_path: str) -> Optional[dict]:
         try:
@@ -33,199 +288,605 @@ class DataManager:
                 with open(file_path, "w") as file:
                     json.dump({}, file)
                 return {}
-            with open(file_path, "r") as file:
-                return json.load(file)
+            with self._phase(file_path, "read"), open(file_path, "rb") as file:
+                raw = file.read()
+            self._add_bytes(file_path, "read", len(raw))
+            with self._phase(file_path, "parse"):
+                return json.loads(raw)
         except json.JSONDecodeError:
-            messagebox.showerror("Error", f"Invalid JSON format in {file_path}")
+            self.show_error(f"Invalid JSON format in {file_path}")
             return None
         except Exception as e:
-            messagebox.showerror("Error", f"Error loading {file_path}: {str(e)}")
+            self.show_error(f"Error loading {file_path}: {str(e)}")
             return None
 
-    def save_json_file(self, file_path: str, data: dict) -> bool:
+    def save_json_file(
+        self, file_path: str, data: Optional[dict] = None, model=None
+    ) -> bool:
+        """Write data, or the validated model, to file_path. A model is
+        serialized by pydantic-core and kept in the cache instead of being
+        invalidated."""
         try:
+            with self._phase(file_path, "serialize"):
+                if model is not None:
+                    raw = type_adapter(type(model)).dump_json(
+                        model, indent=self.json_indent
+                    )
+                else:
+                    raw = json.dumps(data, indent=self.json_indent).encode()
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, "w") as file:
-                json.dump(data, file, indent=4)
+            # Readers never see a half-written file and a crash leaves either
+            # the old or the new contents.
+            with self._phase(file_path, "write"), atomic_write(file_path) as file:
+                file.write(raw)
+            self._add_bytes(file_path, "written", len(raw))
+            if model is not None:
+                self._cache_put(file_path, model)
+                if self.trusted_reads:
+                    with self._cache_lock:
+                        self._written[file_path] = (content_digest(raw), model)
+            else:
+                self._cache_discard(file_path)
+                with self._cache_lock:
+                    self._written.pop(file_path, None)
             return True
         except Exception as e:
-            messagebox.showerror("Error", f"Error saving {file_path}: {str(e)}")
+            # The model may have been changed in place before this failed.
+            self._cache_discard(file_path)
+            with self._cache_lock:
+                self._written.pop(file_path, None)
+            self.show_error(f"Error saving {file_path}: {str(e)}")
             return False
 
     def load_config(self) -> Optional[QuizConfig]:
-        config_data = self.load_json_file(self.config_path)
-        if not config_data:
+        try:
+            return self._load_model(self.config_path, QuizConfig, allow_empty=False)
+        except Exception as e:
+            self.show_error(f"Invalid configuration format: {str(e)}")
             return None
+
+    def _question_pack(self, topic: str) -> QuestionPack:
+        path = os.path.join(self.data_dir, f"{topic}.json")
+        if self._pack is None and os.path.exists(self.pack_path):
+            try:
+                self._pack = QuestionPack(self.pack_path)
+            except ValueError:
+                self._pack = None
+        if self._pack is None or not self._pack.is_fresh(topic, path):
+            # Not closed: PackedQuestions already handed out (running quizzes,
+            # prefetched ones, server sessions) hold the old pack, and its
+            # map is released when the last of them is.
+            self._pack = None
+            config = self.load_config()
+            topics = list(config.topics) if config else []
+            if topic not in topics:
+                topics.append(topic)
+            build_question_pack(self.data_dir, topics, self.pack_path)
+            self._pack = QuestionPack(self.pack_path)
+        return self._pack
+
+    def load_questions(
+        self, topic: str, count: Optional[int] = None, seed: Optional[int] = None
+    ) -> Optional[List[QuestionRecord]]:
+        """count questions of a topic drawn at random, or all of them shuffled
+        when count is None. The same seed draws the same questions in the
+        same order while the topic is unchanged.
+
+        Unless the topic is already cached, a sample is read through the
+        topic's QuestionIndex: only the drawn questions are parsed and
+        validated."""
+        path = os.path.join(self.data_dir, f"{topic}.json")
+        rng = random.Random(seed)
+        if self.use_question_pack:
+            try:
+                # A lazy sequence: only the questions actually shown are decoded.
+                return self._question_pack(topic).questions(topic, count=count, rng=rng)
+            except Exception as e:
+                self.show_error(f"Error processing questions for {topic}: {str(e)}")
+                return None
         try:
-            return QuizConfig.model_validate(config_data)
+            quiz = self._cache_get(path, QuestionTable, probe=True)
+            if quiz is None and count is not None and os.path.exists(path):
+                return self._sample_questions(topic, count, rng)
+            if quiz is None:
+                quiz = self._load_model(path, QuestionTable)
+            if quiz is None:
+                return None
+            questions = list(quiz.values())
+            return [questions[i] for i in sample_positions(len(questions), count, rng)]
         except Exception as e:
-            messagebox.showerror("Error", f"Invalid configuration format: {str(e)}")
+            self.show_error(f"Error processing questions for {topic}: {str(e)}")
             return None
 
-    def load_questions(self, topic: str) -> Optional[List[Question]]:
+    def _question_index(self, topic: str, file) -> QuestionIndex:
+        """The index of the open topic file, rebuilt and saved as
+        data/<topic>.index when missing or older than the file."""
+        index_path = os.path.join(self.data_dir, f"{topic}.index")
+        source = file_signature(file)
+        with self._cache_lock:
+            index = self._question_indexes.get(index_path)
+        if index is None or index.source != source:
+            index = QuestionIndex.load(index_path)
+            if index is None or index.source != source:
+                file.seek(0)
+                with self._phase(file.name, "read"):
+                    raw = file.read()
+                with self._phase(file.name, "parse"):
+                    index = QuestionIndex.build(raw, source)
+                try:
+                    index.save(index_path)
+                except OSError:
+                    # A read-only data directory only costs a rescan per process.
+                    pass
+            with self._cache_lock:
+                self._question_indexes[index_path] = index
+        return index
+
+    def _sample_questions(
+        self, topic: str, count: int, rng: random.Random
+    ) -> List[QuestionRecord]:
+        path = os.path.join(self.data_dir, f"{topic}.json")
+        adapter = type_adapter(QuestionRecord)
+        questions = []
+        # One open file for the index check and the reads, so a topic file
+        # replaced meanwhile cannot be read through the old file's offsets.
+        with open(path, "rb") as file:
+            index = self._question_index(topic, file)
+            for position in index.sample(count, rng):
+                file.seek(index.offsets[position])
+                with self._phase(path, "read"):
+                    raw = file.read(index.lengths[position])
+                with self._phase(path, "validate"):
+                    questions.append(adapter.validate_json(raw))
+        return questions
+
+    def load_quiz(self, topic: str) -> Optional[Quiz]:
+        """Return every question of a topic keyed by question id, in file order."""
         path = os.path.join(self.data_dir, f"{topic}.json")
-        quiz_raw = self.load_json_file(path)
-        if quiz_raw is None:
+        try:
+            quiz = self._load_model(path, QuestionTable)
+            return None if quiz is None else quiz.to_model()
+        except Exception as e:
+            self.show_error(f"Error processing questions for {topic}: {str(e)}")
             return None
+
+    def _question_count(self, topic: str) -> Optional[int]:
+        path = os.path.join(self.data_dir, f"{topic}.json")
         try:
-            quiz = Quiz.model_validate(quiz_raw)
-            questions = list(quiz.root.values())
-            random.shuffle(questions)
-            return questions
+            quiz = self._load_model(path, QuestionTable)
+            return None if quiz is None else len(quiz)
         except Exception as e:
-            messagebox.showerror(
-                "Error", f"Error processing questions for {topic}: {str(e)}"
-            )
+            self.show_error(f"Error processing questions for {topic}: {str(e)}")
             return None
 
     def save_question(self, topic: str, question: Question) -> Optional[str]:
         path = os.path.join(self.data_dir, f"{topic}.json")
-        quiz_data = self.load_json_file(path)
-        if quiz_data is None:
-            return None
         try:
-            quiz = Quiz.model_validate(quiz_data)
-            config = self.load_config()
-            if config and len(quiz.root) >= config.questionsPerTopic:
-                messagebox.showerror(
-                    "Error",
-                    f"Topic '{topic}' has reached the limit of {config.questionsPerTopic} questions",
-                )
+            with self._locked(path):
+                quiz = self._load_model(path, QuestionTable)
+                if quiz is None:
+                    return None
+                config = self.load_config()
+                if config and len(quiz) >= config.questionsPerTopic:
+                    self.show_error(
+                        f"Topic '{topic}' has reached the limit of {config.questionsPerTopic} questions",
+                    )
+                    return None
+                question_id = str(uuid.uuid4())
+                quiz[question_id] = QuestionRecord.from_model(question)
+                if self.save_json_file(path, model=quiz):
+                    return question_id
                 return None
-            question_id = str(uuid.uuid4())
-            quiz.root[question_id] = question
-            if self.save_json_file(path, quiz.model_dump()):
-                return question_id
+        except Exception as e:
+            self.show_error(f"Error saving question: {str(e)}")
             return None
+
+    def save_questions(
+        self, topic: str, questions: List[Question]
+    ) -> Optional[List[str]]:
+        """Add several questions to a topic with a single write. Nothing is
+        saved if they would take the topic past questionsPerTopic."""
+        path = os.path.join(self.data_dir, f"{topic}.json")
+        try:
+            with self._locked(path):
+                quiz = self._load_model(path, QuestionTable)
+                if quiz is None:
+                    return None
+                config = self.load_config()
+                if config and len(quiz) + len(questions) > config.questionsPerTopic:
+                    self.show_error(
+                        f"Topic '{topic}' has room for {max(0, config.questionsPerTopic - len(quiz))} more questions",
+                    )
+                    return None
+                question_ids = []
+                for question in questions:
+                    question_id = str(uuid.uuid4())
+                    quiz[question_id] = QuestionRecord.from_model(question)
+                    question_ids.append(question_id)
+                if self.save_json_file(path, model=quiz):
+                    return question_ids
+                return None
         except Exception as e:
-            messagebox.showerror("Error", f"Error saving question: {str(e)}")
+            self.show_error(f"Error saving questions: {str(e)}")
+            return None
+
+    def import_questions(
+        self,
+        rows: Iterable[Row],
+        default_topic: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Optional[ImportReport]:
+        """Validate streamed question rows (see question_import.read_rows) in
+        batches and write each topic once. Rows that are invalid, name an
+        unknown topic or exceed questionsPerTopic are reported, not fatal."""
+        config = self.load_config()
+        if config is None:
             return None
+        report = ImportReport()
+        accepted: Dict[str, List[tuple]] = {}
+        batch, batch_topics = [], {}
+
+        def flush():
+            valid, errors = validate_batch(batch)
+            report.errors.extend(errors)
+            for row_number, question in valid:
+                accepted.setdefault(batch_topics[row_number], []).append(
+                    (row_number, question)
+                )
+            batch.clear()
+            batch_topics.clear()
+
+        for row_number, row in rows:
+            if isinstance(row, Exception):
+                report.errors.append((row_number, str(row)))
+                continue
+            topic = str(row.get("topic") or default_topic or "")
+            topic = topic.strip().lower().replace(" ", "_")
+            if topic not in config.topics:
+                report.errors.append((row_number, f"topic: unknown topic '{topic}'"))
+                continue
+            batch.append((row_number, row))
+            batch_topics[row_number] = topic
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+
+        for topic, entries in accepted.items():
+            count = self._question_count(topic)
+            if count is None:
+                report.errors.extend(
+                    (row_number, f"Questions for '{topic}' could not be loaded")
+                    for row_number, _ in entries
+                )
+                continue
+            room = max(0, config.questionsPerTopic - count)
+            report.errors.extend(
+                (
+                    row_number,
+                    f"Topic '{topic}' has reached the limit of {config.questionsPerTopic} questions",
+                )
+                for row_number, _ in entries[room:]
+            )
+            entries = entries[:room]
+            if not entries:
+                continue
+            question_ids = self.save_questions(topic, [q for _, q in entries])
+            if question_ids is None:
+                report.errors.extend(
+                    (row_number, f"Questions for '{topic}' were not saved")
+                    for row_number, _ in entries
+                )
+                continue
+            report.added[topic] = question_ids
+        report.errors.sort()
+        return report
 
     def delete_question(self, topic: str, question_id: str) -> bool:
         path = os.path.join(self.data_dir, f"{topic}.json")
-        quiz_data = self.load_json_file(path)
-        if quiz_data is None:
+        try:
+            with self._locked(path):
+                quiz = self._load_model(path, QuestionTable)
+                if quiz is None:
+                    return False
+                if question_id not in quiz:
+                    self.show_error(f"Question ID '{question_id}' not found")
+                    return False
+                del quiz[question_id]
+                return self.save_json_file(path, model=quiz)
+        except Exception as e:
+            self.show_error(f"Error deleting question: {str(e)}")
             return False
+
+    def delete_questions(self, topic: str, question_ids: List[str]) -> bool:
+        """Remove several questions with one read and one write. Nothing is
+        deleted if any id is unknown."""
+        path = os.path.join(self.data_dir, f"{topic}.json")
         try:
-            quiz = Quiz.model_validate(quiz_data)
-            if question_id not in quiz.root:
-                messagebox.showerror("Error", f"Question ID '{question_id}' not found")
-                return False
-            del quiz.root[question_id]
-            return self.save_json_file(path, quiz.model_dump())
+            with self._locked(path):
+                quiz = self._load_model(path, QuestionTable)
+                if quiz is None:
+                    return False
+                missing = [qid for qid in question_ids if qid not in quiz]
+                if missing:
+                    self.show_error(f"Question ID '{missing[0]}' not found")
+                    return False
+                for qid in question_ids:
+                    quiz.pop(qid, None)
+                return self.save_json_file(path, model=quiz)
         except Exception as e:
-            messagebox.showerror("Error", f"Error deleting question: {str(e)}")
+            self.show_error(f"Error deleting questions: {str(e)}")
             return False
 
     def load_users(self) -> Optional[Users]:
-        users_data = self.load_json_file(self.users_path)
-        if users_data is None:
-            return None
         try:
-            return Users.model_validate(users_data)
+            return self._load_model(self.users_path, Users)
         except Exception as e:
-            messagebox.showerror("Error", f"Invalid users data format: {str(e)}")
+            self.show_error(f"Invalid users data format: {str(e)}")
             return None
 
     def save_user(self, user: UserCredentials) -> bool:
-        users_data = self.load_json_file(self.users_path)
-        if users_data is None:
+        try:
+            with self._locked(self.users_path):
+                users = self._load_model(self.users_path, Users)
+                if users is None:
+                    return False
+                if user.username in users.root:
+                    self.show_error("Username already exists")
+                    return False
+                users.root[user.username] = user
+                return self.save_json_file(self.users_path, model=users)
+        except Exception as e:
+            self.show_error(f"Error saving user: {str(e)}")
             return False
+
+    def _load_scores(self) -> Optional[ScoreTable]:
+        """Return scores.json merged with any journaled attempts. Only journal
+        bytes appended since the previous call are replayed."""
+        snapshot = self._load_model(self.scores_path, ScoreTable)
+        if snapshot is None:
+            return None
+        signature = self.score_journal.signature()
+        if not signature or signature[1] == 0:
+            self._merged_scores = None
+            return snapshot
+        merged = self._merged_scores
+        if (
+            merged is None
+            or merged["snapshot"] is not snapshot
+            or merged["inode"] != signature[0]
+            or merged["offset"] > signature[1]
+        ):
+            merged = {
+                "snapshot": snapshot,
+                "inode": signature[0],
+                "offset": 0,
+                "records": 0,
+                "result": snapshot.clone(),
+            }
+        if merged["offset"] < signature[1]:
+            records, merged["offset"] = self.score_journal.read_from(merged["offset"])
+            index_current = self._leaderboard_source is merged["result"]
+            for username, topic, score in records:
+                user = merged["result"].setdefault(username, UserScores())
+                scores = user.setdefault(topic, [])
+                # A crash between writing the snapshot and truncating the
+                # journal leaves records that are already in the snapshot.
+                if score not in scores:
+                    scores.append(score)
+                    self._score_added(merged["result"], username, topic, score)
+                    if index_current:
+                        self._leaderboard.record(username, topic, score)
+            merged["records"] += len(records)
+        self._merged_scores = merged
+        return merged["result"]
+
+    def compact_scores(self) -> bool:
+        """Fold the score journal into scores.json and truncate the journal."""
         try:
-            users = Users.model_validate(users_data)
-            if user.username in users.root:
-                messagebox.showerror("Error", "Username already exists")
-                return False
-            users.root[user.username] = user
-            return self.save_json_file(self.users_path, users.model_dump())
+            with self._locked(self.scores_path):
+                result = self._load_scores()
+                if result is None:
+                    return False
+                if self._merged_scores is None:
+                    return True
+                if not self.save_json_file(self.scores_path, model=result):
+                    return False
+                self.score_journal.truncate()
+                self._merged_scores = None
+                return True
+        except Exception as e:
+            self.show_error(f"Error compacting scores: {str(e)}")
+            return False
+
+    def update_user(self, user: UserCredentials) -> bool:
+        """Replace the stored credentials of an existing user."""
+        try:
+            with self._locked(self.users_path):
+                users = self._load_model(self.users_path, Users)
+                if users is None:
+                    return False
+                if user.username not in users.root:
+                    self.show_error(f"User '{user.username}' not found")
+                    return False
+                users.root[user.username] = user
+                return self.save_json_file(self.users_path, model=users)
         except Exception as e:
-            messagebox.showerror("Error", f"Error saving user: {str(e)}")
+            self.show_error(f"Error saving user: {str(e)}")
             return False
 
+    def load_result(self) -> Optional[Result]:
+        """Every attempt as a schemas.Result, built from the in-memory records
+        for export and migration. Prefer get_user_scores and the leaderboard
+        methods."""
+        try:
+            result = self._load_scores()
+            return None if result is None else result.to_model()
+        except Exception as e:
+            self.show_error(f"Invalid scores data format: {str(e)}")
+            return None
+
     def save_score(self, username: str, topic: str, score: int, total: int) -> bool:
-        result_data = self.load_json_file(self.scores_path)
-        result = (
-            Result(root={}) if not result_data else Result.model_validate(result_data)
-        )
-        if username not in result.root:
-            result.root[username] = User(root={})
-        if topic not in result.root[username].root:
-            result.root[username].root[topic] = []
-        new_score = Score(
-            timestamp=datetime.now().isoformat(), score=score, total=total
-        )
-        result.root[username].root[topic].append(new_score)
-        return self.save_json_file(self.scores_path, result.model_dump())
+        new_score = ScoreRecord.now(score, total)
+        with self._locked(self.scores_path):
+            if self.journal_scores:
+                try:
+                    self.score_journal.append(username, topic, new_score)
+                except Exception as e:
+                    self.show_error(f"Error saving score: {str(e)}")
+                    return False
+                try:
+                    self._load_scores()
+                except Exception as e:
+                    # The attempt is in the journal and counts as saved; only
+                    # the in-memory merge (and compaction) could not follow.
+                    self.show_error(f"Invalid scores data format: {str(e)}")
+                    return True
+                if (
+                    self._merged_scores is not None
+                    and self._merged_scores["records"] >= self.journal_compact_threshold
+                ):
+                    self.compact_scores()
+                return True
+            try:
+                result = self._load_scores()
+            except Exception as e:
+                self.show_error(f"Invalid scores data format: {str(e)}")
+                return False
+            if result is None:
+                result = ScoreTable()
+            result.setdefault(username, UserScores()).setdefault(topic, []).append(
+                new_score
+            )
+            if not self.save_json_file(self.scores_path, model=result):
+                return False
+            self._score_added(result, username, topic, new_score)
+            if self._leaderboard_source is result:
+                self._leaderboard.record(username, topic, new_score)
+            if self._merged_scores is not None:
+                # The journal has just been folded into the snapshot.
+                self.score_journal.truncate()
+                self._merged_scores = None
+            return True
+
+    def _leaderboard_index(self) -> LeaderboardIndex:
+        result = self._load_scores()
+        if self._leaderboard is None or self._leaderboard_source is not result:
+            self._leaderboard = LeaderboardIndex.from_users(
+                result.items() if result else ()
+            )
+            self._leaderboard_source = result
+        return self._leaderboard
 
-    def get_leaderboard(self, topic: str) -> List[Dict]:
-        result_data = self.load_json_file(self.scores_path)
-        if not result_data:
+    def get_leaderboard(
+        self, topic: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict]:
+        """Best attempt per user for topic, highest percentage first. limit and
+        offset select a page (or the top K) without materialising the rest."""
+        try:
+            return self._leaderboard_index().page(topic, offset, limit)
+        except Exception as e:
+            self.show_error(f"Error processing leaderboard: {str(e)}")
             return []
+
+    def get_overall_leaderboard(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict]:
+        """Sum of each user's best score per topic over the sum of those
+        attempts' totals, highest percentage first. "score" is "<sum>/<total>"."""
         try:
-            result = Result.model_validate(result_data)
-            leaderboard = []
-            for username, user_data in result.root.items():
-                if topic in user_data.root:
-                    best_score = max(
-                        user_data.root[topic],
-                        key=lambda x: x.score / x.total if x.total > 0 else 0,
-                        default=None,
-                    )
-                    if best_score:
-                        leaderboard.append(
-                            {
-                                "username": username,
-                                "score": best_score.score,
-                                "total": best_score.total,
-                                "percentage": (
-                                    (best_score.score / best_score.total * 100)
-                                    if best_score.total > 0
-                                    else 0
-                                ),
-                            }
-                        )
-            return sorted(leaderboard, key=lambda x: x["percentage"], reverse=True)
-        except Exception as e:
-            messagebox.showerror("Error", f"Error processing leaderboard: {str(e)}")
+            return self._leaderboard_index().page(None, offset, limit)
+        except Exception as e:
+            self.show_error(f"Error processing all topics leaderboard: {str(e)}")
             return []
 
+    def get_leaderboard_count(self, topic: Optional[str]) -> int:
+        """Number of ranked users for topic; None counts the all-topics view."""
+        try:
+            return self._leaderboard_index().count(topic)
+        except Exception as e:
+            self.show_error(f"Error processing leaderboard: {str(e)}")
+            return 0
+
+    def get_leaderboard_rank(
+        self, topic: Optional[str], username: str
+    ) -> Optional[int]:
+        """Zero-based position of username in the topic leaderboard (the
+        all-topics view for None), or None if they are not ranked."""
+        try:
+            return self._leaderboard_index().rank(topic, username)
+        except Exception as e:
+            self.show_error(f"Error processing leaderboard: {str(e)}")
+            return None
+
+    def score_arrays(self):
+        """Every attempt as NumPy columns (see score_analytics.ScoreArrays),
+        rebuilt only when the scores change."""
+        from score_analytics import ScoreArrays
+
+        result = self._load_scores()
+        if self._score_arrays is None or self._score_arrays_source is not result:
+            self._score_arrays = ScoreArrays.from_users(
+                result.items() if result else ()
+            )
+            self._score_arrays_source = result
+            self._score_rows = []
+        elif self._score_rows:
+            self._score_arrays = self._score_arrays.extended(self._score_rows)
+            self._score_rows = []
+        return self._score_arrays
+
+    def _score_added(
+        self, result: ScoreTable, username: str, topic: str, score: ScoreRecord
+    ):
+        if self._score_arrays_source is result:
+            self._score_rows.append(
+                (username, topic, score.timestamp, score.score, score.total)
+            )
+
     def get_analytics(self) -> Dict:
-        result_data = self.load_json_file(self.scores_path)
-        users_data = self.load_json_file(self.users_path)
+        """Users, topics and active users, plus per_topic_stats: attempt
+        statistics per configured topic (see score_analytics.topic_statistics).
+        per_topic_activity is the number of users who took each topic."""
         config = self.load_config()
         analytics = {
             "total_users": 0,
             "total_topics": len(config.topics) if config else 0,
             "users_took_quizzes": 0,
             "per_topic_activity": {},
+            "per_topic_stats": {},
         }
-        if users_data:
-            analytics["total_users"] = len(users_data)
-        if result_data:
-            try:
-                result = Result.model_validate(result_data)
-                analytics["users_took_quizzes"] = len(result.root)
-                for topic in config.topics if config else []:
-                    count = sum(
-                        1 for user in result.root.values() if topic in user.root
-                    )
-                    analytics["per_topic_activity"][topic] = count
-            except Exception as e:
-                messagebox.showerror("Error", f"Error processing analytics: {str(e)}")
+        try:
+            users = self.load_users()
+            if users:
+                analytics["total_users"] = len(users.root)
+            arrays = self.score_arrays()
+            if len(arrays):
+                add_topic_statistics(analytics, arrays, config)
+        except Exception as e:
+            self.show_error(f"Error processing analytics: {str(e)}")
         return analytics
 
-    def get_user_scores(self, username: str) -> dict:
-        result_data = self.load_json_file(self.scores_path)
-        if not result_data:
-            return {}
+    def get_user_scores(self, username: str) -> Dict[str, List[ScoreRecord]]:
         try:
-            result = Result.model_validate(result_data)
-            user_scores = result.root.get(username, None)
-            if user_scores:
-                return user_scores.root
-            return {}
+            result = self._load_scores()
+            if not result:
+                return {}
+            user_scores = result.get(username)
+            # Fresh lists, so callers can sort them without touching the cache.
+            return user_scores.clone() if user_scores else {}
         except Exception as e:
-            messagebox.showerror(
-                "Error", f"Error retrieving scores for {username}: {str(e)}"
-            )
+            self.show_error(f"Error retrieving scores for {username}: {str(e)}")
             return {}
+
+    def score_version(self, username: str) -> int:
+        """A counter that changes exactly when username's score history does:
+        the number of their attempts, as attempts are only ever added. Lets
+        callers cache what they derive from get_user_scores."""
+        try:
+            return sum(
+                len(scores) for scores in self.get_user_scores(username).values()
+            )
+        except Exception as e:
+            self.show_error(f"Error retrieving scores for {username}: {str(e)}")
+            return 0
@@ -0,0 +1,58 @@
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive advisory lock on "<path>.lock", shared by every process (and
+    thread) that locks the same path. Only cooperating writers are kept out;
+    readers never need it because files are replaced atomically."""
+
+    def __init__(self, path: str):
+        self.lock_path = f"{path}.lock"
+        self._file = None
+
+    def acquire(self) -> float:
+        """Block until the lock is held; returns the seconds spent waiting."""
+        os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+        self._file = open(self.lock_path, "a+b")
+        start = time.perf_counter()
+        if fcntl is not None:
+            # flock locks belong to the open file, so threads of one process
+            # exclude each other as well.
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after about 10 seconds.
+                    continue
+        return time.perf_counter() - start
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
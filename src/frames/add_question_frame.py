@@ -100,7 +100,7 @@ class AddQuestionFrame(tk.Frame):
 
         button_frame = tk.Frame(main_frame, bg="#f0f0f0")
         button_frame.grid(row=8, column=0, columnspan=2, pady=20)
-        save_button = tk.Button(
+        self.save_button = tk.Button(
             button_frame,
             text="Save Question",
             command=self.save_question,
@@ -110,7 +110,7 @@ class AddQuestionFrame(tk.Frame):
             padx=10,
             pady=5,
         )
-        save_button.pack(side="left", padx=10)
+        self.save_button.pack(side="left", padx=10)
         back_button = tk.Button(
             button_frame,
             text="Back",
@@ -133,12 +133,22 @@ class AddQuestionFrame(tk.Frame):
             return
         try:
             question = Question(question=question_text, options=options, answer=answer)
-            question_id = self.app.data_manager.save_question(topic, question)
-            if question_id:
-                messagebox.showinfo("Success", f"Question added with ID: {question_id}")
-                self.back()
         except Exception as e:
             messagebox.showerror("Error", f"Invalid question data: {str(e)}")
+            return
+        self.save_button.configure(state="disabled")
+        self.app.io.then(
+            self.app.io.save_question(topic, question),
+            self.saved,
+            self,
+            on_error=lambda error: self.save_button.configure(state="normal"),
+        )
+
+    def saved(self, question_id):
+        self.save_button.configure(state="normal")
+        if question_id:
+            messagebox.showinfo("Success", f"Question added with ID: {question_id}")
+            self.back()
 
     def back(self):
         self.app.clear_frame()
@@ -1,7 +1,4 @@
 import tkinter as tk
-from frames.manage_questions_frame import ManageQuestionsFrame
-from frames.leaderboard_frame import LeaderboardFrame
-from frames.analytics_frame import AnalyticsFrame
 
 
 class AdminFrame(tk.Frame):
@@ -78,15 +75,21 @@ class AdminFrame(tk.Frame):
 
     def show_manage_questions(self):
         self.app.clear_frame()
-        self.app.current_frame = ManageQuestionsFrame(self.app.root, self.app, self)
+        self.app.current_frame = self.app.frame_class("manage_questions")(
+            self.app.root, self.app, self
+        )
         self.app.current_frame.pack(fill="both", expand=True)
 
     def show_leaderboard(self):
         self.app.clear_frame()
-        self.app.current_frame = LeaderboardFrame(self.app.root, self.app, self)
+        self.app.current_frame = self.app.frame_class("leaderboard")(
+            self.app.root, self.app, self
+        )
         self.app.current_frame.pack(fill="both", expand=True)
 
     def show_analytics(self):
         self.app.clear_frame()
-        self.app.current_frame = AnalyticsFrame(self.app.root, self.app, self)
+        self.app.current_frame = self.app.frame_class("analytics")(
+            self.app.root, self.app, self
+        )
         self.app.current_frame.pack(fill="both", expand=True)
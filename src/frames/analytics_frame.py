@@ -1,9 +1,24 @@
 import tkinter as tk
 from tkinter import ttk
 
+COLUMNS = ("Topic", "Users", "Attempts", "Mean", "Median", "P90", "Pass", "Scores")
+BARS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(histogram):
+    """One bar character per histogram bin, scaled to the fullest bin."""
+    peak = max(histogram)
+    if not peak:
+        return ""
+    return "".join(
+        BARS[round(count / peak * (len(BARS) - 1))] if count else " "
+        for count in histogram
+    )
+
 
 class AnalyticsFrame(tk.Frame):
-    """Frame for displaying analytics."""
+    """Frame for displaying analytics. Ctrl+Shift+D opens the diagnostics
+    panel."""
 
     def __init__(self, parent, app, parent_frame):
         super().__init__(parent)
@@ -29,38 +44,40 @@ class AnalyticsFrame(tk.Frame):
         metrics_frame = tk.Frame(main_frame, bg="#f0f0f0")
         metrics_frame.pack(pady=10)
 
-        analytics = self.app.data_manager.get_analytics()
-        tk.Label(
+        self.total_users_label = tk.Label(
             metrics_frame,
-            text=f"Total Users: {analytics['total_users']}",
+            text="Total Users: ...",
             font=("Arial", 12),
             bg="#f0f0f0",
             fg="#333333",
             width=15,
             anchor="center",
-        ).grid(row=0, column=0, padx=10, pady=5)
-        tk.Label(
+        )
+        self.total_users_label.grid(row=0, column=0, padx=10, pady=5)
+        self.total_topics_label = tk.Label(
             metrics_frame,
-            text=f"Total Topics: {analytics['total_topics']}",
+            text="Total Topics: ...",
             font=("Arial", 12),
             bg="#f0f0f0",
             fg="#333333",
             width=15,
             anchor="center",
-        ).grid(row=0, column=1, padx=10, pady=5)
-        tk.Label(
+        )
+        self.total_topics_label.grid(row=0, column=1, padx=10, pady=5)
+        self.active_users_label = tk.Label(
             metrics_frame,
-            text=f"Active User: {analytics['users_took_quizzes']}",
+            text="Active User: ...",
             font=("Arial", 12),
             bg="#f0f0f0",
             fg="#333333",
             width=15,
             anchor="center",
-        ).grid(row=0, column=2, padx=10, pady=5)
+        )
+        self.active_users_label.grid(row=0, column=2, padx=10, pady=5)
 
         tk.Label(
             main_frame,
-            text="Per-Topic Activity:",
+            text="Per-Topic Activity (scores in %, pass at 50%):",
             font=("Arial", 12, "bold"),
             bg="#f0f0f0",
             fg="#333333",
@@ -69,20 +86,23 @@ class AnalyticsFrame(tk.Frame):
         tree_frame.pack(pady=10, fill="x")
         self.tree = ttk.Treeview(
             tree_frame,
-            columns=("Topic", "Users"),
+            columns=COLUMNS,
             show="headings",
             height=10,
         )
-        self.tree.heading("Topic", text="Topic")
-        self.tree.heading("Users", text="Users")
-        self.tree.column("Topic", anchor="center", width=200)
-        self.tree.column("Users", anchor="center", width=100)
+        for column, width in zip(COLUMNS, (150, 60, 70, 60, 60, 60, 60, 110)):
+            self.tree.heading(column, text=column)
+            self.tree.column(column, anchor="center", width=width)
         self.tree.pack(fill="x", padx=20)
 
-        for topic, count in analytics["per_topic_activity"].items():
-            self.tree.insert(
-                "", tk.END, values=(topic.replace("_", " ").title(), count)
-            )
+        self.status_label = tk.Label(
+            main_frame,
+            text="Loading analytics...",
+            font=("Arial", 10),
+            bg="#f0f0f0",
+            fg="#666666",
+        )
+        self.status_label.pack()
 
         # Back button
         tk.Button(
@@ -97,6 +117,47 @@ class AnalyticsFrame(tk.Frame):
             pady=5,
         ).pack(pady=20)
 
+        self.app.root.bind("<Control-Shift-D>", self.show_diagnostics)
+        self.app.io.then(self.app.io.get_analytics(), self.show_analytics, self)
+
+    def show_analytics(self, analytics):
+        self.status_label.configure(text="")
+        self.total_users_label.configure(
+            text=f"Total Users: {analytics['total_users']}"
+        )
+        self.total_topics_label.configure(
+            text=f"Total Topics: {analytics['total_topics']}"
+        )
+        self.active_users_label.configure(
+            text=f"Active User: {analytics['users_took_quizzes']}"
+        )
+        for topic, count in analytics["per_topic_activity"].items():
+            stats = analytics["per_topic_stats"].get(topic)
+            if not stats or not stats["attempts"]:
+                values = (count, 0, "", "", "", "", "")
+            else:
+                values = (
+                    count,
+                    stats["attempts"],
+                    f"{stats['mean']:.1f}",
+                    f"{stats['median']:.1f}",
+                    f"{stats['p90']:.1f}",
+                    f"{stats['pass_rate'] * 100:.0f}%",
+                    sparkline(stats["histogram"]),
+                )
+            self.tree.insert(
+                "", tk.END, values=(topic.replace("_", " ").title(), *values)
+            )
+
+    def show_diagnostics(self, event=None):
+        if self.app.current_frame is not self:
+            return
+        self.app.clear_frame()
+        self.app.current_frame = self.app.frame_class("diagnostics")(
+            self.app.root, self.app, self
+        )
+        self.app.current_frame.pack(fill="both", expand=True)
+
     def back(self):
         self.app.clear_frame()
         self.app.current_frame = self.parent_frame
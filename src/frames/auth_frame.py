@@ -75,13 +75,28 @@ class AuthFrame(tk.Frame):
         )
         register_button.pack(side="left", padx=10)
 
+        self.status_label = tk.Label(
+            main_frame,
+            text="",
+            font=("Arial", 10),
+            bg="#f0f0f0",
+            fg="#666666",
+        )
+        self.status_label.grid(row=6, column=0, columnspan=2)
+
     def login(self):
         username = self.username_entry.get().strip()
         password = self.password_entry.get().strip()
         if not username or not password:
             messagebox.showerror("Error", "Username and password cannot be empty")
             return
-        self.app.login(username, password)
+        self.status_label.configure(text="Signing in...")
+        self.app.io.then(
+            self.app.login(username, password),
+            lambda user: self.status_label.configure(text=""),
+            self,
+            on_error=lambda error: self.status_label.configure(text=""),
+        )
 
     def register(self):
         username = self.username_entry.get().strip()
@@ -89,7 +104,17 @@ class AuthFrame(tk.Frame):
         if not username or not password:
             messagebox.showerror("Error", "Username and password cannot be empty")
             return
-        if self.app.register(username, password):
-            messagebox.showinfo("Success", "Registration successful! Please login.")
+        self.status_label.configure(text="Registering...")
+        self.app.io.then(
+            self.app.register(username, password),
+            self.on_registered,
+            self,
+            on_error=lambda error: self.status_label.configure(text=""),
+        )
         self.username_entry.delete(0, tk.END)
-        self.password_entry.delete(0, tk.END)
\ No newline at end of file
+        self.password_entry.delete(0, tk.END)
+
+    def on_registered(self, registered: bool):
+        self.status_label.configure(text="")
+        if registered:
+            messagebox.showinfo("Success", "Registration successful! Please login.")
@@ -1,15 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import os
 
 
 class DeleteQuestionFrame(tk.Frame):
-    """Frame for deleting a question."""
+    """Frame for deleting questions. Several rows can be selected with
+    Ctrl/Shift-click and are deleted together."""
 
     def __init__(self, parent, app, parent_frame):
         super().__init__(parent)
         self.app = app
         self.parent_frame = parent_frame
+        self.loaded_topic = None
         self.configure(bg="#f0f0f0")
         self.setup_ui()
 
@@ -49,7 +50,7 @@ class DeleteQuestionFrame(tk.Frame):
         topic_combo.pack(pady=5)
 
         # Load Questions Button
-        tk.Button(
+        self.load_button = tk.Button(
             main_frame,
             text="Load Questions",
             command=self.load_questions,
@@ -59,7 +60,8 @@ class DeleteQuestionFrame(tk.Frame):
             width=10,
             padx=10,
             pady=5,
-        ).pack(pady=10)
+        )
+        self.load_button.pack(pady=10)
 
         # Treeview for questions
         tree_frame = tk.Frame(main_frame, bg="#f0f0f0")
@@ -69,6 +71,7 @@ class DeleteQuestionFrame(tk.Frame):
             columns=("ID", "Question"),
             show="headings",
             style="Treeview",
+            selectmode="extended",
             height=10,
         )
         self.tree.heading("ID", text="ID")
@@ -79,7 +82,7 @@ class DeleteQuestionFrame(tk.Frame):
 
         button_frame = tk.Frame(main_frame, bg="#f0f0f0")
         button_frame.pack(pady=20)
-        tk.Button(
+        self.delete_button = tk.Button(
             button_frame,
             text="Delete Selected",
             command=self.delete_question,
@@ -89,7 +92,8 @@ class DeleteQuestionFrame(tk.Frame):
             width=15,
             padx=10,
             pady=5,
-        ).pack(side="left", padx=10)
+        )
+        self.delete_button.pack(side="left", padx=10)
         tk.Button(
             button_frame,
             text="Back",
@@ -109,24 +113,57 @@ class DeleteQuestionFrame(tk.Frame):
         if not topic:
             messagebox.showerror("Error", "Please select a topic")
             return
-        questions = self.app.data_manager.load_questions(topic)
-        if questions:
-            quiz_data = self.app.data_manager.load_json_file(
-                os.path.join(self.app.data_manager.data_dir, f"{topic}.json")
-            )
-            for qid, q in quiz_data.items():
-                self.tree.insert("", tk.END, values=(qid, q["question"]))
+        self.loaded_topic = topic
+        self.set_busy(True)
+        self.app.io.then(
+            self.app.io.load_quiz(topic),
+            self.show_questions,
+            self,
+            on_error=lambda error: self.set_busy(False),
+        )
+
+    def show_questions(self, quiz):
+        self.set_busy(False)
+        if quiz:
+            for qid, q in quiz.root.items():
+                self.tree.insert("", tk.END, iid=qid, values=(qid, q.question))
+
+    def set_busy(self, busy: bool):
+        """Disable loading and deleting while a call for this frame runs."""
+        state = "disabled" if busy else "normal"
+        self.load_button.configure(state=state)
+        self.delete_button.configure(state=state)
 
     def delete_question(self):
         selected = self.tree.selection()
         if not selected:
             messagebox.showerror("Error", "Please select a question to delete")
             return
-        topic = self.topic_var.get().lower().replace(" ", "_")
-        qid = self.tree.item(selected[0])["values"][0]
-        if self.app.data_manager.delete_question(topic, qid):
-            messagebox.showinfo("Success", f"Question {qid} deleted")
-            self.load_questions()
+        if len(selected) > 1 and not messagebox.askyesno(
+            "Confirm", f"Delete {len(selected)} questions?"
+        ):
+            return
+        # Row ids are the question ids of the topic the tree was loaded for.
+        topic = self.loaded_topic
+        question_ids = list(selected)
+
+        def deleted(success):
+            self.set_busy(False)
+            if not success:
+                return
+            self.tree.delete(*[qid for qid in question_ids if self.tree.exists(qid)])
+            if len(question_ids) == 1:
+                messagebox.showinfo("Success", f"Question {question_ids[0]} deleted")
+            else:
+                messagebox.showinfo("Success", f"{len(question_ids)} questions deleted")
+
+        self.set_busy(True)
+        self.app.io.then(
+            self.app.io.delete_questions(topic, question_ids),
+            deleted,
+            self,
+            on_error=lambda error: self.set_busy(False),
+        )
 
     def back(self):
         self.app.clear_frame()
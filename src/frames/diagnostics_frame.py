@@ -0,0 +1,181 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+
+def format_ms(seconds):
+    if seconds is None:
+        return ""
+    if seconds == float("inf"):
+        return "> 10 s"
+    return f"{seconds * 1000:.2f}"
+
+
+class DiagnosticsFrame(tk.Frame):
+    """Hidden admin panel with DataManager call and file I/O metrics. Opened
+    with Ctrl+Shift+D from the analytics screen."""
+
+    def __init__(self, parent, app, parent_frame):
+        super().__init__(parent)
+        self.app = app
+        self.parent_frame = parent_frame
+        self.metrics = app.data_manager.metrics
+        self.configure(bg="#f0f0f0")
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.pack(fill="both", expand=True)
+
+        main_frame = tk.Frame(self, bg="#f0f0f0")
+        main_frame.pack(expand=True)
+
+        tk.Label(
+            main_frame,
+            text="Diagnostics",
+            font=("Arial", 24, "bold"),
+            bg="#f0f0f0",
+            fg="#333333",
+        ).pack(pady=(20, 10))
+
+        self.status_label = tk.Label(
+            main_frame,
+            text="",
+            font=("Arial", 10),
+            bg="#f0f0f0",
+            fg="#666666",
+        )
+        self.status_label.pack()
+
+        tk.Label(
+            main_frame,
+            text="Calls (p50/p95 are histogram bucket bounds):",
+            font=("Arial", 12, "bold"),
+            bg="#f0f0f0",
+            fg="#333333",
+        ).pack(pady=(10, 5))
+        self.calls_tree = ttk.Treeview(
+            main_frame,
+            columns=("Method", "Calls", "Total", "P50", "P95"),
+            show="headings",
+            height=8,
+        )
+        for column, text, width in (
+            ("Method", "Method", 200),
+            ("Calls", "Calls", 80),
+            ("Total", "Total (ms)", 110),
+            ("P50", "p50 (ms)", 100),
+            ("P95", "p95 (ms)", 100),
+        ):
+            self.calls_tree.heading(column, text=text)
+            self.calls_tree.column(column, anchor="center", width=width)
+        self.calls_tree.pack(fill="x", padx=20)
+
+        tk.Label(
+            main_frame,
+            text="File I/O:",
+            font=("Arial", 12, "bold"),
+            bg="#f0f0f0",
+            fg="#333333",
+        ).pack(pady=(10, 5))
+        self.io_tree = ttk.Treeview(
+            main_frame,
+            columns=("File", "Phase", "Count", "Total", "Bytes"),
+            show="headings",
+            height=8,
+        )
+        for column, text, width in (
+            ("File", "File", 200),
+            ("Phase", "Phase", 90),
+            ("Count", "Count", 80),
+            ("Total", "Total (ms)", 110),
+            ("Bytes", "Bytes", 110),
+        ):
+            self.io_tree.heading(column, text=text)
+            self.io_tree.column(column, anchor="center", width=width)
+        self.io_tree.pack(fill="x", padx=20)
+
+        button_frame = tk.Frame(main_frame, bg="#f0f0f0")
+        button_frame.pack(pady=20)
+        for text, command, color in (
+            ("Refresh", self.refresh, "#4CAF50"),
+            ("Export...", self.export, "#FF9800"),
+            ("Reset", self.reset, "#F44336"),
+            ("Back", self.back, "#2196F3"),
+        ):
+            tk.Button(
+                button_frame,
+                text=text,
+                command=command,
+                font=("Arial", 12),
+                bg=color,
+                fg="white",
+                width=10,
+                padx=10,
+                pady=5,
+            ).pack(side="left", padx=5)
+
+        self.refresh()
+
+    def refresh(self):
+        for tree in (self.calls_tree, self.io_tree):
+            tree.delete(*tree.get_children())
+        if self.metrics is None:
+            self.status_label.configure(
+                text="Instrumentation is off. Start the app with QUIZ_APP_METRICS=1."
+            )
+            return
+        snapshot = self.metrics.snapshot()
+        for row in snapshot["calls"]:
+            self.calls_tree.insert(
+                "",
+                tk.END,
+                values=(
+                    row["method"],
+                    row["count"],
+                    format_ms(row["total"]),
+                    format_ms(row["p50"]),
+                    format_ms(row["p95"]),
+                ),
+            )
+        for row in snapshot["phases"]:
+            self.io_tree.insert(
+                "",
+                tk.END,
+                values=(
+                    row["file"],
+                    row["phase"],
+                    row["count"],
+                    format_ms(row["total"]),
+                    "" if row["bytes"] is None else row["bytes"],
+                ),
+            )
+        stats = self.app.data_manager.cache_stats()
+        self.status_label.configure(
+            text=f"Model cache: {stats['hits']} hits, {stats['misses']} misses,"
+            f" {stats['entries']}/{stats['size']} entries"
+        )
+
+    def export(self):
+        if self.metrics is None:
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export Metrics",
+            defaultextension=".prom",
+            filetypes=[("Prometheus text", "*.prom"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            self.metrics.write_prometheus(path)
+            messagebox.showinfo("Success", f"Metrics written to {path}")
+        except OSError as e:
+            messagebox.showerror("Error", f"Error writing {path}: {str(e)}")
+
+    def reset(self):
+        if self.metrics is not None:
+            self.metrics.reset()
+        self.refresh()
+
+    def back(self):
+        self.app.clear_frame()
+        self.app.current_frame = self.parent_frame
+        self.app.current_frame.pack(fill="both", expand=True)
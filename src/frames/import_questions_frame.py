@@ -0,0 +1,180 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from question_import import read_rows
+
+FROM_FILE = "From File"
+
+
+class ImportQuestionsFrame(tk.Frame):
+    """Frame for importing questions in bulk from a CSV or JSONL file."""
+
+    def __init__(self, parent, app, parent_frame):
+        super().__init__(parent)
+        self.app = app
+        self.parent_frame = parent_frame
+        self.path = None
+        self.configure(bg="#f0f0f0")
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.pack(fill="both", expand=True)
+
+        main_frame = tk.Frame(self, bg="#f0f0f0")
+        main_frame.pack(expand=True)
+
+        # Title
+        tk.Label(
+            main_frame,
+            text="Import Questions",
+            font=("Arial", 24, "bold"),
+            bg="#f0f0f0",
+            fg="#333333",
+        ).pack(pady=(20, 20))
+
+        tk.Button(
+            main_frame,
+            text="Choose File...",
+            command=self.choose_file,
+            font=("Arial", 10),
+            bg="#FF9800",
+            fg="white",
+            width=15,
+            padx=10,
+            pady=5,
+        ).pack(pady=5)
+        self.file_label = tk.Label(
+            main_frame,
+            text="No file selected (.csv or .jsonl)",
+            font=("Arial", 10),
+            bg="#f0f0f0",
+            fg="#666666",
+        )
+        self.file_label.pack(pady=(0, 10))
+
+        # Topic for rows that do not name one
+        tk.Label(
+            main_frame,
+            text="Default Topic",
+            font=("Arial", 12),
+            bg="#f0f0f0",
+            fg="#333333",
+        ).pack(pady=(0, 5))
+        config = self.app.data_manager.load_config()
+        self.topic_var = tk.StringVar(value=FROM_FILE)
+        ttk.Combobox(
+            main_frame,
+            textvariable=self.topic_var,
+            values=[FROM_FILE] + [t.replace("_", " ").title() for t in config.topics],
+            state="readonly",
+            width=30,
+            font=("Arial", 12),
+        ).pack(pady=5)
+
+        self.status_label = tk.Label(
+            main_frame,
+            text="",
+            font=("Arial", 10),
+            bg="#f0f0f0",
+            fg="#666666",
+        )
+        self.status_label.pack(pady=5)
+
+        # Rows that were skipped
+        tree_frame = tk.Frame(main_frame, bg="#f0f0f0")
+        tree_frame.pack(pady=10, fill="x")
+        self.tree = ttk.Treeview(
+            tree_frame,
+            columns=("Row", "Error"),
+            show="headings",
+            style="Treeview",
+            height=10,
+        )
+        self.tree.heading("Row", text="Row")
+        self.tree.heading("Error", text="Error")
+        self.tree.column("Row", anchor="center", width=80)
+        self.tree.column("Error", anchor="w", width=590)
+        scrollbar = ttk.Scrollbar(
+            tree_frame, orient="vertical", command=self.tree.yview
+        )
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y", padx=(0, 20))
+        self.tree.pack(fill="x", padx=(20, 0))
+
+        button_frame = tk.Frame(main_frame, bg="#f0f0f0")
+        button_frame.pack(pady=20)
+        self.import_button = tk.Button(
+            button_frame,
+            text="Import",
+            command=self.import_questions,
+            font=("Arial", 12),
+            bg="#4CAF50",
+            fg="white",
+            width=15,
+            padx=10,
+            pady=5,
+        )
+        self.import_button.pack(side="left", padx=10)
+        tk.Button(
+            button_frame,
+            text="Back",
+            command=self.back,
+            font=("Arial", 12),
+            bg="#2196F3",
+            fg="white",
+            width=15,
+            padx=10,
+            pady=5,
+        ).pack(side="left", padx=10)
+
+    def choose_file(self):
+        path = filedialog.askopenfilename(
+            title="Import Questions",
+            filetypes=[
+                ("Question files", "*.csv *.jsonl *.ndjson"),
+                ("All files", "*.*"),
+            ],
+        )
+        if path:
+            self.path = path
+            self.file_label.configure(text=path)
+
+    def import_questions(self):
+        if not self.path:
+            messagebox.showerror("Error", "Please choose a file to import")
+            return
+        topic = self.topic_var.get()
+        default_topic = None if topic == FROM_FILE else topic.lower().replace(" ", "_")
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.import_button.configure(state="disabled")
+        self.status_label.configure(text="Importing...")
+        # Reading and validating the file happens on the questions lane ("db"
+        # for single-connection backends).
+        path = self.path
+        future = self.app.io.run(
+            self.app.io.lane("questions"),
+            lambda: self.app.data_manager.import_questions(
+                read_rows(path), default_topic=default_topic
+            ),
+        )
+        self.app.io.then(future, self.show_report, self, on_error=self.import_failed)
+
+    def import_failed(self, error):
+        self.import_button.configure(state="normal")
+        self.status_label.configure(text="Import failed")
+
+    def show_report(self, report):
+        self.import_button.configure(state="normal")
+        if report is None:
+            self.status_label.configure(text="Import failed")
+            return
+        self.status_label.configure(
+            text=f"{report.added_count} questions added, {len(report.errors)} rows skipped"
+        )
+        for row_number, message in report.errors:
+            self.tree.insert("", tk.END, values=(row_number, message))
+
+    def back(self):
+        self.app.clear_frame()
+        self.app.current_frame = self.parent_frame
+        self.app.current_frame.pack(fill="both", expand=True)
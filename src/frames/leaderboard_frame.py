@@ -1,16 +1,25 @@
 import tkinter as tk
-from tkinter import ttk
-from tkinter import messagebox
-from schemas import Result
+from tkinter import ttk, messagebox
 
 
 class LeaderboardFrame(tk.Frame):
-    """Frame for displaying leaderboard."""
+    """Frame for displaying leaderboard.
+
+    The tree is virtualized: it holds one page of reusable rows and the
+    scrollbar spans the whole leaderboard, fetching each page from
+    DataManager as the user scrolls.
+    """
+
+    page_size = 15
 
     def __init__(self, parent, app, parent_frame):
         super().__init__(parent)
         self.app = app
         self.parent_frame = parent_frame
+        self.topic_key = None
+        self.total = 0
+        self.offset = 0
+        self.row_ids = []
         self.configure(bg="#f0f0f0")
         self.setup_ui()
 
@@ -54,21 +63,57 @@ class LeaderboardFrame(tk.Frame):
 
         self.topic_var.trace_add("write", self.on_topic_change)
 
+        self.status_label = tk.Label(
+            main_frame,
+            text="",
+            font=("Arial", 10),
+            bg="#f0f0f0",
+            fg="#666666",
+        )
+        self.status_label.pack()
+        self.pending = None
+
         # Treeview for leaderboard
+        tree_frame = tk.Frame(main_frame, bg="#f0f0f0")
+        tree_frame.pack(fill="both", expand=True, padx=20, pady=10)
         self.tree = ttk.Treeview(
-            main_frame,
-            columns=("Username", "Score", "Percentage"),
+            tree_frame,
+            columns=("Rank", "Username", "Score", "Percentage"),
             show="headings",
             style="Treeview",
+            height=self.page_size,
         )
+        self.tree.heading("Rank", text="Rank")
         self.tree.heading("Username", text="Username")
         self.tree.heading("Score", text="Score")
         self.tree.heading("Percentage", text="Percentage (%)")
 
+        self.tree.column("Rank", anchor="center", width=60)
         self.tree.column("Username", anchor="center", width=150)
         self.tree.column("Score", anchor="center", width=150)
         self.tree.column("Percentage", anchor="center", width=150)
-        self.tree.pack(fill="both", expand=True, padx=20, pady=10)
+        self.scrollbar = ttk.Scrollbar(
+            tree_frame, orient="vertical", command=self.on_scroll
+        )
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.row_ids = [
+            self.tree.insert("", tk.END, values=()) for _ in range(self.page_size)
+        ]
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_mousewheel)
+
+        tk.Button(
+            main_frame,
+            text="Jump to My Rank",
+            command=self.jump_to_my_rank,
+            font=("Arial", 12),
+            bg="#4CAF50",
+            fg="white",
+            width=15,
+            padx=10,
+            pady=5,
+        ).pack(pady=(0, 5))
 
         tk.Button(
             main_frame,
@@ -89,60 +134,99 @@ class LeaderboardFrame(tk.Frame):
         self.show_leaderboard()
 
     def show_leaderboard(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         topic = self.topic_var.get().lower().replace(" ", "_")
-        if topic == "all":
-            result_data = self.app.data_manager.load_json_file(
-                self.app.data_manager.scores_path
+        self.topic_key = None if topic == "all" else topic
+        self.status_label.configure(text="Loading...")
+        future = self.app.io.get_leaderboard_count(self.topic_key)
+        self.pending = future
+        self.app.io.then(future, lambda total: self.on_total(future, total), self)
+
+    def on_total(self, future, total):
+        if future is not self.pending:
+            return
+        self.total = total
+        self.load_page(0)
+
+    def load_page(self, offset, select=None):
+        """Fetch the page starting at offset; a newer request supersedes it."""
+        self.offset = max(0, min(offset, self.total - self.page_size))
+        if self.total:
+            self.scrollbar.set(
+                self.offset / self.total,
+                min(1.0, (self.offset + self.page_size) / self.total),
             )
-            if not result_data:
-                return
-            try:
-                result = Result.model_validate(result_data)
-                aggregated = {}
-                for username, user_data in result.root.items():
-                    best_score = 0
-                    total_questions = 0
-                    for topic_scores in user_data.root.values():
-                        best = max(
-                            topic_scores,
-                            key=lambda x: x.score / x.total if x.total > 0 else 0,
-                            default=None,
-                        )
-                        if best:
-                            best_score += best.score
-                            total_questions += best.total
-                    if total_questions > 0:
-                        aggregated[username] = {
-                            "username": username,
-                            "score": f"{best_score}/{total_questions}",
-                            "percentage": (
-                                (best_score / total_questions * 100)
-                                if total_questions > 0
-                                else 0
-                            ),
-                        }
-                leaderboard = sorted(
-                    aggregated.values(), key=lambda x: x["percentage"], reverse=True
-                )
-            except Exception as e:
-                messagebox.showerror(
-                    "Error", f"Error processing all topics leaderboard: {str(e)}"
-                )
-                return
         else:
-            leaderboard = self.app.data_manager.get_leaderboard(topic)
-        for entry in leaderboard:
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    entry["username"],
-                    entry["score"],
-                    f"{entry['percentage']:.2f}",
-                ),
+            self.scrollbar.set(0, 1)
+        if self.topic_key is None:
+            future = self.app.io.get_overall_leaderboard(self.page_size, self.offset)
+        else:
+            future = self.app.io.get_leaderboard(
+                self.topic_key, self.page_size, self.offset
             )
+        self.pending = future
+        offset = self.offset
+        self.app.io.then(
+            future,
+            lambda leaderboard: self.fill_rows(future, offset, leaderboard, select),
+            self,
+        )
+
+    def fill_rows(self, future, offset, leaderboard, select):
+        """Update the pooled rows in place. The selection belongs to the rows
+        of the previous page, so it is cleared; select (a username) is then
+        selected if it is on this page."""
+        if future is not self.pending:
+            return
+        self.tree.selection_remove(self.tree.selection())
+        for index, iid in enumerate(self.row_ids):
+            if index < len(leaderboard):
+                entry = leaderboard[index]
+                self.tree.item(
+                    iid,
+                    values=(
+                        offset + index + 1,
+                        entry["username"],
+                        entry["score"],
+                        f"{entry['percentage']:.2f}",
+                    ),
+                )
+                self.tree.move(iid, "", index)
+            else:
+                self.tree.detach(iid)
+        self.status_label.configure(text="" if leaderboard else "No scores yet")
+        if select is not None:
+            for index, entry in enumerate(leaderboard):
+                if entry["username"] == select:
+                    self.tree.selection_set(self.row_ids[index])
+                    self.tree.see(self.row_ids[index])
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            offset = round(float(amount) * self.total)
+        else:
+            step = self.page_size if unit == "pages" else 1
+            offset = self.offset + int(amount) * step
+        if offset != self.offset:
+            self.load_page(offset)
+
+    def on_mousewheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.on_scroll("scroll", -3, "units")
+        else:
+            self.on_scroll("scroll", 3, "units")
+        return "break"
+
+    def jump_to_my_rank(self):
+        username = self.app.current_user.username
+        future = self.app.io.get_leaderboard_rank(self.topic_key, username)
+
+        def show_rank(rank):
+            if rank is None:
+                messagebox.showinfo("Info", "You are not on this leaderboard yet")
+                return
+            self.load_page(rank - self.page_size // 2, select=username)
+
+        self.app.io.then(future, show_rank, self)
 
     def back(self):
         if self.parent_frame.__class__.__name__ == "UserFrame":
@@ -1,7 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from frames.add_question_frame import AddQuestionFrame
-from frames.delete_question_frame import DeleteQuestionFrame
 
 class ManageQuestionsFrame(tk.Frame):
     """Frame for adding/deleting questions."""
@@ -52,6 +50,18 @@ class ManageQuestionsFrame(tk.Frame):
             pady=5,
         ).pack(pady=10)
 
+        tk.Button(
+            main_frame,
+            text="Import Questions",
+            command=self.show_import_questions,
+            font=("Arial", 12),
+            bg="#FF9800",
+            fg="white",
+            width=20,
+            padx=10,
+            pady=5,
+        ).pack(pady=10)
+
         tk.Button(
             main_frame,
             text="Back",
@@ -66,12 +76,23 @@ class ManageQuestionsFrame(tk.Frame):
 
     def show_add_question(self):
         self.app.clear_frame()
-        self.app.current_frame = AddQuestionFrame(self.app.root, self.app, self)
+        self.app.current_frame = self.app.frame_class("add_question")(
+            self.app.root, self.app, self
+        )
         self.app.current_frame.pack(fill="both", expand=True)
 
     def show_delete_question(self):
         self.app.clear_frame()
-        self.app.current_frame = DeleteQuestionFrame(self.app.root, self.app, self)
+        self.app.current_frame = self.app.frame_class("delete_question")(
+            self.app.root, self.app, self
+        )
+        self.app.current_frame.pack(fill="both", expand=True)
+
+    def show_import_questions(self):
+        self.app.clear_frame()
+        self.app.current_frame = self.app.frame_class("import_questions")(
+            self.app.root, self.app, self
+        )
         self.app.current_frame.pack(fill="both", expand=True)
 
     def back(self):
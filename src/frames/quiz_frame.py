@@ -13,6 +13,11 @@ class QuizFrame(tk.Frame):
         self.current_question = 0
         self.score = 0
         self.selected_answer = tk.StringVar()
+        # Question and result views are built once and updated in place.
+        self.topic_view = None
+        self.question_view = None
+        self.option_buttons = []
+        self.results_view = None
         self.configure(bg="#f0f0f0")
         self.setup_ui()
 
@@ -22,10 +27,12 @@ class QuizFrame(tk.Frame):
             self.app.show_auth_frame()
             return
 
+        self.quiz_length = config.questionsPerQuiz
         self.pack(fill="both", expand=True)
 
         main_frame = tk.Frame(self, bg="#f0f0f0")
         main_frame.pack(expand=True)
+        self.topic_view = main_frame
 
         # Title
         tk.Label(
@@ -52,8 +59,10 @@ class QuizFrame(tk.Frame):
             font=("Arial", 12),
         )
         topic_combo.pack(pady=5)
+        # Start loading as soon as a topic is picked, before "Start Quiz".
+        self.topic_var.trace_add("write", self.on_topic_change)
 
-        tk.Button(
+        self.start_button = tk.Button(
             main_frame,
             text="Start Quiz",
             command=self.start_quiz,
@@ -63,7 +72,8 @@ class QuizFrame(tk.Frame):
             width=20,
             padx=10,
             pady=5,
-        ).pack(pady=10)
+        )
+        self.start_button.pack(pady=10)
 
         tk.Button(
             main_frame,
@@ -77,12 +87,27 @@ class QuizFrame(tk.Frame):
             pady=5,
         ).pack(pady=5)
 
+    def on_topic_change(self, *args):
+        topic = self.topic_var.get().lower().replace(" ", "_")
+        if topic:
+            self.app.prefetcher.questions(topic, self.quiz_length)
+
     def start_quiz(self):
         topic = self.topic_var.get().lower().replace(" ", "_")
         if not topic:
             messagebox.showerror("Error", "Please select a topic")
             return
-        self.questions = self.app.data_manager.load_questions(topic)
+        self.start_button.configure(state="disabled")
+        self.app.io.then(
+            self.app.prefetcher.take_questions(topic, self.quiz_length),
+            self.begin_quiz,
+            self,
+            on_error=lambda error: self.start_button.configure(state="normal"),
+        )
+
+    def begin_quiz(self, questions):
+        self.start_button.configure(state="normal")
+        self.questions = questions
         if not self.questions:
             self.back()
             return
@@ -90,45 +115,21 @@ class QuizFrame(tk.Frame):
         self.current_question = 0
         self.show_question()
 
-    def show_question(self):
-        for widget in self.winfo_children():
-            widget.destroy()
-
-        self.pack(fill="both", expand=True)
-
-        main_frame = tk.Frame(self, bg="#f0f0f0")
-        main_frame.pack(expand=True)
-
-        if self.current_question >= len(self.questions):
-            self.show_results()
-            return
-
-        question = self.questions[self.current_question]
-        tk.Label(
-            main_frame,
-            text=f"Question {self.current_question + 1}: {question.question}",
+    def build_question_view(self):
+        self.question_view = tk.Frame(self, bg="#f0f0f0")
+        self.question_label = tk.Label(
+            self.question_view,
             font=("Arial", 14, "bold"),
             bg="#f0f0f0",
             fg="#333333",
             wraplength=700,
-        ).pack(pady=(20, 10))
-
-        self.selected_answer.set(" ")
-        for key in sorted(question.options.keys()):
-            tk.Radiobutton(
-                main_frame,
-                text=question.options[key],
-                variable=self.selected_answer,
-                value=key,
-                font=("Arial", 12),
-                bg="#f0f0f0",
-                fg="#333333",
-                anchor="w",
-                padx=30,
-            ).pack(fill="x", pady=5)
-
+        )
+        self.question_label.pack(pady=(20, 10))
+        self.options_frame = tk.Frame(self.question_view, bg="#f0f0f0")
+        self.options_frame.pack(fill="x")
+        self.options_frame.columnconfigure(0, weight=1)
         tk.Button(
-            main_frame,
+            self.question_view,
             text="Submit",
             command=self.submit_answer,
             font=("Arial", 12),
@@ -139,6 +140,55 @@ class QuizFrame(tk.Frame):
             pady=5,
         ).pack(pady=20)
 
+    def option_button(self, index):
+        """Return the pooled radio button for option slot index, growing the
+        pool to the largest option count seen so far."""
+        while len(self.option_buttons) <= index:
+            self.option_buttons.append(
+                tk.Radiobutton(
+                    self.options_frame,
+                    variable=self.selected_answer,
+                    font=("Arial", 12),
+                    bg="#f0f0f0",
+                    fg="#333333",
+                    anchor="w",
+                    padx=30,
+                )
+            )
+        return self.option_buttons[index]
+
+    def show_view(self, view):
+        for child in (self.topic_view, self.question_view, self.results_view):
+            if child is not None and child is not view:
+                child.pack_forget()
+        if not view.winfo_manager():
+            view.pack(expand=True)
+
+    def show_question(self):
+        self.pack(fill="both", expand=True)
+
+        if self.current_question >= len(self.questions):
+            self.show_results()
+            return
+
+        if self.question_view is None:
+            self.build_question_view()
+        self.show_view(self.question_view)
+
+        question = self.questions[self.current_question]
+        self.question_label.configure(
+            text=f"Question {self.current_question + 1}: {question.question}"
+        )
+
+        self.selected_answer.set(" ")
+        keys = sorted(question.options.keys())
+        for index, key in enumerate(keys):
+            button = self.option_button(index)
+            button.configure(text=question.options[key], value=key)
+            button.grid(row=index, column=0, sticky="ew", pady=5)
+        for button in self.option_buttons[len(keys) :]:
+            button.grid_remove()
+
     def submit_answer(self):
         if not self.selected_answer.get():
             messagebox.showerror("Error", "Please select an answer")
@@ -149,37 +199,24 @@ class QuizFrame(tk.Frame):
         self.current_question += 1
         self.show_question()
 
-    def show_results(self):
-        for widget in self.winfo_children():
-            widget.destroy()
-
-        self.pack(fill="both", expand=True)
-
-        main_frame = tk.Frame(self, bg="#f0f0f0")
-        main_frame.pack(expand=True)
-
-        topic = self.topic_var.get().lower().replace(" ", "_")
-        tk.Label(
-            main_frame,
-            text=f"Your Score: {self.score}/{len(self.questions)}",
+    def build_results_view(self):
+        self.results_view = tk.Frame(self, bg="#f0f0f0")
+        self.score_label = tk.Label(
+            self.results_view,
             font=("Arial", 24, "bold"),
             bg="#f0f0f0",
             fg="#333333",
-        ).pack(pady=(20, 10))
-
-        if self.app.data_manager.save_score(
-            self.app.current_user.username, topic, self.score, len(self.questions)
-        ):
-            tk.Label(
-                main_frame,
-                text="Score saved successfully!",
-                font=("Arial", 12),
-                bg="#f0f0f0",
-                fg="#333333",
-            ).pack(pady=10)
-
+        )
+        self.score_label.pack(pady=(20, 10))
+        self.status_label = tk.Label(
+            self.results_view,
+            font=("Arial", 12),
+            bg="#f0f0f0",
+            fg="#333333",
+        )
+        self.status_label.pack(pady=10)
         tk.Button(
-            main_frame,
+            self.results_view,
             text="Back",
             command=self.back,
             font=("Arial", 12),
@@ -190,5 +227,27 @@ class QuizFrame(tk.Frame):
             pady=5,
         ).pack(pady=20)
 
+    def show_results(self):
+        self.pack(fill="both", expand=True)
+
+        if self.results_view is None:
+            self.build_results_view()
+        self.show_view(self.results_view)
+
+        topic = self.topic_var.get().lower().replace(" ", "_")
+        self.score_label.configure(
+            text=f"Your Score: {self.score}/{len(self.questions)}"
+        )
+        self.status_label.configure(text="Saving score...")
+        self.app.io.then(
+            self.app.io.save_score(
+                self.app.current_user.username, topic, self.score, len(self.questions)
+            ),
+            lambda saved: self.status_label.configure(
+                text="Score saved successfully!" if saved else "Score was not saved"
+            ),
+            self,
+        )
+
     def back(self):
         self.app.show_user_frame()
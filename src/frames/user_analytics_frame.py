@@ -1,11 +1,90 @@
+import base64
+import io
 import tkinter as tk
-from tkinter import ttk, messagebox
-import os
-from datetime import datetime
-import matplotlib.pyplot as plt
+from collections import OrderedDict
+from tkinter import messagebox
+from typing import Dict, List, Tuple
+import numpy as np
 import seaborn as sns
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from schemas import Score
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from records import ScoreRecord
+from score_analytics import lttb
+
+# Longest line drawn per topic; longer histories are averaged per day and,
+# if still too long, downsampled with LTTB.
+MAX_POINTS = 300
+# Lines with at most this many points get a marker per attempt.
+MARKER_POINTS = 50
+MICROSECONDS_PER_DAY = 86_400_000_000
+# Rendered charts (base64 PNG) by username, with the score_version they were
+# drawn at. The least recently shown are dropped beyond CACHED_CHARTS.
+CACHED_CHARTS = 16
+_charts: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+
+sns.set_theme(style="whitegrid", palette="deep")
+
+
+def chart_series(
+    all_scores: Dict[str, List[ScoreRecord]], max_points: int = MAX_POINTS
+) -> List[Tuple[str, np.ndarray, np.ndarray]]:
+    """(label, dates, percentages) per topic in time order, dates being
+    Matplotlib date numbers (days since 1970). Each line has at most
+    max_points points."""
+    series = []
+    for topic, scores in all_scores.items():
+        if not scores:
+            continue
+        # Records sort by timestamp first.
+        rows = np.array(sorted(scores), dtype=np.float64)
+        dates = rows[:, 0] / MICROSECONDS_PER_DAY
+        percentages = np.divide(
+            rows[:, 1] * 100,
+            rows[:, 2],
+            out=np.zeros(len(rows)),
+            where=rows[:, 2] > 0,
+        )
+        if len(dates) > max_points:
+            # Long histories become daily means, then LTTB keeps the shape
+            # of what is still too long.
+            days, index, counts = np.unique(
+                np.floor(dates), return_inverse=True, return_counts=True
+            )
+            dates = days + 0.5
+            percentages = np.bincount(index, weights=percentages) / counts
+            dates, percentages = lttb(dates, percentages, max_points)
+        series.append((topic.replace("_", " ").title(), dates, percentages))
+    return series
+
+
+def render_chart(
+    figure: Figure, series: List[Tuple[str, np.ndarray, np.ndarray]]
+) -> str:
+    """Draw series on the figure's Axes, reusing it, and return the image as
+    base64 PNG for tk.PhotoImage."""
+    ax = figure.axes[0] if figure.axes else figure.add_subplot()
+    ax.clear()
+    for label, dates, percentages in series:
+        ax.plot(
+            dates,
+            percentages,
+            marker="o" if len(dates) <= MARKER_POINTS else None,
+            label=label,
+            linewidth=2,
+        )
+    ax.set_title("Score Progression by Topic", fontsize=12, weight="bold")
+    ax.set_xlabel("Date", fontsize=10)
+    ax.set_ylabel("Score (%)", fontsize=10)
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    ax.set_ylim(0, 100)
+    ax.legend(title="Topics")
+    figure.tight_layout()
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png")
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
 
 
 class UserAnalyticsFrame(tk.Frame):
@@ -16,7 +95,12 @@ class UserAnalyticsFrame(tk.Frame):
         self.app = app
         self.parent_frame = parent_frame
         self.configure(bg="#f0f0f0")
-        self.canvas = None
+        # One off-screen figure per frame, redrawn in place. It is not
+        # registered with pyplot, so dropping it frees it.
+        self.figure = Figure(figsize=(8, 4), dpi=100)
+        FigureCanvasAgg(self.figure)
+        self.image = None
+        self.username = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -56,77 +140,67 @@ class UserAnalyticsFrame(tk.Frame):
         for widget in self.chart_frame.winfo_children():
             widget.destroy()
 
-        username = self.app.current_user.username
-        all_scores = self.app.data_manager.get_user_scores(username)
+        tk.Label(
+            self.chart_frame,
+            text="Loading scores...",
+            font=("Arial", 12),
+            bg="#f0f0f0",
+            fg="#666666",
+        ).pack(pady=20)
+        self.username = self.app.current_user.username
+        self.app.io.then(
+            self.app.io.score_version(self.username), self.check_cache, self
+        )
+
+    def check_cache(self, version):
+        cached = _charts.get(self.username)
+        if cached is not None and cached[0] == version:
+            _charts.move_to_end(self.username)
+            self.show_image(cached[1])
+            return
+        self.app.io.then(
+            self.app.io.get_user_scores(self.username),
+            lambda all_scores: self.show_scores(all_scores, version),
+            self,
+        )
+
+    def show_scores(self, all_scores, version):
         if not all_scores:
+            for widget in self.chart_frame.winfo_children():
+                widget.destroy()
             messagebox.showinfo("Info", "No score data available")
             self.back()
             return
-
-        for topic, scores in all_scores.items():
-            for score in scores:
-                if isinstance(score, dict):
-                    score["timestamp"] = datetime.fromisoformat(score["timestamp"])
-                elif isinstance(score, Score):
-                    score.timestamp = datetime.fromisoformat(score.timestamp)
-
-        self.draw_chart(all_scores)
-
-    def draw_chart(self, all_scores):
-        sns.set_theme(style="whitegrid", palette="deep")
-
-        fig, ax = plt.subplots(figsize=(8, 4))
-
-        all_timestamps = set()
-        for scores in all_scores.values():
-            all_timestamps.update(
-                s["timestamp"] if isinstance(s, dict) else s.timestamp for s in scores
-            )
-        timestamps = sorted(list(all_timestamps))
-        if not timestamps:
-            return
-
-        for topic, scores in all_scores.items():
-            scores.sort(
-                key=lambda x: x["timestamp"] if isinstance(x, dict) else x.timestamp
-            )
-            score_dict = {
-                (s["timestamp"] if isinstance(s, dict) else s.timestamp): (
-                    (s["score"] / s["total"] * 100)
-                    if isinstance(s, dict)
-                    else (s.score / s.total * 100)
-                )
-                for s in scores
-            }
-            percentages = [score_dict.get(ts, None) for ts in timestamps]
-            sns.lineplot(
-                x=range(len(timestamps)),
-                y=percentages,
-                ax=ax,
-                marker="o",
-                label=topic.replace("_", " ").title(),
-                linewidth=2,
-            )
-
-        ax.set_title("Score Progression by Topic", fontsize=12, weight="bold")
-        ax.set_xlabel("Quiz Attempts", fontsize=10)
-        ax.set_ylabel("Score (%)", fontsize=10)
-        ax.set_xticks(range(len(timestamps)))
-        ax.set_xticklabels(
-            [ts.strftime("%Y-%m-%d") for ts in timestamps],
+        figure = self.figure
+        self.app.io.then(
+            self.app.io.run(
+                "charts", lambda: render_chart(figure, chart_series(all_scores))
+            ),
+            lambda image: self.show_chart(image, version),
+            self,
         )
-        ax.set_ylim(0, 100)
-        ax.legend(title="Topics")
-
-        plt.tight_layout()
 
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+    def show_chart(self, image, version):
+        _charts[self.username] = (version, image)
+        _charts.move_to_end(self.username)
+        while len(_charts) > CACHED_CHARTS:
+            _charts.popitem(last=False)
+        self.show_image(image)
 
-        self.canvas = canvas
+    def show_image(self, image):
+        for widget in self.chart_frame.winfo_children():
+            widget.destroy()
+        self.image = tk.PhotoImage(data=image)
+        tk.Label(self.chart_frame, image=self.image, bg="#f0f0f0").pack(
+            fill="both", expand=True
+        )
 
     def back(self):
         self.app.clear_frame()
         self.app.current_frame = self.parent_frame
         self.app.current_frame.pack(fill="both", expand=True)
+        # Every visit builds a new frame; release this one and its figure. A
+        # render still running keeps its own reference until it finishes.
+        self.figure = None
+        self.image = None
+        self.destroy()
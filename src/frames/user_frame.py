@@ -1,7 +1,4 @@
 import tkinter as tk
-from frames.quiz_frame import QuizFrame
-from frames.leaderboard_frame import LeaderboardFrame
-from frames.user_analytics_frame import UserAnalyticsFrame
 
 class UserFrame(tk.Frame):
     """Frame for user functionalities."""
@@ -76,15 +73,21 @@ class UserFrame(tk.Frame):
 
     def show_quiz(self):
         self.app.clear_frame()
-        self.app.current_frame = QuizFrame(self.app.root, self.app, self)
+        self.app.current_frame = self.app.frame_class("quiz")(
+            self.app.root, self.app, self
+        )
         self.app.current_frame.pack(fill="both", expand=True)
 
     def show_leaderboard(self):
         self.app.clear_frame()
-        self.app.current_frame = LeaderboardFrame(self.app.root, self.app, self)
+        self.app.current_frame = self.app.frame_class("leaderboard")(
+            self.app.root, self.app, self
+        )
         self.app.current_frame.pack(fill="both", expand=True)
     
     def show_analytics(self):
         self.app.clear_frame()
-        self.app.current_frame = UserAnalyticsFrame(self.app.root, self.app, self)
+        self.app.current_frame = self.app.frame_class("user_analytics")(
+            self.app.root, self.app, self
+        )
         self.app.current_frame.pack(fill="both", expand=True)
@@ -0,0 +1,150 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from records import ScoreRecord
+from schemas import Result
+
+
+class LeaderboardIndex:
+    """Each user's best attempt per topic, kept sorted by percentage.
+
+    Entries are ordered by percentage (highest first), then by the order in
+    which users first appear in the scores, which is the order a full
+    recomputation over scores.json produces. Lookups use bisect on a sorted
+    list of keys, so updates and rank queries cost a binary search plus a
+    list insert.
+
+    The "all topics" view lives under the topic None: per user, the sum of
+    their best scores and the sum of those attempts' totals, adjusted by the
+    difference whenever a topic best changes.
+    """
+
+    def __init__(self):
+        self._user_order: Dict[str, int] = {}
+        # topic (None for all topics) -> username -> (key, score, total)
+        self._best: Dict[Optional[str], Dict[str, tuple]] = {None: {}}
+        # topic -> sorted keys of (-percentage, user order, username)
+        self._sorted: Dict[Optional[str], List[tuple]] = {None: []}
+
+    @classmethod
+    def from_result(cls, result: Optional[Result]) -> "LeaderboardIndex":
+        if result is None:
+            return cls()
+        return cls.from_users(
+            (username, user.root) for username, user in result.root.items()
+        )
+
+    @classmethod
+    def from_users(
+        cls, users: Iterable[Tuple[str, Mapping[str, List[ScoreRecord]]]]
+    ) -> "LeaderboardIndex":
+        """Build from (username, {topic: scores}) pairs in the order users
+        first took a quiz, e.g. ScoreTable.items(). Only one user's scores
+        need to be in memory at a time."""
+        index = cls()
+        for username, user_data in users:
+            index._user_order.setdefault(username, len(index._user_order))
+            for topic, scores in user_data.items():
+                for score in scores:
+                    index._update_best(username, topic, score, keep_sorted=False)
+        for topic, best in index._best.items():
+            index._sorted[topic] = sorted(
+                entry[0] for entry in best.values() if topic is not None or entry[2] > 0
+            )
+        return index
+
+    @staticmethod
+    def _ratio(score: int, total: int) -> float:
+        return score / total if total > 0 else 0
+
+    def _update_best(
+        self,
+        username: str,
+        topic: str,
+        score: ScoreRecord,
+        keep_sorted: bool = True,
+    ) -> bool:
+        best = self._best.setdefault(topic, {})
+        current = best.get(username)
+        if current is not None and self._ratio(score.score, score.total) <= self._ratio(
+            current[1], current[2]
+        ):
+            return False
+        old_score, old_total = (current[1], current[2]) if current else (0, 0)
+        self._set_entry(topic, username, score.score, score.total, keep_sorted)
+        overall = self._best[None].get(username)
+        self._set_entry(
+            None,
+            username,
+            (overall[1] if overall else 0) + score.score - old_score,
+            (overall[2] if overall else 0) + score.total - old_total,
+            keep_sorted,
+        )
+        return True
+
+    def _set_entry(
+        self,
+        topic: Optional[str],
+        username: str,
+        score: int,
+        total: int,
+        keep_sorted: bool,
+    ) -> None:
+        best = self._best.setdefault(topic, {})
+        current = best.get(username)
+        percentage = (score / total * 100) if total > 0 else 0
+        key = (-percentage, self._user_order[username], username)
+        best[username] = (key, score, total)
+        if keep_sorted:
+            keys = self._sorted.setdefault(topic, [])
+            # The aggregate only lists users with a positive total.
+            if current is not None and (topic is not None or current[2] > 0):
+                del keys[bisect_left(keys, current[0])]
+            if topic is not None or total > 0:
+                insort(keys, key)
+
+    def record(self, username: str, topic: str, score: ScoreRecord) -> bool:
+        """Account for a new attempt. Returns True if it became the user's
+        best for the topic."""
+        self._user_order.setdefault(username, len(self._user_order))
+        return self._update_best(username, topic, score)
+
+    def best(self, username: str, topic: Optional[str]) -> Optional[Dict]:
+        entry = self._best.get(topic, {}).get(username)
+        return self._entry(topic, username, entry) if entry else None
+
+    def count(self, topic: Optional[str]) -> int:
+        return len(self._sorted.get(topic, ()))
+
+    def rank(self, topic: Optional[str], username: str) -> Optional[int]:
+        """Zero-based position of username in the topic leaderboard."""
+        entry = self._best.get(topic, {}).get(username)
+        if entry is None or (topic is None and entry[2] <= 0):
+            return None
+        return bisect_left(self._sorted[topic], entry[0])
+
+    def page(
+        self, topic: Optional[str], offset: int = 0, limit: Optional[int] = None
+    ) -> List[Dict]:
+        keys = self._sorted.get(topic, [])
+        end = None if limit is None else offset + limit
+        best = self._best.get(topic, {})
+        return [self._entry(topic, key[2], best[key[2]]) for key in keys[offset:end]]
+
+    def top(self, topic: Optional[str], k: int) -> List[Dict]:
+        return self.page(topic, 0, k)
+
+    @staticmethod
+    def _entry(topic: Optional[str], username: str, entry: tuple) -> Dict:
+        key, score, total = entry
+        if topic is None:
+            return {
+                "username": username,
+                "score": f"{score}/{total}",
+                "percentage": -key[0],
+            }
+        return {
+            "username": username,
+            "score": score,
+            "total": total,
+            "percentage": -key[0],
+        }
@@ -0,0 +1,205 @@
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" labels).
+BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Phases that move bytes, and the direction they are counted under.
+IO_DIRECTIONS = {"read": "read", "write": "written"}
+
+# Public DataManager methods that are not worth timing.
+NOT_INSTRUMENTED = {"show_error", "cache_stats", "clear_cache", "close"}
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given quantile; inf if it
+        falls past the last bucket."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Thread-safe call and file I/O metrics for an instrumented DataManager.
+
+    Records a latency histogram per public method, a histogram per (file,
+    phase) where phase is one of lock, read, parse, validate, serialize and
+    write, and bytes read and written per file. "lock" is the time spent
+    waiting for another writer's file lock. Files are labelled by base name.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: Dict[str, Histogram] = {}
+        self.phases: Dict[Tuple[str, str], Histogram] = {}
+        self.bytes: Dict[Tuple[str, str], int] = {}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.phases.clear()
+            self.bytes.clear()
+
+    def observe_call(self, method: str, seconds: float) -> None:
+        with self._lock:
+            self.calls.setdefault(method, Histogram()).observe(seconds)
+
+    def observe_phase(self, file_path: str, phase: str, seconds: float) -> None:
+        key = (os.path.basename(file_path), phase)
+        with self._lock:
+            self.phases.setdefault(key, Histogram()).observe(seconds)
+
+    def add_bytes(self, file_path: str, direction: str, count: int) -> None:
+        key = (os.path.basename(file_path), direction)
+        with self._lock:
+            self.bytes[key] = self.bytes.get(key, 0) + count
+
+    @contextmanager
+    def phase(self, file_path: str, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_phase(file_path, phase, time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, List[Dict]]:
+        """Plain rows for display: per-method calls and per-file phases."""
+        with self._lock:
+            calls = [
+                {
+                    "method": method,
+                    "count": h.count,
+                    "total": h.sum,
+                    "p50": h.quantile(0.5),
+                    "p95": h.quantile(0.95),
+                }
+                for method, h in sorted(self.calls.items())
+            ]
+            phases = [
+                {
+                    "file": file,
+                    "phase": phase,
+                    "count": h.count,
+                    "total": h.sum,
+                    "bytes": (
+                        self.bytes.get((file, IO_DIRECTIONS[phase]), 0)
+                        if phase in IO_DIRECTIONS
+                        else None
+                    ),
+                }
+                for (file, phase), h in sorted(self.phases.items())
+            ]
+        return {"calls": calls, "phases": phases}
+
+    def to_prometheus(self) -> str:
+        lines = []
+
+        def histogram(name: str, help_text: str, series) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, h in series:
+                cumulative = 0
+                for bound, count in zip(BUCKETS, h.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {h.count}')
+                lines.append(f"{name}_sum{{{labels}}} {h.sum}")
+                lines.append(f"{name}_count{{{labels}}} {h.count}")
+
+        with self._lock:
+            histogram(
+                "quiz_data_manager_call_seconds",
+                "Latency of DataManager calls.",
+                [(f'method="{_label(m)}"', h) for m, h in sorted(self.calls.items())],
+            )
+            histogram(
+                "quiz_file_phase_seconds",
+                "Time spent per file waiting for its lock and in read, parse, validate, serialize and write.",
+                [
+                    (f'file="{_label(f)}",phase="{p}"', h)
+                    for (f, p), h in sorted(self.phases.items())
+                ],
+            )
+            lines.append(
+                "# HELP quiz_file_bytes_total Bytes read from and written to files."
+            )
+            lines.append("# TYPE quiz_file_bytes_total counter")
+            for (file, direction), count in sorted(self.bytes.items()):
+                lines.append(
+                    f'quiz_file_bytes_total{{file="{_label(file)}",direction="{direction}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the text exposition to path atomically, e.g. for the
+        node_exporter textfile collector."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            file.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+
+def _timed(method, name: str, metrics: Metrics):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics.observe_call(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def instrument(obj, metrics: Metrics) -> None:
+    """Time every public method of obj by shadowing it with a wrapper on the
+    instance. Calls made by one method to another are timed separately."""
+    for name in dir(type(obj)):
+        if name.startswith("_") or name in NOT_INSTRUMENTED:
+            continue
+        if callable(getattr(type(obj), name)):
+            setattr(obj, name, _timed(getattr(obj, name), name, metrics))
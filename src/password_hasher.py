@@ -0,0 +1,74 @@
+import math
+import time
+from typing import Optional
+import bcrypt
+
+
+def hash_cost(hashed: str) -> Optional[int]:
+    """Cost factor of a bcrypt hash such as "$2b$12$...", or None."""
+    parts = hashed.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def calibrate_rounds(
+    target_seconds: float = 0.25,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+    probe_rounds: int = 8,
+) -> int:
+    """Pick the largest bcrypt cost whose hash time on this host stays within
+    target_seconds. Each extra round doubles the work, so a single probe at a
+    cheap cost is enough to extrapolate."""
+    salt = bcrypt.gensalt(rounds=probe_rounds)
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", salt)
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    rounds = probe_rounds + math.floor(math.log2(target_seconds / elapsed))
+    return max(min_rounds, min(max_rounds, rounds))
+
+
+class PasswordHasher:
+    """bcrypt hashing with a configurable cost.
+
+    rounds is None until it has been configured or calibrated; in that state
+    new hashes use bcrypt's default cost. Only a configured cost is enforced
+    on stored hashes: a calibrated one is extrapolated from a single timed
+    probe and differs between runs and hosts, so processes sharing a data
+    directory would keep rehashing each other's users. It is used for new
+    hashes only.
+    """
+
+    def __init__(self, rounds: Optional[int] = None):
+        self.rounds = rounds
+        self.configured = rounds is not None
+
+    def calibrate(self, target_seconds: float = 0.25) -> int:
+        self.rounds = calibrate_rounds(target_seconds)
+        return self.rounds
+
+    def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds) if self.rounds else bcrypt.gensalt()
+        return bcrypt.hashpw(password.encode(), salt).decode()
+
+    def check(self, password: str, hashed: str) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode(), hashed.encode())
+        except ValueError:
+            # Not a bcrypt hash.
+            return False
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return self.configured and hash_cost(hashed) != self.rounds
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Suggest a bcrypt cost for a target login latency on this host."
+    )
+    parser.add_argument("--target", type=float, default=0.25, help="seconds")
+    args = parser.parse_args()
+    print(calibrate_rounds(args.target))
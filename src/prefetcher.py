@@ -0,0 +1,139 @@
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Sequence, Tuple
+
+
+def questions_size(questions: Optional[Sequence]) -> int:
+    """Rough bytes held by a loaded quiz."""
+    if not isinstance(questions, list):
+        # Lazy sequences (PackedQuestions) only hold the order of positions.
+        return 0 if questions is None else sys.getsizeof(questions) + 8 * len(questions)
+    size = sys.getsizeof(questions)
+    for q in questions:
+        size += sys.getsizeof(q) + sys.getsizeof(q.question) + sys.getsizeof(q.answer)
+        size += sys.getsizeof(q.options)
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in q.options.items())
+    return size
+
+
+class Prefetcher:
+    """Loads what the dashboard is likely to need next while it is idle.
+
+    After login, start() warms the config, then for the user's most recently
+    played topics a quiz's worth of questions and the leaderboard page and
+    rank LeaderboardFrame asks for first. Leaderboard results are not kept:
+    fetching them builds DataManager's own caches, which stay current as
+    files change. Questions are kept as ready quizzes, each served once by
+    take_questions(), within memory_budget bytes; the oldest are dropped
+    first.
+
+    The walk runs on its own "prefetch" lane and submits one call at a time
+    to the DataManager lanes, so a user's own request waits behind at most
+    one prefetch call.
+    """
+
+    def __init__(
+        self,
+        io,
+        memory_budget: int = 16 * 1024 * 1024,
+        recent_topics: int = 3,
+        page_size: int = 15,
+    ):
+        self.io = io
+        self.memory_budget = memory_budget
+        self.recent_topics = recent_topics
+        # LeaderboardFrame.page_size
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        # (topic, count) -> (future, estimated bytes), oldest first. The size
+        # is 0 until the future completes.
+        self._quizzes: "OrderedDict[Tuple[str, Optional[int]], Tuple[Future, int]]" = (
+            OrderedDict()
+        )
+        self._used = 0
+        # Bumped by start() and stop(); a walk from an older generation stops.
+        self._generation = 0
+
+    def start(self, username: str) -> Future:
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        return self.io.run("prefetch", self._warm, username, generation)
+
+    def stop(self) -> None:
+        """Abandon the current walk and drop every ready quiz, e.g. on logout."""
+        with self._lock:
+            self._generation += 1
+            self._quizzes.clear()
+            self._used = 0
+
+    def _current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def _warm(self, username: str, generation: int) -> None:
+        config = self.io.load_config().result()
+        if not config or not self._current(generation):
+            return
+        scores = self.io.get_user_scores(username).result()
+        recent = sorted(
+            (topic for topic in scores if scores[topic] and topic in config.topics),
+            key=lambda topic: max(s.timestamp for s in scores[topic]),
+            reverse=True,
+        )[: self.recent_topics]
+        for topic in recent:
+            if not self._current(generation):
+                return
+            with self._lock:
+                over_budget = self._used >= self.memory_budget
+            if not over_budget:
+                self.questions(topic, config.questionsPerQuiz).result()
+            self.io.get_leaderboard(topic, self.page_size).result()
+            self.io.get_leaderboard_rank(topic, username).result()
+        if self._current(generation):
+            self.io.get_overall_leaderboard(self.page_size).result()
+
+    def questions(self, topic: str, count: Optional[int] = None) -> Future:
+        """Start loading count questions of topic, unless a load is already
+        ready or running; returns its future."""
+        key = (topic, count)
+        with self._lock:
+            entry = self._quizzes.get(key)
+            if entry is not None:
+                self._quizzes.move_to_end(key)
+                return entry[0]
+            future = self.io.load_questions(topic, count)
+            self._quizzes[key] = (future, 0)
+        future.add_done_callback(lambda done: self._loaded(key, done))
+        return future
+
+    def take_questions(self, topic: str, count: Optional[int] = None) -> Future:
+        """The ready (or running) load for topic, handed over and forgotten so
+        the next quiz draws new questions; a new load if there is none."""
+        future = self.questions(topic, count)
+        with self._lock:
+            entry = self._quizzes.get((topic, count))
+            if entry is not None and entry[0] is future:
+                del self._quizzes[(topic, count)]
+                self._used -= entry[1]
+        return future
+
+    def _loaded(self, key, future: Future) -> None:
+        questions = None if future.exception() else future.result()
+        size = questions_size(questions)
+        with self._lock:
+            entry = self._quizzes.get(key)
+            if entry is None or entry[0] is not future:
+                return
+            if not questions:
+                # Whoever already holds the future sees the failure; the next
+                # request tries again.
+                del self._quizzes[key]
+                return
+            self._quizzes[key] = (future, size)
+            self._used += size
+            # The newest quiz is kept even when it alone is over budget.
+            while self._used > self.memory_budget and len(self._quizzes) > 1:
+                _, (_, dropped) = self._quizzes.popitem(last=False)
+                self._used -= dropped
@@ -0,0 +1,127 @@
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple, Union
+from pydantic import TypeAdapter, ValidationError
+from schemas import Question
+
+# Built once; validating a whole batch in one call keeps the per-row cost in
+# pydantic-core instead of Python.
+QUESTION_LIST = TypeAdapter(List[Question])
+
+Row = Tuple[int, Union[dict, Exception]]
+
+
+@dataclass
+class ImportReport:
+    """Question ids added per topic, and (row number, message) for every row
+    that was skipped."""
+
+    added: Dict[str, List[str]] = field(default_factory=dict)
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def added_count(self) -> int:
+        return sum(len(ids) for ids in self.added.values())
+
+
+def read_csv(path: str) -> Iterator[Row]:
+    """Rows of a CSV file with the columns topic, question, answer and one
+    option_<key> column per option. Empty option cells are left out."""
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            options = {
+                name[len("option_") :]: value.strip()
+                for name, value in row.items()
+                if name and name.startswith("option_") and value and value.strip()
+            }
+            yield reader.line_num, {
+                "topic": (row.get("topic") or "").strip(),
+                "question": (row.get("question") or "").strip(),
+                "options": options,
+                "answer": (row.get("answer") or "").strip(),
+            }
+
+
+def read_jsonl(path: str) -> Iterator[Row]:
+    """Rows of a JSON Lines file, one {"topic", "question", "options",
+    "answer"} object per line. Lines that are not JSON objects are yielded as
+    errors."""
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_number, ValueError(f"Invalid JSON: {e}")
+                continue
+            if not isinstance(row, dict):
+                yield line_number, ValueError("Expected a JSON object")
+                continue
+            yield line_number, row
+
+
+def read_rows(path: str) -> Iterator[Row]:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return read_csv(path)
+    if extension in (".jsonl", ".ndjson"):
+        return read_jsonl(path)
+    raise ValueError(f"Unsupported file type '{extension}', expected .csv or .jsonl")
+
+
+def validate_batch(
+    rows: List[Tuple[int, dict]],
+) -> Tuple[List[Tuple[int, Question]], List[Tuple[int, str]]]:
+    """Validate a batch of raw rows in one TypeAdapter call. Rows that fail
+    are reported individually and the rest are validated again without them."""
+    payload = [row for _, row in rows]
+    failed: Dict[int, str] = {}
+    try:
+        questions = QUESTION_LIST.validate_python(payload)
+        kept = list(range(len(rows)))
+    except ValidationError as e:
+        for error in e.errors():
+            index = error["loc"][0]
+            where = ".".join(str(part) for part in error["loc"][1:])
+            failed.setdefault(index, f"{where}: {error['msg']}")
+        kept = [i for i in range(len(rows)) if i not in failed]
+        questions = QUESTION_LIST.validate_python([payload[i] for i in kept])
+    valid = []
+    for index, question in zip(kept, questions):
+        if not question.question.strip():
+            failed[index] = "question: must not be empty"
+        elif question.answer not in question.options:
+            failed[index] = f"answer: '{question.answer}' is not one of the options"
+        else:
+            valid.append((rows[index][0], question))
+    errors = [(rows[index][0], message) for index, message in sorted(failed.items())]
+    return valid, errors
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from quiz_app import create_data_manager
+
+    parser = argparse.ArgumentParser(
+        description="Import questions from a CSV or JSONL file into the topic files."
+    )
+    parser.add_argument("path")
+    parser.add_argument("--topic", help="topic for rows that do not name one")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    data_manager = create_data_manager()
+    # No Tk window here: report storage errors on stderr instead of a dialog.
+    data_manager.show_error = lambda message: print(message, file=sys.stderr)
+    report = data_manager.import_questions(
+        read_rows(args.path), default_topic=args.topic, batch_size=args.batch_size
+    )
+    for row_number, message in report.errors:
+        print(f"row {row_number}: {message}", file=sys.stderr)
+    for topic, ids in report.added.items():
+        print(f"{topic}: {len(ids)} added")
+    print(f"{report.added_count} added, {len(report.errors)} skipped")
@@ -0,0 +1,146 @@
+import os
+import json
+import re
+import struct
+from random import Random
+from typing import Dict, List, Optional, Sequence, Tuple
+from atomic_file import atomic_write
+
+MAGIC = b"QINDEX1\n"
+HEADER = struct.Struct("<I")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def file_signature(file) -> List[int]:
+    """(mtime, size, inode) of an open file. Topic files are replaced, never
+    rewritten in place, so a changed file always changes its signature."""
+    stat = os.fstat(file.fileno())
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+def scan_topic(raw: bytes) -> Dict[str, Tuple[int, int]]:
+    """{id: (offset, length)} of each question object in a topic file's
+    bytes, in file order. A repeated id keeps its first position and its
+    last value, as when the whole file is validated.
+
+    The bytes are scanned as Latin-1 text, one character per byte, so text
+    positions are byte offsets: JSON syntax is ASCII, and UTF-8 multibyte
+    sequences only occur inside strings. Values are skipped with the json
+    module's C scanner; nothing is validated here."""
+    text = raw.decode("latin-1")
+    decoder = json.JSONDecoder()
+    entries = {}
+    pos = _WHITESPACE.match(text).end()
+    if pos == len(text):
+        return entries
+    if text[pos] != "{":
+        raise ValueError("A topic file must hold a JSON object")
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    if text.startswith("}", pos):
+        return entries
+    while True:
+        if not text.startswith('"', pos):
+            raise ValueError(f"Expected a question id at byte {pos}")
+        _, end = decoder.raw_decode(text, pos)
+        qid = json.loads(raw[pos:end])
+        pos = _WHITESPACE.match(text, end).end()
+        if not text.startswith(":", pos):
+            raise ValueError(f"Expected ':' at byte {pos}")
+        start = _WHITESPACE.match(text, pos + 1).end()
+        _, end = decoder.raw_decode(text, start)
+        entries[qid] = (start, end - start)
+        pos = _WHITESPACE.match(text, end).end()
+        if text.startswith(",", pos):
+            pos = _WHITESPACE.match(text, pos + 1).end()
+        elif text.startswith("}", pos):
+            return entries
+        else:
+            raise ValueError(f"Expected ',' or '}}' at byte {pos}")
+
+
+class QuestionIndex:
+    """Where each question of a topic file starts and how long it is, by id.
+
+    Saved next to the topic file as <topic>.index: MAGIC, a u32 length and a
+    JSON header ({"source", "ids"}), then the offsets as u64 and the lengths
+    as u32, in file order. source is the file_signature of the topic file it
+    was built from; an index whose source does not match is rebuilt.
+    """
+
+    def __init__(
+        self,
+        source: List[int],
+        ids: List[str],
+        offsets: Sequence[int],
+        lengths: Sequence[int],
+    ):
+        self.source = source
+        self.ids = ids
+        self.offsets = offsets
+        self.lengths = lengths
+        self._positions = None
+
+    @classmethod
+    def build(cls, raw: bytes, source: List[int]) -> "QuestionIndex":
+        entries = scan_topic(raw)
+        spans = list(entries.values())
+        return cls(
+            source,
+            list(entries),
+            [offset for offset, _ in spans],
+            [length for _, length in spans],
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Optional["QuestionIndex"]:
+        """The index saved at path, or None if it is missing or unreadable."""
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            if not data.startswith(MAGIC):
+                return None
+            (header_len,) = HEADER.unpack_from(data, len(MAGIC))
+            start = len(MAGIC) + HEADER.size
+            header = json.loads(data[start : start + header_len])
+            count = len(header["ids"])
+            start += header_len
+            offsets = struct.unpack_from(f"<{count}Q", data, start)
+            lengths = struct.unpack_from(f"<{count}I", data, start + 8 * count)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+        return cls(header["source"], header["ids"], offsets, lengths)
+
+    def save(self, path: str) -> None:
+        header = json.dumps(
+            {"source": self.source, "ids": self.ids}, separators=(",", ":")
+        ).encode("utf-8")
+        count = len(self.ids)
+        with atomic_write(path) as file:
+            file.write(MAGIC)
+            file.write(HEADER.pack(len(header)))
+            file.write(header)
+            file.write(struct.pack(f"<{count}Q", *self.offsets))
+            file.write(struct.pack(f"<{count}I", *self.lengths))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def span(self, qid: str) -> Tuple[int, int]:
+        """(offset, length) of question qid in the topic file."""
+        if self._positions is None:
+            self._positions = {qid: i for i, qid in enumerate(self.ids)}
+        position = self._positions[qid]
+        return self.offsets[position], self.lengths[position]
+
+    def sample(self, count: Optional[int], rng: Random) -> List[int]:
+        """Positions of count questions drawn uniformly without replacement,
+        in random order; all of them, shuffled, when count is None."""
+        return sample_positions(len(self), count, rng)
+
+
+def sample_positions(total: int, count: Optional[int], rng: Random) -> List[int]:
+    """count of range(total) drawn without replacement, in random order. All
+    of them, shuffled, when count is None or not smaller than total."""
+    if count is None or count > total:
+        count = total
+    return rng.sample(range(total), max(0, count))
@@ -0,0 +1,169 @@
+import os
+import json
+import mmap
+import random
+import struct
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Tuple
+from atomic_file import atomic_write
+from question_index import sample_positions
+from records import QuestionRecord
+from schemas import Quiz
+
+MAGIC = b"QPACK1\n"
+HEADER = struct.Struct("<I")
+ENTRY = struct.Struct("<QI")
+
+
+def source_signature(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def build_question_pack(data_dir: str, topics: List[str], pack_path: str) -> Dict:
+    """Compile data/<topic>.json into one pack file.
+
+    Layout: MAGIC, a u32 length and a JSON directory
+    ({topic: {"source", "table", "count"}}), then the record bodies. Each
+    topic has a table of (offset, length) pairs pointing at compact JSON
+    records [id, question, options, answer]. Offsets are relative to the end
+    of the directory. Every record is validated while building, so readers
+    can skip validation.
+    """
+    directory = {}
+    body = bytearray()
+    for topic in topics:
+        path = os.path.join(data_dir, f"{topic}.json")
+        signature = source_signature(path)
+        quiz = Quiz(root={})
+        if signature is not None:
+            with open(path, "rb") as file:
+                raw = file.read()
+            if raw.strip():
+                quiz = Quiz.model_validate_json(raw)
+        table = bytearray()
+        for qid, question in quiz.root.items():
+            record = json.dumps(
+                [qid, question.question, question.options, question.answer],
+                separators=(",", ":"),
+            ).encode("utf-8")
+            table += ENTRY.pack(len(body), len(record))
+            body += record
+        directory[topic] = {
+            "source": signature,
+            "table": len(body),
+            "count": len(quiz.root),
+        }
+        body += table
+    header = json.dumps(directory, separators=(",", ":")).encode("utf-8")
+    with atomic_write(pack_path) as file:
+        file.write(MAGIC)
+        file.write(HEADER.pack(len(header)))
+        file.write(header)
+        file.write(body)
+    return directory
+
+
+class QuestionPack:
+    """Read-only, memory-mapped view of a pack built by build_question_pack.
+
+    Questions are decoded one record at a time when they are accessed. Every
+    PackedQuestions keeps its pack alive, so a pack replaced by a rebuild is
+    only unmapped once no sequence uses it; close() is for when none do.
+    """
+
+    def __init__(self, pack_path: str):
+        self.path = pack_path
+        self._file = open(pack_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty question pack {pack_path}")
+        if self._map[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a question pack: {pack_path}")
+        (header_len,) = HEADER.unpack_from(self._map, len(MAGIC))
+        start = len(MAGIC) + HEADER.size
+        self.directory = json.loads(self._map[start : start + header_len])
+        self._body = start + header_len
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def is_fresh(self, topic: str, path: str) -> bool:
+        entry = self.directory.get(topic)
+        return entry is not None and entry["source"] == source_signature(path)
+
+    def count(self, topic: str) -> int:
+        return self.directory[topic]["count"]
+
+    def record(self, topic: str, index: int) -> Tuple[str, QuestionRecord]:
+        entry = self.directory[topic]
+        if not 0 <= index < entry["count"]:
+            raise IndexError(index)
+        offset, length = ENTRY.unpack_from(
+            self._map, self._body + entry["table"] + index * ENTRY.size
+        )
+        start = self._body + offset
+        qid, question, options, answer = json.loads(self._map[start : start + length])
+        # Records were validated when the pack was built.
+        return qid, QuestionRecord(question, options, answer)
+
+    def questions(
+        self,
+        topic: str,
+        shuffle: bool = False,
+        count: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+    ) -> "PackedQuestions":
+        """The topic's questions in file order, or shuffled. With count (or
+        an rng), count of them drawn at random, all when count is None."""
+        if count is not None or rng is not None:
+            order = sample_positions(self.count(topic), count, rng or random.Random())
+            return PackedQuestions(self, topic, order)
+        order = list(range(self.count(topic)))
+        if shuffle:
+            random.shuffle(order)
+        return PackedQuestions(self, topic, order)
+
+
+class PackedQuestions(Sequence):
+    """Sequence of a topic's questions in a given order, decoded on access."""
+
+    def __init__(self, pack: QuestionPack, topic: str, order: List[int]):
+        self._pack = pack
+        self._topic = topic
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._pack.record(self._topic, self._order[index])[1]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compile the topic files listed in config.json into a question pack."
+    )
+    parser.add_argument(
+        "--config", default=os.path.join(os.path.curdir, "config", "config.json")
+    )
+    parser.add_argument("--data-dir", default=os.path.join(os.path.curdir, "data"))
+    parser.add_argument(
+        "--output", default=os.path.join(os.path.curdir, "data", "questions.pack")
+    )
+    args = parser.parse_args()
+    with open(args.config) as file:
+        topics = json.load(file)["topics"]
+    for topic, entry in build_question_pack(args.data_dir, topics, args.output).items():
+        print(f"{topic}: {entry['count']} questions")
@@ -1,22 +1,131 @@
+import os
+import importlib
+import threading
 import tkinter as tk
-import bcrypt
+from concurrent.futures import Future
+from typing import Optional
 from data_manager import DataManager
-from frames.auth_frame import AuthFrame
+from async_data_manager import AsyncDataManager
+from prefetcher import Prefetcher
+from password_hasher import PasswordHasher
+from metrics import Metrics
 from schemas import UserCredentials
 
+# Frame name -> (module, class). Modules are imported on first navigation.
+# The order is the pre-warm order.
+FRAMES = {
+    "auth": ("frames.auth_frame", "AuthFrame"),
+    "user": ("frames.user_frame", "UserFrame"),
+    "admin": ("frames.admin_frame", "AdminFrame"),
+    "quiz": ("frames.quiz_frame", "QuizFrame"),
+    "leaderboard": ("frames.leaderboard_frame", "LeaderboardFrame"),
+    "manage_questions": ("frames.manage_questions_frame", "ManageQuestionsFrame"),
+    "add_question": ("frames.add_question_frame", "AddQuestionFrame"),
+    "delete_question": ("frames.delete_question_frame", "DeleteQuestionFrame"),
+    "import_questions": ("frames.import_questions_frame", "ImportQuestionsFrame"),
+    "analytics": ("frames.analytics_frame", "AnalyticsFrame"),
+    "diagnostics": ("frames.diagnostics_frame", "DiagnosticsFrame"),
+    "user_analytics": ("frames.user_analytics_frame", "UserAnalyticsFrame"),
+}
+# Frames left out of the pre-warm: they import Matplotlib and Seaborn (and set
+# the plotting theme), which should only happen once a user opens their
+# analytics, and on the Tk thread.
+NOT_PREWARMED = {"user_analytics"}
+
+
+def load_frame_class(name: str):
+    module_name, class_name = FRAMES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def create_data_manager(**kwargs) -> DataManager:
+    """Pick the storage backend from QUIZ_APP_STORAGE ("json", "sharded",
+    "columnar" or "sqlite").
+    kwargs are passed on to the DataManager constructor. Setting
+    QUIZ_APP_METRICS=1 or QUIZ_APP_METRICS_FILE turns on instrumentation."""
+    if "metrics" not in kwargs and (
+        os.environ.get("QUIZ_APP_METRICS") == "1"
+        or os.environ.get("QUIZ_APP_METRICS_FILE")
+    ):
+        kwargs["metrics"] = Metrics()
+    storage = os.environ.get("QUIZ_APP_STORAGE", "json").lower()
+    if storage == "sqlite":
+        from sqlite_data_manager import SQLiteDataManager
+
+        return SQLiteDataManager(**kwargs)
+    if storage == "sharded":
+        from sharded_data_manager import ShardedDataManager
+
+        return ShardedDataManager(**kwargs)
+    if storage == "columnar":
+        from columnar_data_manager import ColumnarDataManager
+
+        return ColumnarDataManager(**kwargs)
+    return DataManager(**kwargs)
+
 
 class QuizApp:
     """Main application class managing Tkinter GUI and logic."""
 
-    def __init__(self, root: tk.Tk):
+    def __init__(
+        self,
+        root: tk.Tk,
+        prewarm_delay: Optional[int] = 1000,
+        prefetch_budget: int = 16 * 1024 * 1024,
+    ):
         self.root = root
         self.root.title("Quiz Application")
         self.root.geometry("800x600")
-        self.data_manager = DataManager()
+        self.data_manager = create_data_manager()
+        # Background facade for calls that would otherwise block the Tk loop.
+        self.io = AsyncDataManager(self.data_manager, self.root)
+        # bcrypt runs on the "auth" lane; without a configured cost, pick one
+        # for this host before the first login is checked.
+        config = self.data_manager.load_config()
+        self.password_hasher = PasswordHasher(config.bcryptRounds if config else None)
+        if self.password_hasher.rounds is None:
+            self.io.run("auth", self.password_hasher.calibrate)
+        # Warms the user's likely next screens after login; prefetch_budget
+        # caps the bytes of questions it holds ready.
+        self.prefetcher = Prefetcher(self.io, memory_budget=prefetch_budget)
         self.current_user = None
         self.current_frame = None
         self.frames = {}
         self.show_auth_frame()
+        if prewarm_delay is not None:
+            self.root.after(prewarm_delay, self.prewarm_frames)
+        self.metrics_file = os.environ.get("QUIZ_APP_METRICS_FILE")
+        if self.metrics_file and self.data_manager.metrics is not None:
+            self.export_metrics()
+
+    def export_metrics(self, interval: int = 15000) -> None:
+        """Rewrite QUIZ_APP_METRICS_FILE in Prometheus text format every
+        interval milliseconds."""
+        self.io.run(
+            "metrics", self.data_manager.metrics.write_prometheus, self.metrics_file
+        )
+        self.root.after(interval, self.export_metrics, interval)
+
+    def frame_class(self, name: str):
+        return load_frame_class(name)
+
+    def prewarm_frames(self) -> threading.Thread:
+        """Import the remaining frame modules, except NOT_PREWARMED, on a
+        background thread while the login screen is idle."""
+
+        def warm():
+            for name in FRAMES:
+                if name in NOT_PREWARMED:
+                    continue
+                try:
+                    self.frame_class(name)
+                except Exception:
+                    # Navigation imports the module again and reports errors.
+                    pass
+
+        thread = threading.Thread(target=warm, name="prewarm-frames", daemon=True)
+        thread.start()
+        return thread
 
     def clear_frame(self):
         if self.current_frame:
@@ -24,50 +133,72 @@ class QuizApp:
         self.current_frame = None
 
     def show_auth_frame(self):
+        self.prefetcher.stop()
         if "auth" not in self.frames:
-            self.frames["auth"] = AuthFrame(self.root, self)
+            self.frames["auth"] = self.frame_class("auth")(self.root, self)
         self.clear_frame()
         self.current_frame = self.frames["auth"]
         self.current_frame.pack(fill="both", expand=True)
 
     def show_user_frame(self):
-        from frames.user_frame import UserFrame
-
         if "user" not in self.frames:
-            self.frames["user"] = UserFrame(self.root, self)
+            self.frames["user"] = self.frame_class("user")(self.root, self)
         self.clear_frame()
         self.current_frame = self.frames["user"]
         self.current_frame.pack(fill="both", expand=True)
 
     def show_admin_frame(self):
-        from frames.admin_frame import AdminFrame
-
         if "admin" not in self.frames:
-            self.frames["admin"] = AdminFrame(self.root, self)
+            self.frames["admin"] = self.frame_class("admin")(self.root, self)
         self.clear_frame()
         self.current_frame = self.frames["admin"]
         self.current_frame.pack(fill="both", expand=True)
 
-    def login(self, username: str, password: str) -> bool:
-        users = self.data_manager.load_users()
+    def login(self, username: str, password: str) -> Future:
+        future = self.io.run("auth", self.authenticate, username, password)
+        self.io.then(future, self.finish_login)
+        return future
+
+    def authenticate(self, username: str, password: str) -> Optional[UserCredentials]:
+        """Check credentials on the auth lane; upgrades the stored hash when its
+        cost differs from the configured one. Users are read on their own lane
+        ("db" for single-connection backends), so only bcrypt runs here."""
+        users = self.io.load_users().result()
         if not users or username not in users.root:
-            tk.messagebox.showerror("Error", "Invalid username or password")
-            return False
+            return None
         user = users.root[username]
-        if not bcrypt.checkpw(password.encode(), user.password.encode()):
+        if not self.password_hasher.check(password, user.password):
+            return None
+        if self.password_hasher.needs_rehash(user.password):
+            user = user.model_copy(
+                update={"password": self.password_hasher.hash(password)}
+            )
+            self.io.update_user(user)
+        return user
+
+    def finish_login(self, user: Optional[UserCredentials]) -> None:
+        if user is None:
             tk.messagebox.showerror("Error", "Invalid username or password")
-            return False
+            return
         self.current_user = user
         if user.role == "ADMIN":
             self.show_admin_frame()
         else:
             self.show_user_frame()
-        return True
+            self.prefetcher.start(user.username)
+
+    def register(self, username: str, password: str) -> Future:
+        """Hash on the auth lane, then store the user on the users lane. The
+        future resolves to save_user's result."""
+
+        def create_user() -> bool:
+            hashed_password = self.password_hasher.hash(password)
+            user = UserCredentials(
+                username=username, password=hashed_password, role="USER"
+            )
+            return self.io.save_user(user).result()
 
-    def register(self, username: str, password: str) -> bool:
-        hashed_password = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
-        user = UserCredentials(username=username, password=hashed_password, role="USER")
-        return self.data_manager.save_user(user)
+        return self.io.run("auth", create_user)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,512 @@
+import asyncio
+import json
+import os
+import secrets
+import signal
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+from async_data_manager import AsyncDataManager
+from metrics import Metrics
+from password_hasher import PasswordHasher
+from quiz_app import create_data_manager
+from records import QuestionRecord
+
+MAX_BODY = 64 * 1024
+JSON = "application/json"
+PROMETHEUS_TEXT = "text/plain; version=0.0.4"
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: Optional[str] = None):
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.message = message or status.phrase
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self) -> dict:
+        try:
+            data = json.loads(self.body or b"{}")
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be JSON")
+        if not isinstance(data, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return data
+
+
+@dataclass
+class Session:
+    username: str
+    role: str
+    last_seen: float = field(default_factory=time.monotonic)
+    topic: Optional[str] = None
+    questions: List[QuestionRecord] = field(default_factory=list)
+    current: int = 0
+    score: int = 0
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Parse one HTTP/1.1 request, or return None when the client closed the
+    connection between requests."""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    if length > MAX_BODY:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    body = await reader.readexactly(length) if length else b""
+    url = urlsplit(target)
+    return Request(method.upper(), url.path, dict(parse_qsl(url.query)), headers, body)
+
+
+def encode_response(
+    status: HTTPStatus, body: bytes, keep_alive: bool, content_type: str = JSON
+) -> bytes:
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class QuizServer:
+    """Headless HTTP/JSON front end to DataManager for many concurrent quiz
+    takers.
+
+    DataManager calls run on the same per-file worker lanes as the Tk app, so
+    reads of unrelated files overlap while everything touching scores stays in
+    order. Finished quizzes are queued to a single writer task, which saves
+    them in batches; leaderboard and analytics responses are cached until the
+    next batch lands.
+    """
+
+    def __init__(
+        self,
+        data_manager,
+        cache_ttl: float = 5.0,
+        cache_entries: int = 1024,
+        session_ttl: float = 1800.0,
+        idle_timeout: float = 30.0,
+        hash_workers: Optional[int] = None,
+    ):
+        self.data_manager = data_manager
+        self.io = AsyncDataManager(data_manager, root=None)
+        self.password_hasher = PasswordHasher()
+        # bcrypt releases the GIL, so logins are checked on several threads.
+        self.hash_executor = ThreadPoolExecutor(
+            max_workers=hash_workers or os.cpu_count() or 4,
+            thread_name_prefix="auth",
+        )
+        self.cache_ttl = cache_ttl
+        self.session_ttl = session_ttl
+        self.idle_timeout = idle_timeout
+        self.sessions: Dict[str, Session] = {}
+        # (path, query) -> (scores_version, expires_at, body), least recently
+        # used first. Query strings come from clients, so the number of
+        # entries is capped at cache_entries.
+        self.cache_entries = cache_entries
+        self.response_cache: (
+            "OrderedDict[Tuple[str, str], Tuple[int, float, bytes]]"
+        ) = OrderedDict()
+        self.scores_version = 0
+        self.score_queue: Optional[asyncio.Queue] = None
+        self.stats = {"requests": 0, "cache_hits": 0, "scores_saved": 0}
+        self.routes = {
+            ("POST", "/login"): self.login,
+            ("POST", "/logout"): self.logout,
+            ("GET", "/topics"): self.topics,
+            ("POST", "/quiz/start"): self.start_quiz,
+            ("GET", "/quiz/question"): self.question,
+            ("POST", "/quiz/answer"): self.answer,
+            ("GET", "/leaderboard"): self.leaderboard,
+            ("GET", "/analytics"): self.analytics,
+            ("GET", "/stats"): self.server_stats,
+            ("GET", "/metrics"): self.metrics,
+        }
+        self._server = None
+        self._tasks = []
+
+    async def call(self, name: str, *args):
+        return await asyncio.wrap_future(self.io.submit(name, *args))
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080):
+        config = await self.call("load_config")
+        if config and config.bcryptRounds:
+            self.password_hasher = PasswordHasher(config.bcryptRounds)
+        self.score_queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self.score_writer()),
+            asyncio.create_task(self.housekeeping()),
+        ]
+        self._server = await asyncio.start_server(
+            self.handle_connection, host, port, backlog=4096
+        )
+        return self._server
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop accepting connections, flush queued scores, release workers."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self.score_queue is not None:
+            await self.score_queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        journal = getattr(self.data_manager, "score_journal", None)
+        if journal is not None:
+            journal.sync()
+        self.io.shutdown()
+        self.hash_executor.shutdown()
+        # Backends with their own files or connections (SQLite, columnar
+        # scores) flush and release them here.
+        close = getattr(self.data_manager, "close", None)
+        if close is not None:
+            close()
+
+    async def handle_connection(self, reader, writer) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        read_request(reader), self.idle_timeout
+                    )
+                except HTTPError as e:
+                    body = json.dumps({"error": e.message}).encode()
+                    writer.write(encode_response(e.status, body, False))
+                    await writer.drain()
+                    return
+                if request is None:
+                    return
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                status, body, content_type = await self.dispatch(request)
+                writer.write(encode_response(status, body, keep_alive, content_type))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            ConnectionError,
+        ):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, request: Request) -> Tuple[HTTPStatus, bytes, str]:
+        """Run the route for request. Handlers return a JSON-serializable
+        value, pre-encoded JSON bytes, or a str sent as plain text."""
+        self.stats["requests"] += 1
+        handler = self.routes.get((request.method, request.path))
+        try:
+            if handler is None:
+                if any(path == request.path for _, path in self.routes):
+                    raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+                raise HTTPError(HTTPStatus.NOT_FOUND)
+            result = await handler(request)
+        except HTTPError as e:
+            return e.status, json.dumps({"error": e.message}).encode(), JSON
+        except Exception as e:
+            return (
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                json.dumps({"error": str(e)}).encode(),
+                JSON,
+            )
+        if isinstance(result, bytes):
+            return HTTPStatus.OK, result, JSON
+        if isinstance(result, str):
+            return HTTPStatus.OK, result.encode(), PROMETHEUS_TEXT
+        return HTTPStatus.OK, json.dumps(result).encode(), JSON
+
+    def session(self, request: Request, role: Optional[str] = None) -> Session:
+        auth = request.headers.get("authorization", "")
+        token = auth[len("Bearer ") :] if auth.startswith("Bearer ") else ""
+        session = self.sessions.get(token)
+        if session is None:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Login required")
+        if role is not None and session.role != role:
+            raise HTTPError(HTTPStatus.FORBIDDEN)
+        session.last_seen = time.monotonic()
+        return session
+
+    async def cached(self, request: Request, build, scores: bool = False) -> bytes:
+        """Serve the encoded response for request from cache while it is younger
+        than cache_ttl and, for score-derived data, no new scores were saved."""
+        key = (
+            request.path,
+            "&".join(f"{k}={v}" for k, v in sorted(request.query.items())),
+        )
+        version = self.scores_version if scores else 0
+        now = time.monotonic()
+        entry = self.response_cache.get(key)
+        if entry is not None and entry[0] == version and entry[1] > now:
+            self.response_cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return entry[2]
+        body = json.dumps(await build()).encode()
+        self.response_cache[key] = (version, now + self.cache_ttl, body)
+        self.response_cache.move_to_end(key)
+        while len(self.response_cache) > self.cache_entries:
+            self.response_cache.popitem(last=False)
+        return body
+
+    async def login(self, request: Request):
+        data = request.json()
+        username = str(data.get("username", ""))
+        password = str(data.get("password", ""))
+        users = await self.call("load_users")
+        user = users.root.get(username) if users else None
+        if user is None:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Invalid username or password")
+        loop = asyncio.get_running_loop()
+        valid = await loop.run_in_executor(
+            self.hash_executor, self.password_hasher.check, password, user.password
+        )
+        if not valid:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Invalid username or password")
+        if self.password_hasher.needs_rehash(user.password):
+            hashed = await loop.run_in_executor(
+                self.hash_executor, self.password_hasher.hash, password
+            )
+            self.io.update_user(user.model_copy(update={"password": hashed}))
+        token = secrets.token_urlsafe(24)
+        self.sessions[token] = Session(username=user.username, role=user.role)
+        return {"token": token, "username": user.username, "role": user.role}
+
+    async def logout(self, request: Request):
+        self.session(request)
+        self.sessions.pop(request.headers["authorization"][len("Bearer ") :], None)
+        return {"ok": True}
+
+    async def topics(self, request: Request):
+        self.session(request)
+
+        async def build():
+            config = await self.call("load_config")
+            return {"topics": list(config.topics) if config else []}
+
+        return await self.cached(request, build)
+
+    def current_question(self, session: Session) -> dict:
+        question = session.questions[session.current]
+        return {
+            "number": session.current + 1,
+            "total": len(session.questions),
+            "question": question.question,
+            "options": question.options,
+        }
+
+    async def start_quiz(self, request: Request):
+        session = self.session(request)
+        data = request.json()
+        topic = str(data.get("topic", "")).lower().replace(" ", "_")
+        config = await self.call("load_config")
+        if not config or topic not in config.topics:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown topic '{topic}'")
+        seed = data.get("seed")
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "seed must be an integer")
+        questions = await self.call(
+            "load_questions", topic, config.questionsPerQuiz, seed
+        )
+        if not questions:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No questions for topic '{topic}'")
+        session.topic = topic
+        session.questions = questions
+        session.current = 0
+        session.score = 0
+        return self.current_question(session)
+
+    def active_quiz(self, request: Request) -> Session:
+        session = self.session(request)
+        if session.topic is None:
+            raise HTTPError(HTTPStatus.CONFLICT, "No quiz in progress")
+        return session
+
+    async def question(self, request: Request):
+        return self.current_question(self.active_quiz(request))
+
+    async def answer(self, request: Request):
+        session = self.active_quiz(request)
+        answer = str(request.json().get("answer", ""))
+        question = session.questions[session.current]
+        if answer not in question.options:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Please select an answer")
+        correct = answer == question.answer
+        if correct:
+            session.score += 1
+        session.current += 1
+        if session.current < len(session.questions):
+            return {"correct": correct, "next": self.current_question(session)}
+        result = {
+            "correct": correct,
+            "finished": True,
+            "score": session.score,
+            "total": len(session.questions),
+        }
+        self.score_queue.put_nowait(
+            (session.username, session.topic, session.score, len(session.questions))
+        )
+        session.topic = None
+        session.questions = []
+        return result
+
+    async def leaderboard(self, request: Request):
+        self.session(request)
+        topic = request.query.get("topic", "all").lower().replace(" ", "_")
+        try:
+            limit = int(request.query["limit"]) if "limit" in request.query else None
+            offset = int(request.query.get("offset", 0))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "limit and offset must be integers")
+
+        async def build():
+            if topic == "all":
+                rows = await self.call("get_overall_leaderboard", limit, offset)
+                count = await self.call("get_leaderboard_count", None)
+            else:
+                rows = await self.call("get_leaderboard", topic, limit, offset)
+                count = await self.call("get_leaderboard_count", topic)
+            return {"topic": topic, "count": count, "offset": offset, "rows": rows}
+
+        return await self.cached(request, build, scores=True)
+
+    async def analytics(self, request: Request):
+        self.session(request, role="ADMIN")
+        return await self.cached(
+            request, lambda: self.call("get_analytics"), scores=True
+        )
+
+    async def server_stats(self, request: Request):
+        self.session(request, role="ADMIN")
+        return {
+            **self.stats,
+            "sessions": len(self.sessions),
+            "queued_scores": self.score_queue.qsize(),
+            "data_cache": self.data_manager.cache_stats(),
+        }
+
+    async def metrics(self, request: Request):
+        """Prometheus text exposition of the DataManager metrics. Like a usual
+        scrape target it needs no login; it is only served when the data
+        manager is instrumented."""
+        if self.data_manager.metrics is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Metrics are not enabled")
+        return self.data_manager.metrics.to_prometheus()
+
+    def save_scores(self, batch) -> int:
+        saved = sum(1 for entry in batch if self.data_manager.save_score(*entry))
+        journal = getattr(self.data_manager, "score_journal", None)
+        if journal is not None and self.data_manager.journal_scores:
+            journal.sync()
+        return saved
+
+    async def score_writer(self) -> None:
+        """The only task that writes scores. Everything queued while a batch is
+        being saved goes into the next batch."""
+        while True:
+            batch = [await self.score_queue.get()]
+            while not self.score_queue.empty():
+                batch.append(self.score_queue.get_nowait())
+            try:
+                future = self.io.run(self.io.lane("scores"), self.save_scores, batch)
+                self.stats["scores_saved"] += await asyncio.wrap_future(future)
+            except Exception as e:
+                print(f"Error saving scores: {e}", file=sys.stderr)
+            finally:
+                self.scores_version += 1
+                for _ in batch:
+                    self.score_queue.task_done()
+
+    async def housekeeping(self, interval: float = 1.0) -> None:
+        """Report DataManager errors and expire idle sessions."""
+        while True:
+            await asyncio.sleep(interval)
+            while not self.data_manager.pending_errors.empty():
+                print(self.data_manager.pending_errors.get_nowait(), file=sys.stderr)
+            cutoff = time.monotonic() - self.session_ttl
+            for token in [t for t, s in self.sessions.items() if s.last_seen < cutoff]:
+                del self.sessions[token]
+
+
+async def serve(host: str, port: int, metrics: bool = False, **kwargs) -> None:
+    options = {"journal_scores": True}
+    if metrics:
+        options["metrics"] = Metrics()
+    server = QuizServer(create_data_manager(**options), **kwargs)
+    await server.start(host, port)
+    print(f"Serving on http://{host}:{server.port}", flush=True)
+    stopped = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set)
+    except NotImplementedError:
+        # Windows event loops have no signal handlers.
+        pass
+    try:
+        await stopped.wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Serve quizzes over HTTP/JSON from the data in the current directory."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--cache-ttl", type=float, default=5.0, help="seconds")
+    parser.add_argument(
+        "--cache-entries", type=int, default=1024, help="cached responses kept"
+    )
+    parser.add_argument(
+        "--metrics", action="store_true", help="instrument DataManager, serve /metrics"
+    )
+    args = parser.parse_args()
+    try:
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                metrics=args.metrics,
+                cache_ttl=args.cache_ttl,
+                cache_entries=args.cache_entries,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
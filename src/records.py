@@ -0,0 +1,251 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, NamedTuple
+from pydantic_core import core_schema
+from schemas import Question, Quiz, Result, Score, User
+
+# The schemas models describe the files and are what input is validated
+# against. Once loaded, scores and questions are kept as the records below:
+# tuples without per-instance dicts, with timestamps parsed once into
+# integer microseconds since the epoch. The tables validate JSON straight
+# into records and serialize back to the schemas' layout, so DataManager
+# can cache and save them in place of Result, User and Quiz.
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def timestamp_micros(timestamp: datetime) -> int:
+    """Microseconds since the epoch. Naive timestamps are read as UTC."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - EPOCH) // MICROSECOND
+
+
+def parse_timestamp(text: str) -> int:
+    return timestamp_micros(datetime.fromisoformat(text))
+
+
+def to_datetime(micros: int) -> datetime:
+    """The naive (UTC) datetime of a record timestamp."""
+    return EPOCH + timedelta(microseconds=micros)
+
+
+def format_timestamp(micros: int) -> str:
+    return to_datetime(micros).isoformat()
+
+
+class ScoreRecord(NamedTuple):
+    """One attempt; timestamp is in microseconds since the epoch."""
+
+    timestamp: int
+    score: int
+    total: int
+
+    @classmethod
+    def now(cls, score: int, total: int) -> "ScoreRecord":
+        return cls(timestamp_micros(datetime.now()), score, total)
+
+    @classmethod
+    def from_model(cls, score: Score) -> "ScoreRecord":
+        return cls(parse_timestamp(score.timestamp), score.score, score.total)
+
+    def to_model(self) -> Score:
+        return Score.model_construct(
+            timestamp=format_timestamp(self.timestamp),
+            score=self.score,
+            total=self.total,
+        )
+
+
+class QuestionRecord(NamedTuple):
+    question: str
+    options: Dict[str, str]
+    answer: str
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        # One question on its own, e.g. a single object read through a
+        # QuestionIndex.
+        return core_schema.no_info_after_validator_function(
+            lambda q: cls(q["question"], q["options"], q["answer"]),
+            QUESTION_SCHEMA,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda q: q._asdict()
+            ),
+        )
+
+    @classmethod
+    def from_model(cls, question: Question) -> "QuestionRecord":
+        return cls(question.question, question.options, question.answer)
+
+    def to_model(self) -> Question:
+        return Question.model_construct(
+            question=self.question, options=self.options, answer=self.answer
+        )
+
+
+def _field(schema) -> Dict:
+    return core_schema.typed_dict_field(schema)
+
+
+# The JSON shapes of schemas.Score and schemas.Question. pydantic-core checks
+# them without creating model instances; the tables then turn each into a
+# record in one pass.
+SCORE_SCHEMA = core_schema.typed_dict_schema(
+    {
+        "timestamp": _field(core_schema.str_schema()),
+        "score": _field(core_schema.int_schema()),
+        "total": _field(core_schema.int_schema()),
+    }
+)
+QUESTION_SCHEMA = core_schema.typed_dict_schema(
+    {
+        "question": _field(core_schema.str_schema()),
+        "options": _field(
+            core_schema.dict_schema(core_schema.str_schema(), core_schema.str_schema())
+        ),
+        "answer": _field(core_schema.str_schema()),
+    }
+)
+
+
+def _table_schema(value_schema, load, dump):
+    return core_schema.no_info_after_validator_function(
+        load,
+        core_schema.dict_schema(core_schema.str_schema(), value_schema),
+        serialization=core_schema.plain_serializer_function_ser_schema(dump),
+    )
+
+
+def _scores(items: List[Dict]) -> List[ScoreRecord]:
+    return [
+        ScoreRecord(parse_timestamp(s["timestamp"]), s["score"], s["total"])
+        for s in items
+    ]
+
+
+def _scores_json(users: Dict[str, Dict[str, List[ScoreRecord]]]) -> Dict:
+    """The JSON layout of schemas.Result for {username: {topic: records}}.
+    Timestamps are formatted as one NumPy column, several times faster than
+    format_timestamp one at a time; whole seconds keep a .000000 fraction."""
+    import numpy as np
+
+    stamps = iter(
+        np.array(
+            [
+                s.timestamp
+                for user in users.values()
+                for scores in user.values()
+                for s in scores
+            ],
+            dtype="datetime64[us]",
+        )
+        .astype(str)
+        .tolist()
+    )
+    return {
+        username: {
+            topic: [
+                {"timestamp": next(stamps), "score": s.score, "total": s.total}
+                for s in scores
+            ]
+            for topic, scores in user.items()
+        }
+        for username, user in users.items()
+    }
+
+
+class UserScores(Dict[str, List[ScoreRecord]]):
+    """One user's attempts by topic; the records form of schemas.User."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        return _table_schema(
+            core_schema.list_schema(SCORE_SCHEMA),
+            lambda data: cls({topic: _scores(items) for topic, items in data.items()}),
+            lambda table: _scores_json({"": table})[""],
+        )
+
+    @classmethod
+    def from_model(cls, user: User) -> "UserScores":
+        return cls(
+            {
+                topic: [ScoreRecord.from_model(s) for s in scores]
+                for topic, scores in user.root.items()
+            }
+        )
+
+    def to_model(self) -> User:
+        return User.model_construct(
+            root={
+                topic: [s.to_model() for s in scores] for topic, scores in self.items()
+            }
+        )
+
+    def clone(self) -> "UserScores":
+        """A copy whose lists can be appended to independently. Records are
+        immutable and shared."""
+        return UserScores({topic: list(scores) for topic, scores in self.items()})
+
+
+class ScoreTable(Dict[str, UserScores]):
+    """Every user's attempts; the records form of schemas.Result."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        return _table_schema(
+            core_schema.dict_schema(
+                core_schema.str_schema(), core_schema.list_schema(SCORE_SCHEMA)
+            ),
+            lambda data: cls(
+                {
+                    username: UserScores(
+                        {topic: _scores(items) for topic, items in topics.items()}
+                    )
+                    for username, topics in data.items()
+                }
+            ),
+            _scores_json,
+        )
+
+    @classmethod
+    def from_model(cls, result: Result) -> "ScoreTable":
+        return cls(
+            {
+                username: UserScores.from_model(user)
+                for username, user in result.root.items()
+            }
+        )
+
+    def to_model(self) -> Result:
+        return Result.model_construct(
+            root={username: user.to_model() for username, user in self.items()}
+        )
+
+    def clone(self) -> "ScoreTable":
+        return ScoreTable({username: user.clone() for username, user in self.items()})
+
+
+class QuestionTable(Dict[str, QuestionRecord]):
+    """A topic's questions by id, in file order; the records form of
+    schemas.Quiz."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        return _table_schema(
+            QUESTION_SCHEMA,
+            lambda data: cls(
+                {
+                    qid: QuestionRecord(q["question"], q["options"], q["answer"])
+                    for qid, q in data.items()
+                }
+            ),
+            lambda table: {qid: q._asdict() for qid, q in table.items()},
+        )
+
+    @classmethod
+    def from_model(cls, quiz: Quiz) -> "QuestionTable":
+        return cls({qid: QuestionRecord.from_model(q) for qid, q in quiz.root.items()})
+
+    def to_model(self) -> Quiz:
+        return Quiz.model_construct(root={qid: q.to_model() for qid, q in self.items()})
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, RootModel, field_validator, Field
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 import re
 
@@ -7,6 +7,11 @@ import re
 class QuizConfig(BaseModel):
     topics: List[str]
     questionsPerTopic: int
+    # questions drawn at random for each quiz; every question of the topic
+    # when unset
+    questionsPerQuiz: Optional[int] = Field(default=None, gt=0)
+    # bcrypt cost for password hashes; calibrated on the host when unset
+    bcryptRounds: Optional[int] = None
 
 # Schema for quiz_<topic>.json
 class Question(BaseModel):
@@ -28,6 +33,11 @@ class User(RootModel[Dict[str, List[Score]]]):
 class Result(RootModel[Dict[str, User]]):
     pass
 
+# Schema for result/shards/index.json: username -> shard path, in the order
+# users first took a quiz. Each shard holds one User.
+class ScoreShards(RootModel[Dict[str, str]]):
+    pass
+
 # Schema for users.json
 class UserCredentials(BaseModel):
     username: str
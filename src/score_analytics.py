@@ -0,0 +1,212 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+import numpy as np
+from records import ScoreRecord
+
+# Percentage histogram: HISTOGRAM_BINS equal-width bins over 0-100, the last
+# one closed so that 100% is counted in it.
+HISTOGRAM_BINS = 10
+PASS_PERCENTAGE = 50.0
+# Distinct users per topic are counted with a topics x users bitmap up to
+# this many cells, and with a sort above it.
+SEEN_MATRIX_LIMIT = 1 << 26
+
+
+@dataclass
+class ScoreArrays:
+    """Every attempt as parallel, contiguous columns.
+
+    user_id and topic_id index users and topics; timestamp is in seconds
+    since the epoch (naive timestamps are read as UTC).
+    """
+
+    users: List[str] = field(default_factory=list)
+    topics: List[str] = field(default_factory=list)
+    user_id: np.ndarray = field(default_factory=lambda: np.empty(0, np.int32))
+    topic_id: np.ndarray = field(default_factory=lambda: np.empty(0, np.int32))
+    timestamp: np.ndarray = field(default_factory=lambda: np.empty(0, np.int64))
+    score: np.ndarray = field(default_factory=lambda: np.empty(0, np.int32))
+    total: np.ndarray = field(default_factory=lambda: np.empty(0, np.int32))
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Tuple[str, str, int, int, int]],
+        users: Iterable[str] = (),
+        topics: Iterable[str] = (),
+    ) -> "ScoreArrays":
+        """Build from (username, topic, timestamp, score, total) rows, with
+        timestamps in microseconds since the epoch as in ScoreRecord. users
+        and topics, if given, take the first ids."""
+        users = {name: i for i, name in enumerate(users)}
+        topics = {name: i for i, name in enumerate(topics)}
+        user_ids, topic_ids, timestamps, scores, totals = [], [], [], [], []
+        for username, topic, timestamp, score, total in rows:
+            user_ids.append(users.setdefault(username, len(users)))
+            topic_ids.append(topics.setdefault(topic, len(topics)))
+            timestamps.append(timestamp)
+            scores.append(score)
+            totals.append(total)
+        return cls(
+            users=list(users),
+            topics=list(topics),
+            user_id=np.array(user_ids, dtype=np.int32),
+            topic_id=np.array(topic_ids, dtype=np.int32),
+            timestamp=np.array(timestamps, dtype=np.int64) // 1_000_000,
+            score=np.array(scores, dtype=np.int32),
+            total=np.array(totals, dtype=np.int32),
+        )
+
+    def extended(self, rows: Iterable[Tuple[str, str, int, int, int]]) -> "ScoreArrays":
+        """A copy with rows appended; ids of known users and topics are kept."""
+        added = ScoreArrays.from_rows(rows, self.users, self.topics)
+        return ScoreArrays(
+            users=added.users,
+            topics=added.topics,
+            user_id=np.concatenate((self.user_id, added.user_id)),
+            topic_id=np.concatenate((self.topic_id, added.topic_id)),
+            timestamp=np.concatenate((self.timestamp, added.timestamp)),
+            score=np.concatenate((self.score, added.score)),
+            total=np.concatenate((self.total, added.total)),
+        )
+
+    @classmethod
+    def from_users(
+        cls, users: Iterable[Tuple[str, Mapping[str, List[ScoreRecord]]]]
+    ) -> "ScoreArrays":
+        """Build from (username, {topic: scores}) pairs, e.g.
+        ScoreTable.items()."""
+        return cls.from_rows(
+            (username, topic, s.timestamp, s.score, s.total)
+            for username, user in users
+            for topic, scores in user.items()
+            for s in scores
+        )
+
+
+def _quantiles(
+    ordered: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float
+) -> np.ndarray:
+    """Quantile q of each group of a group-wise sorted array, interpolated
+    linearly as numpy.quantile does. Groups must not be empty."""
+    position = starts + q * (counts - 1)
+    low = np.floor(position).astype(np.int64)
+    high = np.ceil(position).astype(np.int64)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def topic_statistics(
+    arrays: ScoreArrays,
+    topics: Optional[List[str]] = None,
+    pass_percentage: float = PASS_PERCENTAGE,
+    bins: int = HISTOGRAM_BINS,
+) -> Dict[str, Dict]:
+    """Per-topic attempt statistics, computed with array group-bys.
+
+    For each topic (every topic in the data if topics is None): distinct
+    users, attempts, mean, median and 90th percentile of the attempt
+    percentages, the share of attempts at or above pass_percentage, and a
+    histogram of percentages in bins equal-width bins. Statistics of a topic
+    without attempts are None. Values are plain Python numbers, so the
+    result can be serialized as JSON.
+    """
+    n_topics = len(arrays.topics)
+    topic_id = arrays.topic_id
+    total = arrays.total.astype(np.float64)
+    percentage = np.divide(
+        arrays.score * 100.0,
+        total,
+        out=np.zeros(len(total)),
+        where=total > 0,
+    )
+
+    attempts = np.bincount(topic_id, minlength=n_topics)
+    sums = np.bincount(topic_id, weights=percentage, minlength=n_topics)
+    passed = np.bincount(
+        topic_id, weights=percentage >= pass_percentage, minlength=n_topics
+    )
+    n_users = max(1, len(arrays.users))
+    pairs = topic_id.astype(np.int64) * n_users + arrays.user_id
+    if n_topics * n_users <= SEEN_MATRIX_LIMIT:
+        seen = np.zeros(n_topics * n_users, dtype=bool)
+        seen[pairs] = True
+        users = seen.reshape(n_topics, n_users).sum(axis=1)
+    else:
+        users = np.bincount(np.unique(pairs) // n_users, minlength=n_topics)
+    bin_index = np.minimum((percentage * bins / 100).astype(np.int64), bins - 1)
+    histograms = np.bincount(
+        topic_id.astype(np.int64) * bins + bin_index, minlength=n_topics * bins
+    ).reshape(n_topics, bins)
+
+    # Sort by topic, then percentage, so each topic is a sorted run. One
+    # argsort of a combined float key is several times faster than lexsort;
+    # it orders any two percentages more than ~1e-7 apart correctly, which
+    # covers every pair of score/total ratios with totals below 10,000.
+    if len(percentage):
+        low = percentage.min()
+        span = percentage.max() - low + 1
+        ordered = percentage[np.argsort(topic_id * span + (percentage - low))]
+    else:
+        ordered = percentage
+    starts = np.cumsum(attempts) - attempts
+    present = attempts > 0
+    medians = np.zeros(n_topics)
+    p90s = np.zeros(n_topics)
+    medians[present] = _quantiles(ordered, starts[present], attempts[present], 0.5)
+    p90s[present] = _quantiles(ordered, starts[present], attempts[present], 0.9)
+
+    statistics = {}
+    index = {topic: i for i, topic in enumerate(arrays.topics)}
+    for topic in arrays.topics if topics is None else topics:
+        i = index.get(topic)
+        if i is None or not attempts[i]:
+            statistics[topic] = {
+                "users": 0,
+                "attempts": 0,
+                "mean": None,
+                "median": None,
+                "p90": None,
+                "pass_rate": None,
+                "histogram": [0] * bins,
+            }
+            continue
+        count = int(attempts[i])
+        statistics[topic] = {
+            "users": int(users[i]),
+            "attempts": count,
+            "mean": float(sums[i] / count),
+            "median": float(medians[i]),
+            "p90": float(p90s[i]),
+            "pass_rate": float(passed[i] / count),
+            "histogram": histograms[i].tolist(),
+        }
+    return statistics
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsample a series sorted by x to threshold points with
+    Largest-Triangle-Three-Buckets. The first and last points are kept; of
+    each of the threshold - 2 buckets in between, the point forming the
+    largest triangle with the point kept before it and the mean of the next
+    bucket, which preserves peaks and dips that averaging would flatten."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    kept = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        after = slice(end, edges[i + 2]) if i < threshold - 3 else slice(n - 1, n)
+        mean_x, mean_y = x[after].mean(), y[after].mean()
+        area = np.abs(
+            (x[kept] - mean_x) * (y[start:end] - y[kept])
+            - (x[kept] - x[start:end]) * (mean_y - y[kept])
+        )
+        kept = start + int(np.argmax(area))
+        keep[i + 1] = kept
+    return x[keep], y[keep]
@@ -0,0 +1,118 @@
+import os
+import json
+import time
+from typing import List, Optional, Tuple
+from records import ScoreRecord, format_timestamp, parse_timestamp
+
+
+class ScoreJournal:
+    """Append-only JSONL log of quiz attempts that sits next to scores.json.
+
+    Each line is one attempt: username, topic, timestamp, score and total.
+    Appends are flushed immediately and fsynced in batches; a torn last line
+    (e.g. after a crash) is ignored until it is completed.
+    """
+
+    def __init__(self, path: str, fsync_batch: int = 16, fsync_interval: float = 1.0):
+        self.path = path
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            if self._file.tell() > 0:
+                with open(self.path, "rb") as file:
+                    file.seek(-1, os.SEEK_END)
+                    torn = file.read(1) != b"\n"
+                if torn:
+                    # Terminate a half-written record so it does not swallow
+                    # the next append.
+                    self._file.write("\n")
+        return self._file
+
+    def append(self, username: str, topic: str, score: ScoreRecord) -> None:
+        record = {
+            "username": username,
+            "topic": topic,
+            "timestamp": format_timestamp(score.timestamp),
+            "score": score.score,
+            "total": score.total,
+        }
+        file = self._open()
+        file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        file.flush()
+        self._unsynced += 1
+        if (
+            self._unsynced >= self.fsync_batch
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def signature(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_size)
+
+    def read_from(
+        self, offset: int = 0
+    ) -> Tuple[List[Tuple[str, str, ScoreRecord]], int]:
+        """Return the complete records after byte offset and the offset just past
+        the last complete line."""
+        records = []
+        try:
+            with open(self.path, "rb") as file:
+                file.seek(offset)
+                data = file.read()
+        except FileNotFoundError:
+            return records, 0
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                raw = json.loads(line)
+                records.append(
+                    (
+                        raw["username"],
+                        raw["topic"],
+                        ScoreRecord(
+                            parse_timestamp(raw["timestamp"]),
+                            int(raw["score"]),
+                            int(raw["total"]),
+                        ),
+                    )
+                )
+            except (ValueError, KeyError, TypeError):
+                # A corrupt line cannot be replayed; skip it rather than
+                # losing every attempt recorded after it.
+                continue
+        return records, offset + end
+
+    def truncate(self) -> None:
+        if self._file is not None:
+            self.sync()
+        if os.path.exists(self.path):
+            with open(self.path, "r+b") as file:
+                file.truncate(0)
+                file.flush()
+                os.fsync(file.fileno())
@@ -0,0 +1,225 @@
+import os
+import json
+import mmap
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
+import numpy as np
+from score_analytics import ScoreArrays
+
+# One append-only file per column, named <column>.bin, holding little-endian
+# values of a fixed width. Row i of the store is element i of every column.
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "<i8"),
+    ("user_id", "<u4"),
+    ("topic_id", "<u2"),
+    ("score", "<u2"),
+    ("total", "<u2"),
+)
+SMALL_INT_MAX = np.iinfo(np.uint16).max
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(timestamp: datetime) -> int:
+    """Seconds since the epoch of a naive timestamp, read as UTC like
+    records.timestamp_micros does."""
+    return int((timestamp.replace(tzinfo=None) - EPOCH).total_seconds())
+
+
+def to_iso(seconds: np.ndarray) -> List[str]:
+    """ISO 8601 strings (to the second) for epoch seconds."""
+    return seconds.astype("datetime64[s]").astype(str).tolist()
+
+
+class NameTable:
+    """Names interned as ids 0, 1, 2, ... and stored one JSON string per line.
+    Lines are only ever appended, so another process's additions are read
+    from where the previous read stopped."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self._offset = 0
+
+    def refresh(self) -> None:
+        try:
+            with open(self.path, "rb") as file:
+                file.seek(self._offset)
+                data = file.read()
+        except FileNotFoundError:
+            return
+        # A line without its newline is still being written.
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            name = json.loads(line)
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+        self._offset += end
+
+    def add(self, names: List[str]) -> None:
+        """Append names not yet in the table. Callers hold the store lock and
+        have refreshed the table."""
+        new = [name for name in dict.fromkeys(names) if name not in self.ids]
+        if not new:
+            return
+        data = "".join(json.dumps(name) + "\n" for name in new).encode("utf-8")
+        with open(self.path, "ab") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        for name in new:
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+        self._offset += len(data)
+
+
+class ScoreStore:
+    """Columnar, append-only score store under one directory.
+
+    Attempts are fixed-width rows split across COLUMNS: epoch-second
+    timestamp, interned user and topic ids (users.jsonl, topics.jsonl) and
+    16-bit score and total. append() only buffers; flush() writes the
+    buffer (at least every buffer_rows rows) and sync() also fsyncs.
+    columns() returns read-only NumPy views over mmaps of the column files,
+    so reading millions of attempts copies nothing.
+
+    Writers from several processes are kept apart by lock, a context manager
+    factory; ids are assigned under it at flush time. The row count is that
+    of the shortest column, so a crash mid-flush loses at most the rows of
+    that flush, and the next flush trims the longer columns back.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        buffer_rows: int = 1024,
+        fsync_batch: int = 16,
+        fsync_interval: float = 1.0,
+        lock: Optional[Callable[[], ContextManager]] = None,
+    ):
+        self.directory = directory
+        self.buffer_rows = buffer_rows
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self.lock = lock or nullcontext
+        self.users = NameTable(os.path.join(directory, "users.jsonl"))
+        self.topics = NameTable(os.path.join(directory, "topics.jsonl"))
+        self._buffer: List[Tuple[str, str, int, int, int]] = []
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        # column -> (size the mmap was made at, mmap or None)
+        self._maps: Dict[str, Tuple[int, Optional[mmap.mmap]]] = {}
+
+    def column_path(self, column: str) -> str:
+        return os.path.join(self.directory, f"{column}.bin")
+
+    def append(
+        self, username: str, topic: str, timestamp: int, score: int, total: int
+    ) -> None:
+        if not (0 <= score <= SMALL_INT_MAX and 0 <= total <= SMALL_INT_MAX):
+            raise ValueError(f"Score {score}/{total} does not fit the score store")
+        self._buffer.append((username, topic, timestamp, score, total))
+        if len(self._buffer) >= self.buffer_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+        try:
+            self._write(rows)
+        except BaseException:
+            # Keep the rows for the next attempt.
+            self._buffer[:0] = rows
+            raise
+        self._unsynced += len(rows)
+        if (
+            self._unsynced >= self.fsync_batch
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.sync()
+
+    def _write(self, rows: List[Tuple[str, str, int, int, int]]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with self.lock():
+            self.users.refresh()
+            self.topics.refresh()
+            self.users.add([row[0] for row in rows])
+            self.topics.add([row[1] for row in rows])
+            if len(self.topics.names) > SMALL_INT_MAX + 1:
+                raise ValueError("Too many topics for the score store")
+            values = {
+                "timestamp": [row[2] for row in rows],
+                "user_id": [self.users.ids[row[0]] for row in rows],
+                "topic_id": [self.topics.ids[row[1]] for row in rows],
+                "score": [row[3] for row in rows],
+                "total": [row[4] for row in rows],
+            }
+            count = self._stored_rows()
+            for column, dtype in COLUMNS:
+                with open(self.column_path(column), "r+b" if count else "wb") as file:
+                    # Drop a torn tail left by a crash in an earlier flush.
+                    file.truncate(count * np.dtype(dtype).itemsize)
+                    file.seek(0, os.SEEK_END)
+                    file.write(np.asarray(values[column], dtype=dtype).tobytes())
+
+    def sync(self) -> None:
+        self.flush()
+        if not self._unsynced:
+            return
+        for column, _ in COLUMNS:
+            path = self.column_path(column)
+            if os.path.exists(path):
+                with open(path, "rb+") as file:
+                    os.fsync(file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        self.sync()
+        self._maps.clear()
+
+    def _stored_rows(self) -> int:
+        counts = []
+        for column, dtype in COLUMNS:
+            try:
+                size = os.path.getsize(self.column_path(column))
+            except OSError:
+                return 0
+            counts.append(size // np.dtype(dtype).itemsize)
+        return min(counts)
+
+    def _view(self, column: str, dtype: str, count: int) -> np.ndarray:
+        size = os.path.getsize(self.column_path(column))
+        mapped_size, mapped = self._maps.get(column, (None, None))
+        if mapped_size != size:
+            mapped = None
+            if size:
+                with open(self.column_path(column), "rb") as file:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            # The old map stays alive as long as views of it do.
+            self._maps[column] = (size, mapped)
+        if mapped is None:
+            return np.empty(0, dtype=dtype)
+        return np.frombuffer(mapped, dtype=dtype, count=count)
+
+    def columns(self) -> ScoreArrays:
+        """Every stored attempt as zero-copy column views. Buffered rows are
+        flushed first."""
+        self.flush()
+        self.users.refresh()
+        self.topics.refresh()
+        count = self._stored_rows()
+        views = {
+            column: (
+                self._view(column, dtype, count) if count else np.empty(0, dtype=dtype)
+            )
+            for column, dtype in COLUMNS
+        }
+        return ScoreArrays(
+            users=list(self.users.names),
+            topics=list(self.topics.names),
+            **views,
+        )
@@ -0,0 +1,249 @@
+import os
+import hashlib
+from typing import Dict, Iterator, List, Optional, Tuple
+from data_manager import DataManager, type_adapter
+from leaderboard_index import LeaderboardIndex
+from records import ScoreRecord, UserScores
+from schemas import Result, ScoreShards
+
+SHARD_METRIC_FILE = "scores.shard"
+
+
+class ShardedDataManager(DataManager):
+    """DataManager that keeps each user's attempts in a file of their own.
+
+    result/shards/index.json lists every user who has taken a quiz, in the
+    order they first did, with the path of their shard:
+    result/shards/<bucket>/<username>.<digest>.json, where the bucket is the
+    first byte of a hash of the username. Saving a score or reading one
+    user's history touches only that user's shard and costs O(their
+    history). Users, questions and config stay in the JSON tree.
+
+    Leaderboards come from a LeaderboardIndex built by streaming the shards
+    once. Later calls re-read only the shards in buckets whose directory
+    changed on disk, so writes by other processes are picked up without
+    rescanning everyone. Analytics arrays are rebuilt from the shards when
+    any bucket changed.
+    """
+
+    def __init__(self, shards_dir: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        # Shard writes are already small; there is no journal to fold in.
+        self.journal_scores = False
+        self.shards_dir = shards_dir or os.path.join(os.path.curdir, "result", "shards")
+        self.shard_index_path = os.path.join(self.shards_dir, "index.json")
+        # Directory signature per bucket and file signature per user's shard
+        # as of the last time they were folded into the leaderboard index.
+        self._bucket_signatures: Dict[str, Optional[tuple]] = {}
+        self._shard_signatures: Dict[str, Optional[tuple]] = {}
+
+    @staticmethod
+    def shard_name(username: str) -> str:
+        """Path of a user's shard relative to shards_dir, "/"-separated. The
+        digest keeps names distinct on case-insensitive file systems."""
+        digest = hashlib.blake2b(username.encode(), digest_size=8).hexdigest()
+        return f"{digest[:2]}/{username}.{digest[2:10]}.json"
+
+    def _shard_path(self, name: str) -> str:
+        return os.path.join(self.shards_dir, *name.split("/"))
+
+    def _metric_file(self, file_path: str) -> str:
+        # Every shard is recorded under one name, so the number of metric
+        # series does not grow with the number of users.
+        if os.path.dirname(os.path.dirname(file_path)) == self.shards_dir:
+            return SHARD_METRIC_FILE
+        return file_path
+
+    def _load_shard_index(self) -> Optional[ScoreShards]:
+        return self._load_model(self.shard_index_path, ScoreShards)
+
+    def _read_shard(self, path: str) -> UserScores:
+        """Validate a shard without putting it in the model cache, so a full
+        scan does not evict everything else. A missing shard is empty."""
+        try:
+            with self._phase(path, "read"), open(path, "rb") as file:
+                raw = file.read()
+        except FileNotFoundError:
+            return UserScores()
+        self._add_bytes(path, "read", len(raw))
+        return type_adapter(UserScores).validate_json(raw)
+
+    def _iter_shards(self, shards: ScoreShards) -> Iterator[Tuple[str, UserScores]]:
+        for username, name in shards.root.items():
+            yield username, self._read_shard(self._shard_path(name))
+
+    def _register(self, username: str, name: str) -> bool:
+        shards = self._load_shard_index()
+        if shards is None:
+            return False
+        if username in shards.root:
+            return True
+        with self._locked(self.shard_index_path):
+            # Another process may have added users since the check above.
+            shards = self._load_shard_index()
+            if shards is None:
+                return False
+            if username in shards.root:
+                return True
+            shards.root[username] = name
+            return self.save_json_file(self.shard_index_path, model=shards)
+
+    def save_score(self, username: str, topic: str, score: int, total: int) -> bool:
+        new_score = ScoreRecord.now(score, total)
+        name = self.shard_name(username)
+        path = self._shard_path(name)
+        try:
+            # Listed before the shard exists: a crash in between leaves a user
+            # with no attempts rather than attempts no scan can find.
+            if not self._register(username, name):
+                return False
+            with self._locked(path):
+                user = (
+                    self._load_model(path, UserScores) if os.path.exists(path) else None
+                )
+                if user is None:
+                    user = UserScores()
+                user.setdefault(topic, []).append(new_score)
+                if not self.save_json_file(path, model=user):
+                    return False
+                # The shard's signature is left alone: attempts other
+                # processes added since the last refresh are in it too.
+                if self._leaderboard is not None:
+                    self._leaderboard.record(username, topic, new_score)
+            return True
+        except Exception as e:
+            self.show_error(f"Error saving score: {str(e)}")
+            return False
+
+    def compact_scores(self) -> bool:
+        return True
+
+    def _leaderboard_index(self) -> LeaderboardIndex:
+        shards = self._load_shard_index()
+        if shards is None:
+            raise ValueError(f"Could not load {self.shard_index_path}")
+        changed = set()
+        for name in set(name.split("/")[0] for name in shards.root.values()):
+            signature = self._file_signature(os.path.join(self.shards_dir, name))
+            if signature != self._bucket_signatures.get(name):
+                # Stored before the shards are read, so a write that lands
+                # during the scan is seen again next time.
+                self._bucket_signatures[name] = signature
+                changed.add(name)
+
+        def changed_shards():
+            for username, name in shards.root.items():
+                if name.split("/")[0] not in changed:
+                    continue
+                path = self._shard_path(name)
+                signature = self._file_signature(path)
+                if signature is None or signature == self._shard_signatures.get(
+                    username
+                ):
+                    continue
+                self._shard_signatures[username] = signature
+                yield username, self._read_shard(path)
+
+        if self._leaderboard is None:
+            self._leaderboard = LeaderboardIndex.from_users(changed_shards())
+        else:
+            # Attempts are never removed, and recording one that is already
+            # counted changes nothing, so a changed shard is replayed whole.
+            for username, user in changed_shards():
+                for topic, scores in user.items():
+                    for score in scores:
+                        self._leaderboard.record(username, topic, score)
+        return self._leaderboard
+
+    def load_result(self) -> Optional[Result]:
+        """Every user's scores in one model. This reads every shard; prefer
+        get_user_scores and the leaderboard methods."""
+        try:
+            shards = self._load_shard_index()
+            if shards is None:
+                return None
+            return Result.model_construct(
+                root={
+                    username: user.to_model()
+                    for username, user in self._iter_shards(shards)
+                }
+            )
+        except Exception as e:
+            self.show_error(f"Invalid scores data format: {str(e)}")
+            return None
+
+    def score_arrays(self):
+        """Every attempt as NumPy columns, rebuilt from the shards when the
+        index or any bucket directory changed."""
+        from score_analytics import ScoreArrays
+
+        shards = self._load_shard_index()
+        if shards is None:
+            raise ValueError(f"Could not load {self.shard_index_path}")
+        source = (
+            self._file_signature(self.shard_index_path),
+            tuple(
+                self._file_signature(os.path.join(self.shards_dir, bucket))
+                for bucket in sorted(set(n.split("/")[0] for n in shards.root.values()))
+            ),
+        )
+        if self._score_arrays is None or self._score_arrays_source != source:
+            self._score_arrays = ScoreArrays.from_users(self._iter_shards(shards))
+            self._score_arrays_source = source
+        return self._score_arrays
+
+    def get_user_scores(self, username: str) -> Dict[str, List[ScoreRecord]]:
+        try:
+            path = self._shard_path(self.shard_name(username))
+            if not os.path.exists(path):
+                return {}
+            user = self._load_model(path, UserScores)
+            # Fresh lists, so callers can sort them without touching the cache.
+            return user.clone() if user else {}
+        except Exception as e:
+            self.show_error(f"Error retrieving scores for {username}: {str(e)}")
+            return {}
+
+
+def migrate_to_shards(source: DataManager, target: ShardedDataManager) -> Dict:
+    """Split the source's scores (scores.json plus any journal) into one
+    shard per user. Refuses to run if target already has shards."""
+    shards = target._load_shard_index()
+    if shards is None:
+        raise ValueError(f"Could not load {target.shard_index_path}")
+    if shards.root:
+        raise ValueError(f"{target.shard_index_path} already lists users")
+    result = source.load_result()
+    if result is None:
+        raise ValueError("Source scores could not be loaded")
+    counts = {"users": 0, "scores": 0}
+    for username, user in result.root.items():
+        name = target.shard_name(username)
+        if not target.save_json_file(target._shard_path(name), model=user):
+            raise ValueError(f"Could not write the shard of '{username}'")
+        shards.root[username] = name
+        counts["users"] += 1
+        counts["scores"] += sum(len(scores) for scores in user.root.values())
+    # The index goes last: until it is written no shard is visible.
+    if not target.save_json_file(target.shard_index_path, model=shards):
+        raise ValueError(f"Could not write {target.shard_index_path}")
+    return counts
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Split result/scores.json (and the score journal) into "
+        "per-user shards."
+    )
+    parser.add_argument(
+        "--shards-dir", default=os.path.join(os.path.curdir, "result", "shards")
+    )
+    args = parser.parse_args()
+    print(
+        migrate_to_shards(
+            DataManager(journal_scores=True),
+            ShardedDataManager(shards_dir=args.shards_dir),
+        )
+    )
@@ -0,0 +1,579 @@
+import os
+import json
+import random
+import sqlite3
+import uuid
+from typing import Optional, List, Dict
+from datetime import datetime
+from data_manager import DataManager, type_adapter
+from question_index import sample_positions
+from records import QuestionRecord, QuestionTable, ScoreRecord, parse_timestamp
+from schemas import (
+    Quiz,
+    Question,
+    Result,
+    User,
+    Score,
+    Users,
+    UserCredentials,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    role TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS questions (
+    topic TEXT NOT NULL,
+    id TEXT NOT NULL,
+    question TEXT NOT NULL,
+    options TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    PRIMARY KEY (topic, id)
+);
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_user_topic_time
+    ON scores (username, topic, timestamp);
+CREATE INDEX IF NOT EXISTS idx_scores_topic_user
+    ON scores (topic, username);
+"""
+
+# Best attempt per user for one topic, with its 0-based place on the
+# leaderboard. Ties on ratio go to the earliest attempt and ties on percentage
+# to the user who first appeared in the scores table, matching the order the
+# JSON backend produces.
+_TOPIC_BEST = """
+WITH ranked AS (
+    SELECT username, score, total,
+           ROW_NUMBER() OVER (
+               PARTITION BY username
+               ORDER BY CASE WHEN total > 0 THEN CAST(score AS REAL) / total
+                             ELSE 0 END DESC, id
+           ) AS rn
+    FROM scores WHERE topic = ?
+),
+first_seen AS (
+    SELECT username, MIN(id) AS first_id FROM scores GROUP BY username
+),
+best AS (
+    SELECT r.username, r.score, r.total,
+           ROW_NUMBER() OVER (
+               ORDER BY CASE WHEN r.total > 0
+                             THEN CAST(r.score AS REAL) / r.total * 100
+                             ELSE 0 END DESC, f.first_id
+           ) - 1 AS position
+    FROM ranked r JOIN first_seen f ON f.username = r.username
+    WHERE r.rn = 1
+)
+"""
+LEADERBOARD_SQL = (
+    _TOPIC_BEST
+    + "SELECT username, score, total FROM best ORDER BY position LIMIT ? OFFSET ?"
+)
+LEADERBOARD_RANK_SQL = _TOPIC_BEST + "SELECT position FROM best WHERE username = ?"
+
+# Per user: sum of the best attempt's score and total over every topic.
+_OVERALL_BEST = """
+WITH ranked AS (
+    SELECT username, score, total,
+           ROW_NUMBER() OVER (
+               PARTITION BY username, topic
+               ORDER BY CASE WHEN total > 0 THEN CAST(score AS REAL) / total
+                             ELSE 0 END DESC, id
+           ) AS rn
+    FROM scores
+),
+first_seen AS (
+    SELECT username, MIN(id) AS first_id FROM scores GROUP BY username
+),
+best AS (
+    SELECT r.username, SUM(r.score) AS best_score,
+           SUM(r.total) AS total_questions,
+           ROW_NUMBER() OVER (
+               ORDER BY CAST(SUM(r.score) AS REAL) / SUM(r.total) * 100 DESC,
+                        MIN(f.first_id)
+           ) - 1 AS position
+    FROM ranked r JOIN first_seen f ON f.username = r.username
+    WHERE r.rn = 1
+    GROUP BY r.username
+    HAVING SUM(r.total) > 0
+)
+"""
+OVERALL_LEADERBOARD_SQL = (
+    _OVERALL_BEST + "SELECT username, best_score, total_questions FROM best"
+    " ORDER BY position LIMIT ? OFFSET ?"
+)
+OVERALL_LEADERBOARD_RANK_SQL = (
+    _OVERALL_BEST + "SELECT position FROM best WHERE username = ?"
+)
+
+
+class SQLiteDataManager(DataManager):
+    """DataManager backed by an SQLite database instead of the JSON tree.
+
+    Users, questions and scores live in indexed tables; config.json stays the
+    editable source for topics and limits. Public methods keep the signatures
+    and return values of DataManager.
+    """
+
+    # One connection is shared by every call, so background I/O must not
+    # interleave transactions (see AsyncDataManager).
+    serial_io = True
+
+    def __init__(self, db_path: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.db_path = db_path or os.path.join(os.path.curdir, "quiz.db")
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _question_table(self, topic: str) -> QuestionTable:
+        rows = self.conn.execute(
+            "SELECT id, question, options, answer FROM questions"
+            " WHERE topic = ? ORDER BY rowid",
+            (topic,),
+        ).fetchall()
+        return type_adapter(QuestionTable).validate_python(
+            {
+                qid: {
+                    "question": question,
+                    "options": json.loads(options),
+                    "answer": answer,
+                }
+                for qid, question, options, answer in rows
+            }
+        )
+
+    def load_questions(
+        self, topic: str, count: Optional[int] = None, seed: Optional[int] = None
+    ) -> Optional[List[QuestionRecord]]:
+        """As DataManager.load_questions: the sample is drawn from the topic's
+        rowids, and only the drawn rows are fetched and validated."""
+        try:
+            rowids = [
+                rowid
+                for (rowid,) in self.conn.execute(
+                    "SELECT rowid FROM questions WHERE topic = ? ORDER BY rowid",
+                    (topic,),
+                )
+            ]
+            chosen = [
+                rowids[i]
+                for i in sample_positions(len(rowids), count, random.Random(seed))
+            ]
+            rows = {
+                rowid: (question, options, answer)
+                for rowid, question, options, answer in self.conn.execute(
+                    "SELECT rowid, question, options, answer FROM questions"
+                    " WHERE rowid IN (SELECT value FROM json_each(?))",
+                    (json.dumps(chosen),),
+                )
+            }
+            adapter = type_adapter(QuestionRecord)
+            return [
+                adapter.validate_python(
+                    {
+                        "question": rows[rowid][0],
+                        "options": json.loads(rows[rowid][1]),
+                        "answer": rows[rowid][2],
+                    }
+                )
+                for rowid in chosen
+            ]
+        except Exception as e:
+            self.show_error(f"Error processing questions for {topic}: {str(e)}")
+            return None
+
+    def load_quiz(self, topic: str) -> Optional[Quiz]:
+        try:
+            return self._question_table(topic).to_model()
+        except Exception as e:
+            self.show_error(f"Error processing questions for {topic}: {str(e)}")
+            return None
+
+    def _question_count(self, topic: str) -> Optional[int]:
+        try:
+            (count,) = self.conn.execute(
+                "SELECT COUNT(*) FROM questions WHERE topic = ?", (topic,)
+            ).fetchone()
+            return count
+        except Exception as e:
+            self.show_error(f"Error processing questions for {topic}: {str(e)}")
+            return None
+
+    def save_question(self, topic: str, question: Question) -> Optional[str]:
+        try:
+            config = self.load_config()
+            question_id = str(uuid.uuid4())
+            with self.conn:
+                # Count and insert in one write transaction, so another
+                # connection cannot fill the topic in between.
+                self.conn.execute("BEGIN IMMEDIATE")
+                (count,) = self.conn.execute(
+                    "SELECT COUNT(*) FROM questions WHERE topic = ?", (topic,)
+                ).fetchone()
+                if config and count >= config.questionsPerTopic:
+                    self.show_error(
+                        f"Topic '{topic}' has reached the limit of {config.questionsPerTopic} questions",
+                    )
+                    return None
+                self.conn.execute(
+                    "INSERT INTO questions (topic, id, question, options, answer)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        topic,
+                        question_id,
+                        question.question,
+                        json.dumps(question.options),
+                        question.answer,
+                    ),
+                )
+            return question_id
+        except Exception as e:
+            self.show_error(f"Error saving question: {str(e)}")
+            return None
+
+    def save_questions(
+        self, topic: str, questions: List[Question]
+    ) -> Optional[List[str]]:
+        try:
+            config = self.load_config()
+            question_ids = [str(uuid.uuid4()) for _ in questions]
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                (count,) = self.conn.execute(
+                    "SELECT COUNT(*) FROM questions WHERE topic = ?", (topic,)
+                ).fetchone()
+                if config and count + len(questions) > config.questionsPerTopic:
+                    self.show_error(
+                        f"Topic '{topic}' has room for {max(0, config.questionsPerTopic - count)} more questions",
+                    )
+                    return None
+                self.conn.executemany(
+                    "INSERT INTO questions (topic, id, question, options, answer)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            topic,
+                            question_id,
+                            question.question,
+                            json.dumps(question.options),
+                            question.answer,
+                        )
+                        for question_id, question in zip(question_ids, questions)
+                    ],
+                )
+            return question_ids
+        except Exception as e:
+            self.show_error(f"Error saving questions: {str(e)}")
+            return None
+
+    def delete_question(self, topic: str, question_id: str) -> bool:
+        try:
+            with self.conn:
+                cursor = self.conn.execute(
+                    "DELETE FROM questions WHERE topic = ? AND id = ?",
+                    (topic, question_id),
+                )
+            if cursor.rowcount == 0:
+                self.show_error(f"Question ID '{question_id}' not found")
+                return False
+            return True
+        except Exception as e:
+            self.show_error(f"Error deleting question: {str(e)}")
+            return False
+
+    def delete_questions(self, topic: str, question_ids: List[str]) -> bool:
+        try:
+            existing = {
+                qid
+                for (qid,) in self.conn.execute(
+                    "SELECT id FROM questions WHERE topic = ?", (topic,)
+                )
+            }
+            missing = [qid for qid in question_ids if qid not in existing]
+            if missing:
+                self.show_error(f"Question ID '{missing[0]}' not found")
+                return False
+            with self.conn:
+                self.conn.executemany(
+                    "DELETE FROM questions WHERE topic = ? AND id = ?",
+                    [(topic, qid) for qid in set(question_ids)],
+                )
+            return True
+        except Exception as e:
+            self.show_error(f"Error deleting questions: {str(e)}")
+            return False
+
+    def load_users(self) -> Optional[Users]:
+        try:
+            rows = self.conn.execute(
+                "SELECT username, password, role FROM users ORDER BY rowid"
+            ).fetchall()
+            return Users.model_validate(
+                {
+                    username: {"username": username, "password": password, "role": role}
+                    for username, password, role in rows
+                }
+            )
+        except Exception as e:
+            self.show_error(f"Invalid users data format: {str(e)}")
+            return None
+
+    def save_user(self, user: UserCredentials) -> bool:
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+                    (user.username, user.password, user.role),
+                )
+            return True
+        except sqlite3.IntegrityError:
+            self.show_error("Username already exists")
+            return False
+        except Exception as e:
+            self.show_error(f"Error saving user: {str(e)}")
+            return False
+
+    def update_user(self, user: UserCredentials) -> bool:
+        try:
+            with self.conn:
+                cursor = self.conn.execute(
+                    "UPDATE users SET password = ?, role = ? WHERE username = ?",
+                    (user.password, user.role, user.username),
+                )
+            if cursor.rowcount == 0:
+                self.show_error(f"User '{user.username}' not found")
+                return False
+            return True
+        except Exception as e:
+            self.show_error(f"Error saving user: {str(e)}")
+            return False
+
+    def load_result(self) -> Optional[Result]:
+        try:
+            result = Result(root={})
+            for username, topic, timestamp, score, total in self.conn.execute(
+                "SELECT username, topic, timestamp, score, total FROM scores ORDER BY id"
+            ):
+                user = result.root.setdefault(username, User(root={}))
+                user.root.setdefault(topic, []).append(
+                    Score(timestamp=timestamp, score=score, total=total)
+                )
+            return result
+        except Exception as e:
+            self.show_error(f"Invalid scores data format: {str(e)}")
+            return None
+
+    def compact_scores(self) -> bool:
+        return True
+
+    def save_score(self, username: str, topic: str, score: int, total: int) -> bool:
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO scores (username, topic, timestamp, score, total)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (username, topic, datetime.now().isoformat(), score, total),
+                )
+            return True
+        except Exception as e:
+            self.show_error(f"Error saving score: {str(e)}")
+            return False
+
+    def get_leaderboard(
+        self, topic: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict]:
+        try:
+            return [
+                {
+                    "username": username,
+                    "score": score,
+                    "total": total,
+                    "percentage": (score / total * 100) if total > 0 else 0,
+                }
+                for username, score, total in self.conn.execute(
+                    LEADERBOARD_SQL, (topic, -1 if limit is None else limit, offset)
+                )
+            ]
+        except Exception as e:
+            self.show_error(f"Error processing leaderboard: {str(e)}")
+            return []
+
+    def get_overall_leaderboard(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict]:
+        try:
+            return [
+                {
+                    "username": username,
+                    "score": f"{best_score}/{total_questions}",
+                    "percentage": best_score / total_questions * 100,
+                }
+                for username, best_score, total_questions in self.conn.execute(
+                    OVERALL_LEADERBOARD_SQL, (-1 if limit is None else limit, offset)
+                )
+            ]
+        except Exception as e:
+            self.show_error(f"Error processing all topics leaderboard: {str(e)}")
+            return []
+
+    def get_leaderboard_count(self, topic: Optional[str]) -> int:
+        try:
+            if topic is None:
+                (count,) = self.conn.execute(
+                    f"SELECT COUNT(*) FROM ({OVERALL_LEADERBOARD_SQL})", (-1, 0)
+                ).fetchone()
+                return count
+            (count,) = self.conn.execute(
+                "SELECT COUNT(DISTINCT username) FROM scores WHERE topic = ?",
+                (topic,),
+            ).fetchone()
+            return count
+        except Exception as e:
+            self.show_error(f"Error processing leaderboard: {str(e)}")
+            return 0
+
+    def get_leaderboard_rank(
+        self, topic: Optional[str], username: str
+    ) -> Optional[int]:
+        try:
+            row = (
+                self.conn.execute(OVERALL_LEADERBOARD_RANK_SQL, (username,))
+                if topic is None
+                else self.conn.execute(LEADERBOARD_RANK_SQL, (topic, username))
+            ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            self.show_error(f"Error processing leaderboard: {str(e)}")
+            return None
+
+    def _score_rows_between(self, after_id: int, last_id: int):
+        """Attempts with after_id < id <= last_id, as ScoreArrays rows."""
+        return [
+            (username, topic, parse_timestamp(timestamp), score, total)
+            for username, topic, timestamp, score, total in self.conn.execute(
+                "SELECT username, topic, timestamp, score, total FROM scores"
+                " WHERE id > ? AND id <= ? ORDER BY id",
+                (after_id, last_id),
+            )
+        ]
+
+    def score_arrays(self):
+        from score_analytics import ScoreArrays
+
+        # Scores are only ever inserted, so the last id and the row count
+        # identify the table's contents, and new attempts are the rows past
+        # the last id already loaded. Anything else, e.g. rows deleted by
+        # hand, rebuilds the arrays.
+        source = self.conn.execute("SELECT MAX(id), COUNT(*) FROM scores").fetchone()
+        last_id = source[0] or 0
+        if self._score_arrays is not None and self._score_arrays_source != source:
+            known_id, count = self._score_arrays_source
+            rows = self._score_rows_between(known_id or 0, last_id)
+            if count + len(rows) == source[1]:
+                self._score_arrays = self._score_arrays.extended(rows)
+                self._score_arrays_source = source
+        if self._score_arrays is None or self._score_arrays_source != source:
+            self._score_arrays = ScoreArrays.from_rows(
+                self._score_rows_between(0, last_id)
+            )
+            self._score_arrays_source = source
+        return self._score_arrays
+
+    def get_user_scores(self, username: str) -> Dict[str, List[ScoreRecord]]:
+        try:
+            user_scores = {}
+            for topic, timestamp, score, total in self.conn.execute(
+                "SELECT topic, timestamp, score, total FROM scores"
+                " WHERE username = ? ORDER BY id",
+                (username,),
+            ):
+                user_scores.setdefault(topic, []).append(
+                    ScoreRecord(parse_timestamp(timestamp), score, total)
+                )
+            return user_scores
+        except Exception as e:
+            self.show_error(f"Error retrieving scores for {username}: {str(e)}")
+            return {}
+
+    def score_version(self, username: str) -> int:
+        try:
+            (count,) = self.conn.execute(
+                "SELECT COUNT(*) FROM scores WHERE username = ?", (username,)
+            ).fetchone()
+            return count
+        except Exception as e:
+            self.show_error(f"Error retrieving scores for {username}: {str(e)}")
+            return 0
+
+
+def migrate_from_json(source: DataManager, target: SQLiteDataManager) -> Dict:
+    """Copy users, questions and scores from the JSON tree into target in a
+    single transaction. Refuses to run against a database that has data."""
+    conn = target.conn
+    for table in ("users", "questions", "scores"):
+        (count,) = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+        if count:
+            raise ValueError(f"Target database already has rows in '{table}'")
+    config = source.load_config()
+    users = source.load_users()
+    result = source.load_result()
+    if config is None or users is None or result is None:
+        raise ValueError("Source JSON data could not be loaded")
+    counts = {"users": 0, "questions": 0, "scores": 0}
+    with conn:
+        for user in users.root.values():
+            conn.execute(
+                "INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+                (user.username, user.password, user.role),
+            )
+            counts["users"] += 1
+        for topic in config.topics:
+            quiz = source.load_quiz(topic)
+            if quiz is None:
+                raise ValueError(f"Questions for '{topic}' could not be loaded")
+            for qid, question in quiz.root.items():
+                conn.execute(
+                    "INSERT INTO questions (topic, id, question, options, answer)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        topic,
+                        qid,
+                        question.question,
+                        json.dumps(question.options),
+                        question.answer,
+                    ),
+                )
+                counts["questions"] += 1
+        for username, user_data in result.root.items():
+            for topic, scores in user_data.root.items():
+                conn.executemany(
+                    "INSERT INTO scores (username, topic, timestamp, score, total)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    [(username, topic, s.timestamp, s.score, s.total) for s in scores],
+                )
+                counts["scores"] += len(scores)
+    return counts
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Migrate the JSON data tree into an SQLite database."
+    )
+    parser.add_argument("--db", default=os.path.join(os.path.curdir, "quiz.db"))
+    args = parser.parse_args()
+    print(migrate_from_json(DataManager(), SQLiteDataManager(args.db)))
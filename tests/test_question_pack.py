@@ -0,0 +1,37 @@
+import json
+import os
+import pytest
+from data_manager import DataManager
+from schemas import Question
+
+
+def question(text: str) -> Question:
+    return Question(question=text, options={"1": "yes", "2": "no"}, answer="1")
+
+
+@pytest.fixture
+def data_manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("config")
+    os.makedirs("data")
+    with open(os.path.join("config", "config.json"), "w") as file:
+        json.dump({"topics": ["art", "sports"], "questionsPerTopic": 10}, file)
+    errors = []
+    monkeypatch.setattr(DataManager, "show_error", lambda self, m: errors.append(m))
+    manager = DataManager(use_question_pack=True)
+    assert manager.save_questions("art", [question(f"art {i}") for i in range(3)])
+    assert manager.save_questions("sports", [question("sports 0")])
+    yield manager
+    assert errors == []
+
+
+def test_quiz_survives_pack_rebuild_for_another_topic(data_manager):
+    running = data_manager.load_questions("art")
+    first = running[0]
+
+    # Editing another topic makes the pack stale; the next load rebuilds it.
+    assert data_manager.save_question("sports", question("sports 1"))
+    assert len(data_manager.load_questions("sports")) == 2
+
+    assert running[0] == first
+    assert sorted(q.question for q in running) == ["art 0", "art 1", "art 2"]